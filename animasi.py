@@ -0,0 +1,186 @@
+import io
+import math
+import time
+
+import diagnostik
+import geometri
+import profil_render
+import render_cache
+
+# Animasi sapuan θ dari 0 sampai 360° untuk juring, busur, tembereng, dan tali
+# busur. Figure dibangun sekali: bagian statis (lingkaran, grid, judul) digambar
+# satu kali lalu disimpan sebagai latar (copy_from_bbox). Setiap frame hanya
+# memulihkan latar dan menggambar ulang artist yang bergerak (blitting):
+# sudut Wedge/Arc, ujung jari-jari dan tali busur, path tembereng, dan label.
+# Besaran yang ditampilkan (luas, panjang) untuk semua frame dihitung dalam
+# satu panggilan vektor ke geometri. Semua frame di-encode menjadi satu GIF
+# animasi dan disimpan di render_cache. GIF dengan satu palet tetap lebih kecil
+# daripada WebP animasi untuk gambar garis berwarna datar seperti ini, dan
+# st.image meneruskannya apa adanya.
+
+JUMLAH_FRAME = 36  # 10° per frame
+DURASI_MS = 120
+WARNA_PALET = 64
+# Animasi berisi banyak frame, jadi resolusinya dibatasi lebih rendah dari
+# diagram statis
+DPI_MAKS = 80
+FIGSIZE = (7, 7)
+
+JUDUL = {
+    'juring': 'Juring Lingkaran',
+    'busur': 'Busur Lingkaran',
+    'tembereng': 'Tembereng Lingkaran',
+    'tali_busur': 'Tali Busur Lingkaran',
+}
+
+
+def nilai_frame(jenis, r, thetas):
+    # Satu pass vektor: label -> array nilai untuk setiap frame
+    if jenis == 'juring':
+        return {'Luas juring': geometri.luas_juring(r, thetas),
+                'Panjang busur': geometri.panjang_busur(r, thetas)}
+    if jenis == 'busur':
+        return {'Panjang busur': geometri.panjang_busur(r, thetas)}
+    if jenis == 'tembereng':
+        return {'Luas tembereng': geometri.luas_tembereng(r, thetas),
+                'Panjang tali busur': geometri.panjang_tali_busur(r, thetas)}
+    return {'Panjang tali busur': geometri.panjang_tali_busur(r, thetas),
+            'Panjang busur': geometri.panjang_busur(r, thetas)}
+
+
+def _siapkan(ax, jenis, r):
+    # Gambar bagian statis dan buat artist yang bergerak (animated=True agar
+    # tidak ikut tergambar di latar). Hasil: (artist, update(θ, x, y, teks))
+    # dengan (x, y) ujung jari-jari di sudut θ
+    from matplotlib.patches import Arc, Circle, PathPatch, Wedge
+
+    from vertex_cache import path_tembereng
+
+    garis_lingkaran = '--' if jenis == 'juring' else '-'
+    ax.add_patch(Circle((0, 0), r, fill=False, color='#1976D2', linewidth=2, linestyle=garis_lingkaran))
+    ax.plot(0, 0, 'ko', markersize=8)
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_title(f'{JUDUL[jenis]} (θ: 0° → 360°)', fontsize=14, fontweight='bold')
+
+    bergerak = []
+    warna_busur = {'juring': 'red', 'busur': '#FF5722', 'tembereng': 'red', 'tali_busur': 'orange'}[jenis]
+    lebar_busur = {'busur': 5, 'tali_busur': 2}.get(jenis, 3)
+    arc = Arc((0, 0), r*2, r*2, theta1=0, theta2=0, color=warna_busur, linewidth=lebar_busur, animated=True)
+    ax.add_patch(arc)
+    bergerak.append(arc)
+
+    wedge = segmen = jari = tali = ujung = None
+    if jenis == 'juring':
+        wedge = Wedge((0, 0), r, 0, 0, facecolor='#FF7043', alpha=0.4, edgecolor='#D84315', linewidth=3,
+                      animated=True)
+        ax.add_patch(wedge)
+        bergerak.insert(0, wedge)
+    if jenis == 'tembereng':
+        segmen = PathPatch(path_tembereng(r, 0), facecolor='#AB47BC', alpha=0.4, edgecolor='#7B1FA2',
+                           linewidth=2, animated=True)
+        ax.add_patch(segmen)
+        bergerak.insert(0, segmen)
+    if jenis in ('juring', 'busur'):
+        ax.plot([0, r], [0, 0], 'b-', linewidth=2.5 if jenis == 'juring' else 2)
+        jari, = ax.plot([0, r], [0, 0], 'b-', linewidth=2.5 if jenis == 'juring' else 2, animated=True)
+        bergerak.append(jari)
+    if jenis in ('tembereng', 'tali_busur'):
+        tali, = ax.plot([r, r], [0, 0], 'g-', linewidth=2.5 if jenis == 'tembereng' else 4, animated=True)
+        bergerak.append(tali)
+    if jenis == 'tali_busur':
+        ax.plot(r, 0, 'go', markersize=10)
+        ujung, = ax.plot(r, 0, 'go', markersize=10, animated=True)
+        bergerak.append(ujung)
+
+    faktor_label = 0.5 if jenis == 'tembereng' else 0.3
+    label = ax.text(0, 0, '', fontsize=11, color='purple', fontweight='bold', ha='center', animated=True)
+    info = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=11, va='top', family='monospace',
+                   bbox=dict(boxstyle='round', facecolor='white', alpha=0.8), animated=True)
+    bergerak += [label, info]
+
+    def update(theta, x, y, teks):
+        arc.theta2 = theta
+        arc.stale = True
+        if wedge is not None:
+            wedge.set_theta2(theta)
+        if segmen is not None:
+            segmen.set_path(path_tembereng(r, theta))
+        if jari is not None:
+            jari.set_data([0, x], [0, y])
+        if tali is not None:
+            tali.set_data([r, x], [0, y])
+        if ujung is not None:
+            ujung.set_data([x], [y])
+        tengah = math.radians(theta) / 2
+        label.set_position((r*faktor_label*math.cos(tengah), r*faktor_label*math.sin(tengah)))
+        label.set_text(f'θ = {theta:g}°')
+        info.set_text(teks)
+
+    return bergerak, update
+
+
+def _encode_gif(frame):
+    # frame: list PIL.Image RGB. Satu palet dari frame tengah (θ = 180°, semua
+    # artist bergerak terlihat) dipakai untuk semua frame agar warna tidak
+    # berkedip; tanpa dithering agar area datar tetap datar dan mudah dikompresi.
+    from PIL import Image
+
+    palet = frame[len(frame) // 2].quantize(colors=WARNA_PALET, method=Image.Quantize.FASTOCTREE)
+    frame = [f.quantize(palette=palet, dither=Image.Dither.NONE) for f in frame]
+    buf = io.BytesIO()
+    frame[0].save(buf, format='GIF', save_all=True, append_images=frame[1:], duration=DURASI_MS,
+                  loop=0, disposal=1)
+    return buf.getvalue()
+
+
+def buat_animasi(jenis, r, dpi, jumlah_frame=JUMLAH_FRAME):
+    import numpy as np
+    from PIL import Image
+
+    from render_pool import buat_canvas
+
+    thetas = np.linspace(0, 360, jumlah_frame + 1)[1:]
+    nilai = nilai_frame(jenis, r, thetas)
+    rad = np.radians(thetas)
+    xs, ys = r * np.cos(rad), r * np.sin(rad)
+
+    mulai = time.perf_counter()
+    # Figure baru (bukan canvas pool render) karena artist animasi tetap hidup
+    # selama semua frame digambar
+    fig, ax = buat_canvas()
+    fig.set_size_inches(FIGSIZE)
+    fig.set_dpi(dpi)
+    fig.subplots_adjust(left=0.06, right=0.97, bottom=0.05, top=0.93)
+    bergerak, update = _siapkan(ax, jenis, r)
+    canvas = fig.canvas
+    canvas.draw()
+    latar = canvas.copy_from_bbox(fig.bbox)
+
+    frame = []
+    for i, theta in enumerate(thetas):
+        teks = '\n'.join(f'{nama:18s} = {v[i]:10.2f}' for nama, v in nilai.items())
+        update(float(theta), xs[i], ys[i], teks)
+        canvas.restore_region(latar)
+        for artist in bergerak:
+            ax.draw_artist(artist)
+        frame.append(Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(),
+                                      'raw', 'RGBA', 0, 1).convert('RGB'))
+    diagnostik.catat('draw', f'animasi_{jenis}', time.perf_counter() - mulai)
+
+    mulai = time.perf_counter()
+    data = _encode_gif(frame)
+    diagnostik.catat('encode', 'animasi_gif', time.perf_counter() - mulai, len(data))
+    return data
+
+
+def render_animasi(jenis, r, profil=None, lebar=1.0):
+    # Kembalikan bytes GIF animasi dari cache jika tersedia. Profil hanya
+    # menentukan dpi (dibatasi DPI_MAKS), jadi kunci cache memakai dpi saja.
+    profil = profil or profil_render.ambil()
+    dpi = min(DPI_MAKS, profil_render.dpi(profil, lebar))
+    r = render_cache.quantize(r)
+    key = render_cache.cache_key(f'animasi_{jenis}', (r, JUMLAH_FRAME), 'gif', dpi)
+    return render_cache.ambil(key, lambda: buat_animasi(jenis, r, dpi))
@@ -0,0 +1,476 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+import diagnostik
+from galat_render import RenderPoolBusy
+import geometri
+
+# Layanan HTTP JSON lokal untuk rumus dan diagram yang sama dengan slide,
+# untuk dipakai alat lain (buku nilai, plugin LMS) tanpa lewat UI Streamlit.
+# Hanya pustaka standar (http.server) + NumPy; pandas dan matplotlib baru
+# diimport saat endpoint yang membutuhkannya pertama kali dipanggil.
+#
+#   GET  /rumus                          daftar rumus dan parameternya
+#   GET  /hitung/<rumus>?r=10&theta=60   satu nilai
+#   POST /hitung/<rumus>  {"r": [...], "theta": 60}   array (broadcasting)
+#   POST /hitung  {"permintaan": [{"rumus": ..., "r": ...}, ...]}   campuran
+#   POST /komponen  {"r": [...], "theta": [...]}   semua komponen (mode massal)
+#   GET  /diagram/<slide>?r=10&theta=60&profil=hemat&fmt=svg
+#   GET  /metrik  (format Prometheus),  GET /sehat
+#
+# - Penggabungan: permintaan skalar dari banyak koneksi bersamaan dikumpulkan
+#   selama JENDELA_MS (atau sampai MAKS_GABUNG) lalu dihitung per rumus dalam
+#   satu panggilan vektor ke geometri.
+# - Batch: array dan daftar permintaan campuran dihitung per rumus sekaligus.
+# - Streaming: hasil lebih dari BATAS_STREAM baris (atau dengan header
+#   Accept: application/x-ndjson) dikirim sebagai NDJSON dengan
+#   Transfer-Encoding: chunked, dihitung per BARIS_PER_CHUNK baris, sehingga
+#   memori respons terbatas dan klien mulai menerima data lebih awal.
+# - Diagram memakai render_cache/cache disk yang sama dengan aplikasi, dengan
+#   ETag dari kunci cache (304 jika tidak berubah).
+# Nilai di luar domain (NaN di geometri) dikirim sebagai null.
+#
+# Contoh:
+#   python api_server.py --port 8600
+#   curl 'localhost:8600/hitung/luas_juring?r=10&theta=60'
+#   python loadtest.py --target api --sesi 50 --jeda 0 --durasi 30
+
+HOST_DEFAULT = os.environ.get('LINGKARAN_API_HOST', '127.0.0.1')
+PORT_DEFAULT = int(os.environ.get('LINGKARAN_API_PORT', 8600))
+JENDELA_MS = float(os.environ.get('LINGKARAN_API_JENDELA_MS', 1.0))
+MAKS_GABUNG = 4096
+BATAS_STREAM = 10000
+BARIS_PER_CHUNK = 16384
+MAKS_BODY = 64 * 1024 * 1024
+DESIMAL_NDJSON = 10
+
+# nama -> (fungsi geometri, parameter). 'r' boleh diganti 'd' (diameter).
+# L = luas (lingkaran, juring, atau tembereng sesuai rumus), K = keliling,
+# s = panjang busur, t = panjang tali busur, a = jarak tali busur ke pusat.
+RUMUS = {
+    'luas_lingkaran': (geometri.luas_lingkaran, ('r',)),
+    'keliling_lingkaran': (geometri.keliling_lingkaran, ('r',)),
+    'luas_juring': (geometri.luas_juring, ('r', 'theta')),
+    'panjang_busur': (geometri.panjang_busur, ('r', 'theta')),
+    'luas_segitiga_juring': (geometri.luas_segitiga_juring, ('r', 'theta')),
+    'luas_tembereng': (geometri.luas_tembereng, ('r', 'theta')),
+    'panjang_tali_busur': (geometri.panjang_tali_busur, ('r', 'theta')),
+    'tali_busur_dari_jarak': (geometri.tali_busur_dari_jarak, ('r', 'a')),
+    'sudut_dari_jarak': (geometri.sudut_dari_jarak, ('r', 'a')),
+    'jari_jari_dari_luas': (geometri.jari_jari_dari_luas, ('L',)),
+    'jari_jari_dari_keliling': (geometri.jari_jari_dari_keliling, ('K',)),
+    'sudut_dari_busur': (geometri.sudut_dari_busur, ('r', 's')),
+    'jari_jari_dari_busur': (geometri.jari_jari_dari_busur, ('s', 'theta')),
+    'sudut_dari_luas_juring': (geometri.sudut_dari_luas_juring, ('r', 'L')),
+    'jari_jari_dari_luas_juring': (geometri.jari_jari_dari_luas_juring, ('L', 'theta')),
+    'sudut_dari_tali_busur': (geometri.sudut_dari_tali_busur, ('r', 't')),
+    'jari_jari_dari_tali_busur': (geometri.jari_jari_dari_tali_busur, ('t', 'theta')),
+    'sudut_dari_luas_tembereng': (geometri.sudut_dari_luas_tembereng, ('r', 'L')),
+    'jari_jari_dari_luas_tembereng': (geometri.jari_jari_dari_luas_tembereng, ('L', 'theta')),
+}
+
+# nama slide -> (fungsi draw_*, parameter)
+DIAGRAM = {
+    'luas': ('draw_circle_area', ('r',)),
+    'keliling': ('draw_circle_circumference', ('r',)),
+    'jari_jari': ('draw_circle_with_radius', ('r',)),
+    'diameter': ('draw_circle_with_diameter', ('d',)),
+    'juring': ('draw_juring', ('r', 'theta')),
+    'tembereng': ('draw_tembereng', ('r', 'theta')),
+    'busur': ('draw_busur', ('r', 'theta')),
+    'tali_busur': ('draw_tali_busur', ('r', 'theta')),
+}
+
+
+class PermintaanError(ValueError):
+    def __init__(self, pesan, status=400):
+        super().__init__(pesan)
+        self.status = status
+
+
+def _angka(nilai, nama):
+    try:
+        if isinstance(nilai, list):
+            return np.asarray(nilai, dtype=np.float64)
+        return float(nilai)
+    except (TypeError, ValueError):
+        raise PermintaanError(f"Parameter '{nama}' harus berupa angka atau array angka") from None
+
+
+def argumen(param, data):
+    # Nilai parameter dari query/body sesuai urutan param; 'd' menggantikan 'r'
+    args = []
+    for p in param:
+        if p in data:
+            args.append(_angka(data[p], p))
+        elif p == 'r' and 'd' in data:
+            args.append(_angka(data['d'], 'd') / 2)
+        else:
+            raise PermintaanError(f"Parameter '{p}' tidak ada")
+    return args
+
+
+def ke_json(hasil):
+    # Skalar/array float64 -> float/list; NaN dan ±inf menjadi null
+    hasil = np.asarray(hasil, dtype=np.float64)
+    if hasil.ndim == 0:
+        return float(hasil) if np.isfinite(hasil) else None
+    return np.where(np.isfinite(hasil), hasil, None).tolist()
+
+
+def terukur(nama, fn, *args, **kwargs):
+    # Satu panggilan vektor ke geometri/batch, dicatat sebagai fase 'rumus'
+    with diagnostik.fase('rumus', nama):
+        return fn(*args, **kwargs)
+
+
+def fungsi_rumus(nama):
+    if nama not in RUMUS:
+        raise PermintaanError(f"Rumus '{nama}' tidak dikenal", 404)
+    return RUMUS[nama]
+
+
+def hitung_kelompok(permintaan):
+    # permintaan: list (rumus, tuple skalar). Dihitung per rumus dalam satu
+    # panggilan vektor; hasil berurutan sesuai permintaan.
+    hasil = [None] * len(permintaan)
+    per_rumus = {}
+    for i, (rumus, args) in enumerate(permintaan):
+        per_rumus.setdefault(rumus, []).append(i)
+    for rumus, indeks in per_rumus.items():
+        fn, _ = RUMUS[rumus]
+        kolom = np.array([permintaan[i][1] for i in indeks], dtype=np.float64).T
+        for i, v in zip(indeks, ke_json(terukur(rumus, fn, *kolom))):
+            hasil[i] = v
+    return hasil
+
+
+class Penggabung:
+    # Permintaan skalar dari banyak thread handler masuk ke satu antrean.
+    # Thread penggabung menunggu paling lama `jendela` detik setelah
+    # permintaan pertama (atau sampai `maks` permintaan), lalu menghitung
+    # semuanya dengan hitung_kelompok dan mengisi Future setiap handler.
+    def __init__(self, jendela=JENDELA_MS / 1000, maks=MAKS_GABUNG):
+        self.jendela = jendela
+        self.maks = maks
+        self._antrean = []
+        self._cond = threading.Condition()
+        self.statistik = {'permintaan': 0, 'batch': 0, 'terbesar': 0}
+        threading.Thread(target=self._loop, daemon=True, name='lingkaran-api-gabung').start()
+
+    def hitung(self, rumus, args):
+        future = Future()
+        with self._cond:
+            self._antrean.append((rumus, args, future))
+            if len(self._antrean) in (1, self.maks):
+                self._cond.notify()
+        return future.result()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._antrean:
+                    self._cond.wait()
+                batas = time.monotonic() + self.jendela
+                while len(self._antrean) < self.maks:
+                    sisa = batas - time.monotonic()
+                    if sisa <= 0:
+                        break
+                    self._cond.wait(sisa)
+                kumpulan, self._antrean = self._antrean, []
+            try:
+                hasil = hitung_kelompok([(rumus, args) for rumus, args, _ in kumpulan])
+            except Exception as e:
+                for _, _, future in kumpulan:
+                    future.set_exception(e)
+                continue
+            for (_, _, future), v in zip(kumpulan, hasil):
+                future.set_result(v)
+            self.statistik['permintaan'] += len(kumpulan)
+            self.statistik['batch'] += 1
+            self.statistik['terbesar'] = max(self.statistik['terbesar'], len(kumpulan))
+
+
+penggabung = Penggabung()
+
+
+def _potongan_baris(kolom, n):
+    # kolom: dict nama -> array sepanjang n (boleh view hasil broadcast)
+    for awal in range(0, n, BARIS_PER_CHUNK):
+        yield {nama: v[awal:awal + BARIS_PER_CHUNK] for nama, v in kolom.items()}
+
+
+def _ndjson(kolom):
+    import pandas as pd
+
+    teks = pd.DataFrame(kolom).to_json(orient='records', lines=True, double_precision=DESIMAL_NDJSON)
+    return (teks if teks.endswith('\n') else teks + '\n').encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'LingkaranAPI/1.0'
+    # Header dan body ditulis terpisah; tanpa ini koneksi keep-alive tertahan
+    # ~40 ms oleh Nagle + delayed ACK di setiap respons kecil
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass  # durasi dan ukuran setiap permintaan dicatat di diagnostik
+
+    def do_GET(self):
+        self._layani('GET')
+
+    def do_POST(self):
+        self._layani('POST')
+
+    # ---------- kerangka ----------
+
+    def _layani(self, metode):
+        mulai = time.perf_counter()
+        url = urlsplit(self.path)
+        bagian = [b for b in url.path.split('/') if b]
+        rute = bagian[0] if bagian else 'rumus'
+        nbytes = 0
+        self._stream_mulai = False
+        try:
+            fn = RUTE.get((metode, rute))
+            if fn is None:
+                raise PermintaanError(f'Tidak ada rute {metode} /{rute}', 404)
+            data = dict(parse_qsl(url.query))
+            if metode == 'POST':
+                data.update(self._baca_body())
+            nbytes = fn(self, bagian[1:], data)
+        except PermintaanError as e:
+            nbytes = self._kirim_galat(str(e), e.status)
+        except Exception as e:
+            nbytes = self._kirim_galat(f'{type(e).__name__}: {e}', 500)
+        diagnostik.catat('api', rute, time.perf_counter() - mulai, nbytes)
+
+    def _kirim_galat(self, pesan, status):
+        if self._stream_mulai:
+            # Header chunked sudah terkirim: respons kedua akan masuk ke body
+            # yang masih terbuka. Koneksi ditutup tanpa chunk penutup, jadi
+            # klien tahu respons terpotong.
+            self.close_connection = True
+            return 0
+        return self._kirim_json({'galat': pesan}, status)
+
+    def _baca_body(self):
+        panjang = self.headers.get('Content-Length')
+        if panjang is None:
+            raise PermintaanError('Header Content-Length diperlukan', 411)
+        try:
+            panjang = int(panjang)
+        except ValueError:
+            panjang = -1
+        # Body yang tidak dibaca akan terbaca sebagai permintaan berikutnya,
+        # jadi koneksi ditutup setelah respons galat
+        if panjang < 0:
+            self.close_connection = True
+            raise PermintaanError('Header Content-Length tidak valid')
+        if panjang > MAKS_BODY:
+            self.close_connection = True
+            raise PermintaanError(f'Body lebih dari {MAKS_BODY // 2 ** 20} MB', 413)
+        try:
+            data = json.loads(self.rfile.read(panjang) or b'{}')
+        except ValueError as e:
+            raise PermintaanError(f'Body bukan JSON yang valid: {e}') from None
+        if not isinstance(data, dict):
+            raise PermintaanError('Body harus berupa objek JSON')
+        return data
+
+    def _kirim(self, isi, tipe, status=200, header=None):
+        self.send_response(status)
+        self.send_header('Content-Type', tipe)
+        self.send_header('Content-Length', str(len(isi)))
+        for k, v in (header or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(isi)
+        return len(isi)
+
+    def _kirim_json(self, objek, status=200, header=None):
+        isi = json.dumps(objek, separators=(',', ':'), allow_nan=False).encode()
+        return self._kirim(isi, 'application/json', status, header)
+
+    def _kirim_stream(self, potongan):
+        # potongan: iterator bytes, masing-masing dikirim sebagai satu chunk
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        self._stream_mulai = True
+        total = 0
+        for isi in potongan:
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(isi), isi))
+            total += len(isi)
+        self.wfile.write(b'0\r\n\r\n')
+        return total
+
+    def _mau_stream(self, n):
+        return n > BATAS_STREAM or 'application/x-ndjson' in self.headers.get('Accept', '')
+
+    # ---------- endpoint ----------
+
+    def rumus(self, bagian, data):
+        return self._kirim_json({nama: list(param) for nama, (_, param) in RUMUS.items()})
+
+    def hitung(self, bagian, data):
+        if not bagian:
+            return self._hitung_campuran(data)
+        fn, param = fungsi_rumus(bagian[0])
+        args = argumen(param, data)
+        if not any(isinstance(a, np.ndarray) for a in args):
+            return self._kirim_json({'hasil': penggabung.hitung(bagian[0], tuple(args))})
+        try:
+            args = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in args])
+        except ValueError:
+            raise PermintaanError('Panjang array parameter tidak cocok') from None
+        n = args[0].size
+        if self._mau_stream(n):
+            kolom = dict(zip(param, (a.ravel() for a in args)))
+            return self._kirim_stream(_ndjson({'hasil': terukur(bagian[0], fn, *bagian_kolom.values())})
+                                      for bagian_kolom in _potongan_baris(kolom, n))
+        return self._kirim_json({'hasil': ke_json(terukur(bagian[0], fn, *args))})
+
+    def _hitung_campuran(self, data):
+        daftar = data.get('permintaan')
+        if not isinstance(daftar, list):
+            raise PermintaanError("Body harus berisi 'permintaan': [{\"rumus\": ..., ...}, ...]")
+        permintaan = []
+        for i, p in enumerate(daftar):
+            if not isinstance(p, dict) or 'rumus' not in p:
+                raise PermintaanError(f"permintaan[{i}] harus berupa objek dengan kunci 'rumus'")
+            _, param = fungsi_rumus(p['rumus'])
+            args = argumen(param, p)
+            if any(isinstance(a, np.ndarray) for a in args):
+                raise PermintaanError(f'permintaan[{i}]: nilai harus skalar; kirim array ke /hitung/<rumus>')
+            permintaan.append((p['rumus'], tuple(args)))
+        return self._kirim_json({'hasil': hitung_kelompok(permintaan)})
+
+    def komponen(self, bagian, data):
+        # Semua komponen seperti mode massal: r (atau d) dengan theta (atau a)
+        import batch
+
+        kolom = {nama: _angka(data[nama], nama) for nama in ('r', 'd', 'theta', 'a') if nama in data}
+        if 'r' not in kolom and 'd' not in kolom:
+            raise PermintaanError("Parameter 'r' atau 'd' tidak ada")
+        if 'theta' not in kolom and 'a' not in kolom:
+            raise PermintaanError("Parameter 'theta' atau 'a' tidak ada")
+        if 'theta' in kolom:
+            kolom.pop('a', None)
+        if 'r' in kolom:
+            kolom.pop('d', None)
+        try:
+            nama = list(kolom)
+            kolom = dict(zip(nama, (a.ravel() for a in np.broadcast_arrays(*kolom.values()))))
+        except ValueError:
+            raise PermintaanError('Panjang array parameter tidak cocok') from None
+        n = next(iter(kolom.values())).size
+        if self._mau_stream(n):
+            return self._kirim_stream(_ndjson(terukur('komponen', batch.hitung_kolom, **bagian_kolom))
+                                      for bagian_kolom in _potongan_baris(kolom, n))
+        hasil = terukur('komponen', batch.hitung_kolom, **kolom)
+        return self._kirim_json({nama: ke_json(v) for nama, v in hasil.items()})
+
+    def diagram(self, bagian, data):
+        import disk_cache
+        import profil_render
+        import render_cache
+
+        if not bagian or bagian[0] not in DIAGRAM:
+            raise PermintaanError(f"Diagram tidak dikenal; pilihan: {', '.join(DIAGRAM)}", 404)
+        draw, param = DIAGRAM[bagian[0]]
+        args = argumen(param, data)
+        if any(isinstance(a, np.ndarray) or not 0 < a < 1e6 for a in args):
+            raise PermintaanError('Parameter diagram harus angka positif tunggal')
+        if len(args) == 2 and args[1] > 360:
+            raise PermintaanError('theta maksimal 360')
+        svg = data.get('fmt', render_cache.RENDERER) == 'svg'
+        if svg:
+            kunci = render_cache.cache_key(draw, args, 'svg')
+        else:
+            profil = profil_render.ambil(data.get('profil'))
+            lebar = min(1.0, max(0.1, _angka(data.get('lebar', 1.0), 'lebar')))
+            _, dpi, profil = render_cache.varian(profil, lebar)
+            kunci = render_cache.cache_key(draw, args, profil.fmt, dpi, profil=profil)
+        etag = f'"{disk_cache.digest(kunci + (render_cache.versi_kode(),))[:32]}"'
+        header = {'ETag': etag, 'Cache-Control': 'public, max-age=86400'}
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            for k, v in header.items():
+                self.send_header(k, v)
+            self.end_headers()
+            return 0
+        if svg:
+            return self._kirim(render_cache.render_svg(draw, *args).encode(), 'image/svg+xml', header=header)
+
+        try:
+            gambar = render_cache.render_raster(draw, *args, profil=profil, dpi=dpi)
+        except RenderPoolBusy as e:
+            return self._kirim_json({'galat': str(e)}, 503, {'Retry-After': '1'})
+        return self._kirim(gambar, profil_render.MIME[profil.fmt], header=header)
+
+    def metrik(self, bagian, data):
+        teks = diagnostik.prometheus()
+        for nama, nilai in penggabung.statistik.items():
+            teks += f'lingkaran_api_gabung_{nama} {nilai}\n'
+        return self._kirim(teks.encode(), 'text/plain; version=0.0.4')
+
+    def sehat(self, bagian, data):
+        return self._kirim_json({'status': 'ok'})
+
+
+RUTE = {
+    ('GET', 'rumus'): Handler.rumus,
+    ('GET', 'hitung'): Handler.hitung,
+    ('POST', 'hitung'): Handler.hitung,
+    ('POST', 'komponen'): Handler.komponen,
+    ('GET', 'diagram'): Handler.diagram,
+    ('GET', 'metrik'): Handler.metrik,
+    ('GET', 'sehat'): Handler.sehat,
+}
+
+
+def buat_server(host=HOST_DEFAULT, port=PORT_DEFAULT):
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Layanan HTTP JSON untuk rumus dan diagram lingkaran.')
+    parser.add_argument('--host', default=HOST_DEFAULT, help=f'Alamat (default: {HOST_DEFAULT})')
+    parser.add_argument('--port', type=int, default=PORT_DEFAULT, help=f'Port (default: {PORT_DEFAULT})')
+    parser.add_argument('--jendela-ms', type=float, default=JENDELA_MS,
+                        help='Waktu tunggu penggabungan permintaan skalar (ms); 0 = tanpa menunggu')
+    args = parser.parse_args(argv)
+
+    penggabung.jendela = args.jendela_ms / 1000
+    # Import modul berat sebelum melayani, bukan di permintaan pertama
+    import batch  # noqa: F401  (pandas)
+    import render_cache
+    if render_cache.RENDERER != 'svg':
+        import diagram  # noqa: F401  (matplotlib)
+    server = buat_server(args.host, args.port)
+    print(f'Layanan lingkaran di http://{args.host}:{server.server_port}', file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+import geometri
+
+# Mode massal: hitung semua komponen lingkaran untuk banyak baris (r, θ) atau
+# (r, a) sekaligus. Semua kolom dihitung dalam satu lintasan tervektorisasi
+# lewat geometri, tanpa loop per baris.
+
+# Nama kolom yang dikenali (huruf kecil, tanpa spasi) -> nama standar
+ALIAS_KOLOM = {
+    'r': 'r', 'jari_jari': 'r', 'jari-jari': 'r', 'jarijari': 'r',
+    'd': 'd', 'diameter': 'd',
+    'theta': 'theta', 'θ': 'theta', 'sudut': 'theta', 'theta_deg': 'theta',
+    'a': 'a', 'jarak': 'a',
+}
+
+KOLOM_HASIL = ['luas', 'keliling', 'luas_juring', 'panjang_busur',
+               'luas_tembereng', 'tali_busur']
+
+
+class BatchError(ValueError):
+    pass
+
+
+def baca_csv(data):
+    # data: bytes (unggahan) atau str (teks yang ditempel). Pemisah koma,
+    # titik koma, atau tab dideteksi dari baris header.
+    if isinstance(data, bytes):
+        data = data.decode('utf-8-sig')
+    sep = deteksi_pemisah(data.lstrip().split('\n', 1)[0])
+    try:
+        df = pd.read_csv(io.StringIO(data), sep=sep)
+    except Exception as e:
+        raise BatchError(f'CSV tidak dapat dibaca: {e}') from e
+
+    return normalisasi_kolom(df)
+
+
+def deteksi_pemisah(baris_header):
+    # Titik koma dan tab didahulukan: header dengan pemisah itu bisa saja
+    # memuat koma, sebaliknya jarang
+    return next((s for s in (';', '\t', ',') if s in baris_header), ',')
+
+
+def periksa_kolom(kolom):
+    # kolom: nama standar yang tersedia (lihat ALIAS_KOLOM)
+    if 'r' not in kolom and 'd' not in kolom:
+        raise BatchError("Kolom jari-jari ('r') atau diameter ('d') tidak ditemukan")
+    if 'theta' not in kolom and 'a' not in kolom:
+        raise BatchError("Kolom sudut ('theta') atau jarak ('a') tidak ditemukan")
+
+
+def normalisasi_kolom(df):
+    # Ganti nama kolom yang dikenali ke nama standar dan buang kolom lainnya
+    kolom = {}
+    for nama in df.columns:
+        standar = ALIAS_KOLOM.get(str(nama).strip().lower().replace(' ', '_'))
+        if standar and standar not in kolom:
+            kolom[standar] = nama
+    periksa_kolom(kolom)
+    return df.rename(columns={v: k for k, v in kolom.items()})[list(kolom)]
+
+
+def hitung_kolom(r=None, theta=None, a=None, d=None):
+    # Versi array murni dari hitung_batch (tanpa pandas), dipakai juga oleh
+    # lingkaran_cli. Mengembalikan dict kolom -> array float64 berurutan.
+    r = np.asarray(r if r is not None else np.asarray(d, dtype=np.float64) / 2, dtype=np.float64)
+    hasil = {'r': r}
+    if theta is not None:
+        theta = np.asarray(theta, dtype=np.float64)
+        tali = geometri.panjang_tali_busur(r, theta)
+    else:
+        hasil['a'] = a = np.asarray(a, dtype=np.float64)
+        theta = geometri.sudut_dari_jarak(r, a)
+        tali = geometri.tali_busur_dari_jarak(r, a)
+    hasil['theta'] = theta
+    hasil['luas'] = geometri.luas_lingkaran(r)
+    hasil['keliling'] = geometri.keliling_lingkaran(r)
+    hasil['luas_juring'] = geometri.luas_juring(r, theta)
+    hasil['panjang_busur'] = geometri.panjang_busur(r, theta)
+    hasil['luas_tembereng'] = geometri.luas_tembereng(r, theta)
+    hasil['tali_busur'] = tali
+    return hasil
+
+
+def hitung_batch(df):
+    kolom = {nama: pd.to_numeric(df[nama], errors='coerce').to_numpy(np.float64)
+             for nama in ('r', 'd', 'theta', 'a') if nama in df}
+    if 'theta' in kolom:
+        kolom.pop('a', None)
+    return pd.DataFrame(hitung_kolom(**kolom))
+
+
+def ke_csv(hasil):
+    # Penulis CSV pyarrow (dependensi Streamlit) jauh lebih cepat daripada
+    # DataFrame.to_csv untuk ratusan ribu baris
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    buf = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(hasil.round(6), preserve_index=False), buf)
+    return buf.getvalue()
@@ -0,0 +1,265 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Benchmark fungsi gambar dan rerun slide penuh, tanpa jaringan.
+# - draw:  setiap draw_* (PNG lewat Agg, atau SVG) pada grid r × θ termasuk
+#          nilai ekstrem; dicatat median/min waktu render, puncak memori
+#          (tracemalloc, alokasi Python + NumPy; buffer Agg di C++ tidak
+#          terhitung), dan ukuran hasil. Dengan --profil, render raster juga
+#          diukur per profil_render (dpi kolom kalkulator, PNG/WebP/JPEG).
+# - slide: rerun penuh setiap slide lewat streamlit.testing (AppTest): run
+#          pertama dan rerun setelah input berubah, keduanya dengan cache
+#          render kosong dan tanpa prefetch.
+# - kebalikan: fungsi kebalikan geometri (sudut_dari_*, jari_jari_dari_*) pada
+#          array acak sebesar N_KEBALIKAN; dicatat juga juta soal per detik
+#          dan, untuk luas tembereng, jumlah iterasi dan residu terbesar.
+# Hasil disimpan sebagai JSON. Dengan --baseline, hasil dibandingkan dengan
+# run sebelumnya dan keluar dengan kode 1 jika ada yang melambat melebihi
+# toleransi.
+#
+# Contoh:
+#   python benchmark.py --out bench.json
+#   python benchmark.py --cepat --baseline bench.json --toleransi 0.25
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lingkaran_app.py')
+
+GRID_R = (0.1, 1.0, 7.0, 100.0, 10000.0)
+GRID_THETA = (0.5, 1.0, 60.0, 179.0, 359.9, 360.0)
+GRID_CEPAT_R = (0.1, 7.0, 10000.0)
+GRID_CEPAT_THETA = (0.5, 60.0, 360.0)
+
+N_KEBALIKAN = 1_000_000
+
+# Widget yang diubah untuk mengukur rerun setelah input berubah
+INPUT_SLIDE = {
+    'luas': None, 'keliling': 'keliling_r', 'juring': 'juring_r', 'tembereng': 'tembereng_r',
+    'jari_jari': 'jari_d', 'diameter': 'diameter_r', 'busur': 'busur_r', 'tali_busur': 'tali_r',
+}
+
+
+def ukur(fn, ulang):
+    # Waktu per pengulangan diukur tanpa tracemalloc (yang memperlambat
+    # alokasi); puncak memori diambil dari satu run tambahan yang dilacak
+    waktu = []
+    for _ in range(ulang):
+        gc.collect()
+        mulai = time.perf_counter()
+        fn()
+        waktu.append(time.perf_counter() - mulai)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        puncak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'median_ms': statistics.median(waktu) * 1000, 'min_ms': min(waktu) * 1000,
+            'puncak_kb': puncak / 1024, 'n': ulang}
+
+
+def bench_draw(renderer, grid_r, grid_theta, ulang, dpi, profil=None):
+    # Dengan profil (lihat profil_render), dpi dan encode mengikuti profil
+    # untuk diagram di kolom kalkulator, dan kunci hasil memakai nama profil
+    from lembar_kerja import argumen_diagram
+
+    hasil = {}
+    label = renderer
+    if renderer == 'svg':
+        from svg_diagram import SVG_DIAGRAMS as fungsi
+
+        def render(nama, args):
+            return fungsi[nama](*args)
+    else:
+        from diagram import DIAGRAMS as fungsi
+        from render_pool import buat_canvas, render_ke_bytes
+
+        fig, ax = buat_canvas()
+        fmt, pil_kwargs = 'png', None
+        if profil is not None:
+            import profil_render
+            from slides.umum import LEBAR_KOLOM
+
+            label, fmt, pil_kwargs = profil.nama, profil.fmt, dict(profil.opsi)
+            dpi = profil_render.dpi(profil, LEBAR_KOLOM)
+
+        def render(nama, args):
+            return render_ke_bytes(fig, ax, fungsi[nama], args, dpi, fmt, pil_kwargs=pil_kwargs)
+
+    for nama in fungsi:
+        kombinasi = {argumen_diagram(nama, r, theta) for r in grid_r for theta in grid_theta}
+        for args in sorted(kombinasi):
+            data = render(nama, args)  # pemanasan (font cache, import)
+            kunci = f"draw/{label}/{nama}/{','.join(f'{a:g}' for a in args)}"
+            hasil[kunci] = ukur(lambda: render(nama, args), ulang)
+            hasil[kunci]['ukuran_kb'] = len(data) / 1024
+            print(f"{kunci:55s} {hasil[kunci]['median_ms']:9.2f} ms {hasil[kunci]['puncak_kb']:9.0f} KB"
+                  f" {hasil[kunci]['ukuran_kb']:7.1f} KB", file=sys.stderr)
+    return hasil
+
+
+def bench_slide(ulang):
+    from streamlit.testing.v1 import AppTest
+
+    import disk_cache
+    import pemanasan
+    import prefetch
+    import render_cache
+
+    # Kedua langkah mengukur render baru: cache disk bersama, pemanasan, dan
+    # prefetch (yang mengisi cache untuk langkah input berikutnya dan berebut
+    # pool render) tidak dipakai
+    disk_cache.AKTIF = False
+    pemanasan.AKTIF = False
+    prefetch.AKTIF = False
+    hasil = {}
+    for slide, widget in INPUT_SLIDE.items():
+        at = AppTest.from_file(APP, default_timeout=120)
+        at.session_state.current_slide = slide
+        at.run()  # pemanasan: import modul slide, diagram, matplotlib
+
+        def run_pertama():
+            render_cache.cache.clear()
+            at.run()
+
+        def ubah_input():
+            render_cache.cache.clear()
+            if widget is None:
+                at.number_input[0].increment().run()
+            else:
+                at.number_input(key=widget).increment().run()
+
+        for nama, fn in (('pertama', run_pertama), ('ubah_input', ubah_input)):
+            kunci = f'slide/{slide}/{nama}'
+            hasil[kunci] = ukur(fn, ulang)
+            if at.exception:
+                raise RuntimeError(f'Slide {slide} gagal: {at.exception[0].value}')
+            print(f"{kunci:55s} {hasil[kunci]['median_ms']:9.2f} ms {hasil[kunci]['puncak_kb']:9.0f} KB",
+                  file=sys.stderr)
+    return hasil
+
+
+def bench_kebalikan(ulang, n=N_KEBALIKAN):
+    import numpy as np
+
+    import geometri
+
+    # Input dari besaran maju pada r, θ acak, jadi semua soal punya jawaban
+    rng = np.random.default_rng(0)
+    r = rng.uniform(0.1, 100.0, n)
+    theta = rng.uniform(0.0, 360.0, n)
+    kasus = {
+        'sudut_dari_busur': (r, geometri.panjang_busur(r, theta)),
+        'jari_jari_dari_busur': (geometri.panjang_busur(r, theta), theta),
+        'sudut_dari_luas_juring': (r, geometri.luas_juring(r, theta)),
+        'jari_jari_dari_luas_juring': (geometri.luas_juring(r, theta), theta),
+        'sudut_dari_tali_busur': (r, geometri.panjang_tali_busur(r, theta)),
+        'jari_jari_dari_tali_busur': (geometri.panjang_tali_busur(r, theta), theta),
+        'sudut_dari_luas_tembereng': (r, geometri.luas_tembereng(r, theta)),
+        'jari_jari_dari_luas_tembereng': (geometri.luas_tembereng(r, theta), theta),
+    }
+    hasil = {}
+    for nama, args in kasus.items():
+        fn = getattr(geometri, nama)
+        fn(*args)
+        kunci = f'kebalikan/{nama}/{n}'
+        hasil[kunci] = ukur(lambda: fn(*args), ulang)
+        hasil[kunci]['juta_per_detik'] = n / hasil[kunci]['median_ms'] / 1000
+        catatan = ''
+        if nama == 'sudut_dari_luas_tembereng':
+            _, info = fn(*args, laporan=True)
+            hasil[kunci].update(iterasi=info['iterasi'], residu_maks=info['residu_maks'])
+            catatan = f" {info['iterasi']} iterasi, residu {info['residu_maks']:.1e}"
+        print(f"{kunci:55s} {hasil[kunci]['median_ms']:9.2f} ms {hasil[kunci]['juta_per_detik']:7.1f} juta/s"
+              f"{catatan}", file=sys.stderr)
+    return hasil
+
+
+def metadata():
+    import matplotlib
+    import numpy
+    import streamlit
+
+    return {
+        'waktu': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu': os.cpu_count(),
+        'matplotlib': matplotlib.__version__,
+        'numpy': numpy.__version__,
+        'streamlit': streamlit.__version__,
+    }
+
+
+def bandingkan(hasil, baseline, toleransi):
+    # Regresi: median lebih lambat dari baseline × (1 + toleransi)
+    regresi = []
+    for kunci, baru in sorted(hasil.items()):
+        lama = baseline.get(kunci)
+        if lama is None:
+            continue
+        rasio = baru['median_ms'] / lama['median_ms'] if lama['median_ms'] else float('inf')
+        if rasio > 1 + toleransi:
+            regresi.append((kunci, lama['median_ms'], baru['median_ms'], rasio))
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark render diagram, rerun slide, dan fungsi kebalikan.')
+    parser.add_argument('--bagian', nargs='+', default=['draw', 'slide', 'kebalikan'],
+                        choices=['draw', 'slide', 'kebalikan'])
+    parser.add_argument('--renderer', nargs='+', default=['png'], choices=['png', 'svg'])
+    parser.add_argument('--ulang', type=int, default=5, help='Pengulangan per kasus (median dipakai)')
+    parser.add_argument('--dpi', type=int, default=200)
+    parser.add_argument('--profil', nargs='+', default=[],
+                        help='Ukur juga render PNG/WebP/JPEG menurut profil_render (mis. hemat ponsel)')
+    parser.add_argument('--cepat', action='store_true', help='Grid r × θ lebih kecil')
+    parser.add_argument('--out', default=None, help='Simpan hasil ke file JSON')
+    parser.add_argument('--baseline', default=None, help='JSON hasil run sebelumnya untuk dibandingkan')
+    parser.add_argument('--toleransi', type=float, default=0.2,
+                        help='Perlambatan relatif yang masih diterima (default 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    grid_r, grid_theta = (GRID_CEPAT_R, GRID_CEPAT_THETA) if args.cepat else (GRID_R, GRID_THETA)
+    hasil = {}
+    if 'draw' in args.bagian:
+        for renderer in args.renderer:
+            hasil.update(bench_draw(renderer, grid_r, grid_theta, args.ulang, args.dpi))
+        for nama in args.profil:
+            import profil_render
+
+            hasil.update(bench_draw('png', grid_r, grid_theta, args.ulang, args.dpi,
+                                    profil_render.PROFIL[nama]))
+    if 'slide' in args.bagian:
+        hasil.update(bench_slide(args.ulang))
+    if 'kebalikan' in args.bagian:
+        hasil.update(bench_kebalikan(args.ulang))
+
+    laporan = {'meta': metadata(), 'hasil': hasil}
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(laporan, f, indent=1)
+        print(f'Hasil disimpan ke {args.out}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['hasil']
+        regresi = bandingkan(hasil, baseline, args.toleransi)
+        dibandingkan = len(set(hasil) & set(baseline))
+        if regresi:
+            print(f'\nREGRESI ({len(regresi)} dari {dibandingkan} kasus, toleransi {args.toleransi:.0%}):')
+            for kunci, lama, baru, rasio in regresi:
+                print(f'  {kunci}: {lama:.2f} ms -> {baru:.2f} ms ({rasio:.2f}x)')
+            return 1
+        print(f'\nOK: tidak ada regresi pada {dibandingkan} kasus (toleransi {args.toleransi:.0%})')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Instrumentasi jalur panas setiap rerun. Setiap fase dicatat per nama ke
+# histogram bergulir (N sampel terakhir) untuk durasi dan ukuran bytes:
+#   rerun    - satu eksekusi skrip penuh (lingkaran_app.py)
+#   slide    - dispatch + render satu slide (slides.render)
+#   rumus    - perhitungan geometri per slide, mode massal, dan endpoint API
+#              (dicatat oleh pemanggil; geometri sendiri tidak terukur)
+#   draw     - setiap fungsi draw_* (membangun artist, di worker render_pool)
+#   encode   - savefig: rasterisasi Agg + encode PNG/SVG, dan ukuran bytesnya
+#   kirim    - st.image (serialisasi + kirim ke frontend) dan ukuran bytes
+#   pemanasan - pemanasan cache saat server mulai (lihat pemanasan)
+#   prefetch - pekerjaan prefetch yang gagal (lihat prefetch)
+# Panel diagnostik muncul dengan query param ?diag=1 dan snapshot bisa ditulis
+# ke file teks format Prometheus. Modul ini tidak bergantung pada Streamlit
+# agar bisa diimport oleh render_pool dan api_server.
+
+JENDELA = int(os.environ.get('LINGKARAN_DIAG_WINDOW', 1024))
+FILE_SNAPSHOT = os.environ.get('LINGKARAN_METRICS_FILE', 'metrik_lingkaran.prom')
+KUANTIL = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    def __init__(self, jendela=JENDELA):
+        self._sampel = deque(maxlen=jendela)
+        self._lock = threading.Lock()
+        self.jumlah = 0
+        self.total = 0.0
+
+    def catat(self, nilai):
+        with self._lock:
+            self._sampel.append(nilai)
+            self.jumlah += 1
+            self.total += nilai
+
+    def kuantil(self, qs=KUANTIL):
+        with self._lock:
+            data = sorted(self._sampel)
+        if not data:
+            return {q: float('nan') for q in qs}
+        # Nearest-rank
+        return {q: data[min(len(data) - 1, int(q * len(data)))] for q in qs}
+
+
+# (jenis, fase, nama) -> Histogram; jenis 'detik' atau 'bytes'
+_metrik = {}
+_lock = threading.Lock()
+
+
+def _histogram(jenis, fase, nama):
+    kunci = (jenis, fase, nama)
+    h = _metrik.get(kunci)
+    if h is None:
+        with _lock:
+            h = _metrik.setdefault(kunci, Histogram())
+    return h
+
+
+def catat(fase, nama, detik, nbytes=None):
+    _histogram('detik', fase, nama).catat(detik)
+    if nbytes is not None:
+        _histogram('bytes', fase, nama).catat(nbytes)
+
+
+@contextmanager
+def fase(nama_fase, nama=''):
+    mulai = time.perf_counter()
+    try:
+        yield
+    finally:
+        catat(nama_fase, nama, time.perf_counter() - mulai)
+
+
+def ringkasan():
+    # List dict per metrik, diurutkan per fase lalu nama (durasi sebelum bytes)
+    hasil = []
+    with _lock:
+        metrik = sorted(_metrik.items(), key=lambda m: (m[0][1], m[0][2], m[0][0] != 'detik'))
+    for (jenis, nama_fase, nama), h in metrik:
+        q = h.kuantil()
+        hasil.append({'jenis': jenis, 'fase': nama_fase, 'nama': nama, 'jumlah': h.jumlah,
+                      'total': h.total, 'p50': q[0.5], 'p95': q[0.95], 'p99': q[0.99]})
+    return hasil
+
+
+def prometheus():
+    # Format teks exposition Prometheus (tipe summary)
+    baris = []
+    for jenis in ('detik', 'bytes'):
+        metrik = 'lingkaran_fase_seconds' if jenis == 'detik' else 'lingkaran_fase_bytes'
+        data = [m for m in ringkasan() if m['jenis'] == jenis]
+        if not data:
+            continue
+        satuan = 'Durasi' if jenis == 'detik' else 'Ukuran'
+        baris.append(f'# HELP {metrik} {satuan} setiap fase rerun lingkaran_app')
+        baris.append(f'# TYPE {metrik} summary')
+        for m in data:
+            label = f'fase="{m["fase"]}",nama="{m["nama"]}"'
+            for q in KUANTIL:
+                baris.append(f'{metrik}{{{label},quantile="{q}"}} {m[f"p{round(q * 100)}"]:.6g}')
+            baris.append(f'{metrik}_sum{{{label}}} {m["total"]:.6g}')
+            baris.append(f'{metrik}_count{{{label}}} {m["jumlah"]}')
+    return '\n'.join(baris) + '\n'
+
+
+def tulis_snapshot(path=FILE_SNAPSHOT):
+    # Tulis atomik agar scraper (mis. node_exporter textfile) tidak membaca
+    # file setengah jadi
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(prometheus())
+    os.replace(tmp, path)
+    return path
+
+
+def reset():
+    with _lock:
+        _metrik.clear()
+
+
+def tampilkan_panel():
+    import streamlit as st
+
+    st.markdown("---")
+    st.markdown("### 🩺 Diagnostik Rerun")
+    data = ringkasan()
+    if not data:
+        st.caption("Belum ada data.")
+        return
+    baris = ["| Fase | Nama | n | p50 | p95 | p99 |", "|---|---|---|---|---|---|"]
+    for m in data:
+        if m['jenis'] == 'detik':
+            nilai = [f"{m[p] * 1000:.2f} ms" for p in ('p50', 'p95', 'p99')]
+        else:
+            nilai = [f"{m[p] / 1024:.1f} KB" for p in ('p50', 'p95', 'p99')]
+        baris.append(f"| {m['fase']} | {m['nama'] or '-'} | {m['jumlah']} | " + " | ".join(nilai) + " |")
+    st.markdown("\n".join(baris))
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("💾 Tulis snapshot Prometheus", key="diag_snapshot"):
+            st.success(f"Snapshot ditulis ke {os.path.abspath(tulis_snapshot())}")
+    with col2:
+        st.download_button("⬇️ Unduh snapshot", prometheus(), file_name="metrik_lingkaran.prom",
+                           mime="text/plain", key="diag_unduh")
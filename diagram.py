@@ -0,0 +1,213 @@
+import math
+from matplotlib.patches import Arc, Wedge, Circle, PathPatch
+from vertex_cache import lingkaran, jumlah_titik, jari_jari_px, path_tembereng
+
+# Semua fungsi gambar menerima Axes yang sudah disiapkan oleh pemanggil
+# (lihat render_pool) sehingga tidak ada figure pyplot yang dibuat di sini.
+# Ukuran figure yang diinginkan disimpan di atribut `figsize` fungsi.
+DIAGRAMS = {}
+
+
+def diagram(figsize):
+    def daftar(fn):
+        fn.figsize = figsize
+        DIAGRAMS[fn.__name__] = fn
+        return fn
+    return daftar
+
+# Fungsi untuk membuat visualisasi lingkaran
+@diagram(figsize=(6, 6))
+def draw_circle_with_radius(ax, r):
+    circle = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=3)
+    ax.add_patch(circle)
+    ax.plot([0, r], [0, 0], 'r-', linewidth=3, label=f'Jari-jari (r) = {r}')
+    ax.plot(0, 0, 'ro', markersize=8)
+    ax.text(r/2, 0.3, f'r = {r}', fontsize=12, color='red', fontweight='bold')
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title('Jari-Jari Lingkaran', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(6, 6))
+def draw_circle_with_diameter(ax, d):
+    r = d / 2
+    circle = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=3)
+    ax.add_patch(circle)
+    ax.plot([-r, r], [0, 0], 'g-', linewidth=3, label=f'Diameter (d) = {d}')
+    ax.plot(0, 0, 'ro', markersize=8)
+    ax.text(0, 0.5, f'd = {d}', fontsize=12, color='green', fontweight='bold', ha='center')
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title('Diameter Lingkaran', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(6, 6))
+def draw_circle_area(ax, r):
+    circle = Circle((0, 0), r, fill=True, color='#4CAF50', alpha=0.3, linewidth=3)
+    ax.add_patch(circle)
+    circle_border = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=3)
+    ax.add_patch(circle_border)
+    ax.plot([0, r], [0, 0], 'r-', linewidth=2, label=f'r = {r}')
+    ax.plot(0, 0, 'ro', markersize=8)
+    ax.text(0, 0, f'Luas = π × {r}²', fontsize=12, color='darkgreen', fontweight='bold', ha='center')
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title('Luas Lingkaran', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(6, 6))
+def draw_circle_circumference(ax, r):
+    circle = Circle((0, 0), r, fill=False, color='#FF9800', linewidth=4)
+    ax.add_patch(circle)
+    ax.plot(0, 0, 'ro', markersize=8)
+    # Garis keliling dari tabel lingkaran satuan; jumlah titik menyesuaikan
+    # ukuran lingkaran saat dirender
+    titik = lingkaran(r, jumlah_titik(jari_jari_px(ax, r, 2*r + 3)))
+    ax.plot(titik[:, 0], titik[:, 1], 'orange', linewidth=4, label=f'Keliling = 2π × {r}')
+    ax.text(0, -r-0.5, f'Keliling = 2 × π × {r}', fontsize=11, color='darkorange', fontweight='bold', ha='center')
+    ax.set_xlim(-r-1.5, r+1.5)
+    ax.set_ylim(-r-1.5, r+1.5)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title('Keliling Lingkaran', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(7, 7))
+def draw_juring(ax, r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    
+    # Gambar juring (sektor)
+    wedge = Wedge((0, 0), r, 0, theta_deg, facecolor='#FF7043', alpha=0.4, edgecolor='#D84315', linewidth=3)
+    ax.add_patch(wedge)
+    
+    # Gambar lingkaran lengkap (border saja)
+    circle = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=2, linestyle='--')
+    ax.add_patch(circle)
+    
+    # Gambar garis jari-jari
+    ax.plot([0, r], [0, 0], 'b-', linewidth=2.5)
+    ax.plot([0, r * math.cos(theta_rad)], [0, r * math.sin(theta_rad)], 'b-', linewidth=2.5)
+    
+    # Gambar busur
+    arc = Arc((0, 0), r*2, r*2, angle=0, theta1=0, theta2=theta_deg, color='red', linewidth=3)
+    ax.add_patch(arc)
+    
+    # Label sudut
+    ax.text(r*0.3*math.cos(theta_rad/2), r*0.3*math.sin(theta_rad/2), f'θ = {theta_deg}°', 
+            fontsize=11, color='purple', fontweight='bold', ha='center')
+    
+    ax.plot(0, 0, 'ko', markersize=8)
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_title(f'Juring Lingkaran (θ = {theta_deg}°)', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(7, 7))
+def draw_tembereng(ax, r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    
+    # Gambar lingkaran
+    circle = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=2)
+    ax.add_patch(circle)
+    
+    # Gambar tembereng (area yang diarsir): busur Bézier yang ditutup tali busur
+    tembereng = PathPatch(path_tembereng(r, theta_deg), facecolor='#AB47BC', alpha=0.4, edgecolor='#7B1FA2', linewidth=2)
+    ax.add_patch(tembereng)
+    
+    # Gambar busur
+    arc = Arc((0, 0), r*2, r*2, angle=0, theta1=0, theta2=theta_deg, color='red', linewidth=3)
+    ax.add_patch(arc)
+    
+    # Gambar tali busur
+    ax.plot([r, r * math.cos(theta_rad)], [0, r * math.sin(theta_rad)], 'g-', linewidth=2.5, label='Tali Busur')
+    
+    # Label
+    ax.text(r*0.5*math.cos(theta_rad/2), r*0.5*math.sin(theta_rad/2), f'θ = {theta_deg}°', 
+            fontsize=11, color='purple', fontweight='bold', ha='center')
+    
+    ax.plot(0, 0, 'ko', markersize=8)
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title(f'Tembereng Lingkaran (θ = {theta_deg}°)', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(7, 7))
+def draw_busur(ax, r, theta_deg):
+    
+    # Gambar lingkaran (border saja)
+    circle = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=2)
+    ax.add_patch(circle)
+    
+    # Gambar busur dengan penekanan
+    theta_rad = math.radians(theta_deg)
+    arc = Arc((0, 0), r*2, r*2, angle=0, theta1=0, theta2=theta_deg, color='#FF5722', linewidth=5)
+    ax.add_patch(arc)
+    
+    # Gambar jari-jari
+    ax.plot([0, r], [0, 0], 'b-', linewidth=2)
+    ax.plot([0, r * math.cos(theta_rad)], [0, r * math.sin(theta_rad)], 'b-', linewidth=2)
+    
+    # Panah menunjukkan busur
+    mid_angle = theta_rad / 2
+    ax.annotate('', xy=(r*0.8*math.cos(mid_angle+0.1), r*0.8*math.sin(mid_angle+0.1)),
+                xytext=(r*0.8*math.cos(mid_angle-0.1), r*0.8*math.sin(mid_angle-0.1)),
+                arrowprops=dict(arrowstyle='->', color='red', lw=2))
+    
+    ax.text(r*0.5*math.cos(mid_angle), r*0.5*math.sin(mid_angle)+0.5, 'Busur', 
+            fontsize=12, color='red', fontweight='bold', ha='center')
+    ax.text(r*0.3*math.cos(mid_angle), r*0.3*math.sin(mid_angle), f'θ = {theta_deg}°', 
+            fontsize=11, color='purple', fontweight='bold', ha='center')
+    
+    ax.plot(0, 0, 'ko', markersize=8)
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_title(f'Busur Lingkaran (θ = {theta_deg}°)', fontsize=14, fontweight='bold')
+
+@diagram(figsize=(7, 7))
+def draw_tali_busur(ax, r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    
+    # Gambar lingkaran
+    circle = Circle((0, 0), r, fill=False, color='#1976D2', linewidth=2)
+    ax.add_patch(circle)
+    
+    # Gambar busur
+    arc = Arc((0, 0), r*2, r*2, angle=0, theta1=0, theta2=theta_deg, color='orange', linewidth=2)
+    ax.add_patch(arc)
+    
+    # Gambar tali busur (garis hijau tebal)
+    x1, y1 = r, 0
+    x2, y2 = r * math.cos(theta_rad), r * math.sin(theta_rad)
+    ax.plot([x1, x2], [y1, y2], 'g-', linewidth=4, label='Tali Busur')
+    
+    # Titik ujung tali busur
+    ax.plot(x1, y1, 'go', markersize=10)
+    ax.plot(x2, y2, 'go', markersize=10)
+    
+    # Label sudut
+    ax.text(r*0.3*math.cos(theta_rad/2), r*0.3*math.sin(theta_rad/2), f'θ = {theta_deg}°', 
+            fontsize=11, color='purple', fontweight='bold', ha='center')
+    
+    # Label tali busur
+    mid_x = (x1 + x2) / 2
+    mid_y = (y1 + y2) / 2
+    ax.text(mid_x, mid_y + 0.5, 'Tali Busur', fontsize=11, color='green', fontweight='bold', ha='center')
+    
+    ax.plot(0, 0, 'ko', markersize=8)
+    ax.set_xlim(-r-1, r+1)
+    ax.set_ylim(-r-1, r+1)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title(f'Tali Busur Lingkaran (θ = {theta_deg}°)', fontsize=14, fontweight='bold')
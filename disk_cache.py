@@ -0,0 +1,271 @@
+import hashlib
+import os
+import stat
+import tempfile
+import threading
+import time
+import warnings
+from functools import lru_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa kunci antarproses
+    fcntl = None
+
+# Cache tingkat kedua di disk yang dipakai bersama oleh semua proses
+# Streamlit pada satu host (mis. beberapa worker di belakang reverse proxy).
+# Isi disimpan per kunci yang di-hash (content-addressed): kunci adalah tuple
+# yang sama dengan kunci render_cache (nama draw_*, argumen terkuantisasi,
+# format, dpi, tema, profil) ditambah versi kode yang menghasilkannya, jadi
+# perubahan diagram.py otomatis memakai file baru.
+#
+# - Direktori milik pengguna yang menjalankan aplikasi: default
+#   $XDG_CACHE_HOME/lingkaran (atau ~/.cache/lingkaran), dibuat dengan mode
+#   0700. Isi cache langsung dikirim ke siswa, jadi direktori milik pengguna
+#   lain atau yang bisa ditulis grup/orang lain tidak dipakai (cache disk
+#   dimatikan dengan peringatan), agar tidak bisa diisi diagram palsu.
+# - Tulis atomik: file sementara di direktori yang sama lalu os.replace,
+#   sehingga proses lain tidak pernah membaca file setengah jadi.
+# - Render sekali per host: saat miss, kunci file (flock, 256 stripe menurut
+#   hash) dipegang selama render; proses lain yang meminta kunci yang sama
+#   menunggu lalu membaca hasilnya dari disk.
+# - Eviction menurut ukuran: jika total melewati batas, file dengan mtime
+#   terlama dihapus (mtime diperbarui setiap hit, jadi ini LRU kasar).
+#   Pemindaian dilakukan paling sering setiap INTERVAL_SCAN detik dan hanya
+#   oleh satu proses dalam satu waktu.
+#
+# LINGKARAN_DISK_CACHE=<dir> memilih direktori, LINGKARAN_DISK_CACHE=0
+# mematikannya; LINGKARAN_DISK_CACHE_MB mengatur batas ukuran.
+
+def _dir_default():
+    basis = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    if os.path.isabs(basis):
+        return os.path.join(basis, 'lingkaran')
+    # Tanpa home: direktori temp dengan uid di namanya
+    uid = f'-{os.getuid()}' if hasattr(os, 'getuid') else ''
+    return os.path.join(tempfile.gettempdir(), f'lingkaran-cache{uid}')
+
+
+_env = os.environ.get('LINGKARAN_DISK_CACHE', '')
+AKTIF = _env != '0'
+DIR = _env if _env not in ('', '0') else _dir_default()
+MAKS_BYTES = int(float(os.environ.get('LINGKARAN_DISK_CACHE_MB', 256)) * 1024 * 1024)
+INTERVAL_SCAN = 30.0
+STRIPE_KUNCI = 256
+
+statistik = {'hit': 0, 'miss': 0, 'tulis': 0, 'gagal_tulis': 0, 'dibuang': 0, 'tunggu': 0}
+_lock = threading.Lock()
+_scan_terakhir = 0.0
+_dir_diperiksa = False
+
+
+def _periksa_dir():
+    # Alasan DIR tidak aman dipakai, atau None
+    try:
+        os.makedirs(DIR, mode=0o700, exist_ok=True)
+        info = os.lstat(DIR)
+    except OSError as e:
+        return f'tidak bisa dibuat ({e})'
+    if not stat.S_ISDIR(info.st_mode):
+        return 'bukan direktori (atau symlink)'
+    if hasattr(os, 'getuid'):
+        if info.st_uid != os.getuid():
+            return f'dimiliki uid {info.st_uid}, bukan {os.getuid()}'
+        if info.st_mode & 0o022:
+            return f'bisa ditulis grup/orang lain (mode {stat.S_IMODE(info.st_mode):o})'
+    return None
+
+
+def siap():
+    # True jika cache disk aktif dan DIR aman; diperiksa sekali per proses
+    global AKTIF, _dir_diperiksa
+    if AKTIF and not _dir_diperiksa:
+        with _lock:
+            if not _dir_diperiksa:
+                alasan = _periksa_dir()
+                if alasan:
+                    warnings.warn(f'Cache disk {DIR} {alasan}; cache disk dimatikan')
+                    AKTIF = False
+                _dir_diperiksa = True
+    return AKTIF
+
+
+@lru_cache(maxsize=None)
+def versi_file(*nama):
+    # Hash isi file kode (relatif ke folder aplikasi) untuk dimasukkan ke
+    # kunci, agar hasil dari kode lama tidak terpakai lagi
+    h = hashlib.sha256()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for n in nama:
+        with open(os.path.join(folder, n), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+def digest(kunci):
+    return hashlib.sha256(repr(kunci).encode()).hexdigest()
+
+
+def path(kunci):
+    h = digest(kunci)
+    return os.path.join(DIR, h[:2], h[2:])
+
+
+def baca(kunci):
+    p = path(kunci)
+    try:
+        with open(p, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    try:
+        os.utime(p)
+    except OSError:
+        pass  # file baru saja dibuang proses lain; data sudah terbaca
+    return data
+
+
+def tulis(kunci, data):
+    p = path(kunci)
+    os.makedirs(os.path.dirname(p), mode=0o700, exist_ok=True)
+    tmp = f'{p}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, p)
+    except OSError:
+        # Jangan tinggalkan file setengah jadi (mis. disk penuh)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    with _lock:
+        statistik['tulis'] += 1
+    evict_jika_perlu()
+
+
+class _KunciFile:
+    # flock eksklusif pada salah satu dari STRIPE_KUNCI file kunci
+    def __init__(self, kunci):
+        os.makedirs(os.path.join(DIR, 'kunci'), mode=0o700, exist_ok=True)
+        stripe = int(digest(kunci)[:4], 16) % STRIPE_KUNCI
+        self.path = os.path.join(DIR, 'kunci', f'{stripe:03d}')
+
+    def __enter__(self):
+        self.f = open(self.path, 'a+b')
+        if fcntl is not None:
+            try:
+                fcntl.flock(self.f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                with _lock:
+                    statistik['tunggu'] += 1
+                fcntl.flock(self.f, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.f, fcntl.LOCK_UN)
+        self.f.close()
+
+
+def ambil_atau_buat(kunci, buat):
+    # Kembalikan bytes dari disk, atau panggil buat() sekali per host lalu
+    # simpan hasilnya. Tanpa cache disk, langsung buat().
+    if not siap():
+        return buat()
+    data = baca(kunci)
+    if data is None:
+        with _KunciFile(kunci):
+            # Proses lain mungkin selesai membuatnya selagi kita menunggu kunci
+            data = baca(kunci)
+            if data is None:
+                data = buat()
+                try:
+                    tulis(kunci, data)
+                except OSError as e:
+                    # Disk penuh, kuota, atau direktori diubah: hasil yang sudah
+                    # dibuat tetap dipakai, cache disk hanya dilewati
+                    with _lock:
+                        statistik['gagal_tulis'] += 1
+                        pertama = statistik['gagal_tulis'] == 1
+                    if pertama:
+                        warnings.warn(f'Gagal menulis cache disk {DIR}: {e}')
+                with _lock:
+                    statistik['miss'] += 1
+                return data
+    with _lock:
+        statistik['hit'] += 1
+    return data
+
+
+def _semua_file():
+    for sub in os.scandir(DIR):
+        if not sub.is_dir() or sub.name == 'kunci':
+            continue
+        for e in os.scandir(sub.path):
+            if not e.name.endswith('.tmp'):
+                yield e
+
+
+def evict_jika_perlu(paksa=False):
+    global _scan_terakhir
+    sekarang = time.monotonic()
+    with _lock:
+        if not paksa and sekarang - _scan_terakhir < INTERVAL_SCAN:
+            return 0
+        _scan_terakhir = sekarang
+    if not os.path.isdir(DIR):
+        return 0
+    with open(os.path.join(DIR, '.evict'), 'a+b') as f:
+        if fcntl is not None:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0  # proses lain sedang memindai
+        file = []
+        for e in _semua_file():
+            try:
+                info = e.stat()
+            except FileNotFoundError:
+                continue
+            file.append((info.st_mtime, info.st_size, e.path))
+        total = sum(besar for _, besar, _ in file)
+        dibuang = 0
+        if total > MAKS_BYTES:
+            # Buang sampai 90% batas agar tidak memindai ulang setiap tulis
+            for _, besar, p in sorted(file):
+                if total <= MAKS_BYTES * 0.9:
+                    break
+                try:
+                    os.remove(p)
+                except FileNotFoundError:
+                    pass
+                total -= besar
+                dibuang += 1
+        with _lock:
+            statistik['dibuang'] += dibuang
+        return dibuang
+
+
+def ukuran():
+    # (jumlah file, total bytes) saat ini
+    jumlah = total = 0
+    if os.path.isdir(DIR):
+        for e in _semua_file():
+            try:
+                total += e.stat().st_size
+            except FileNotFoundError:
+                continue
+            jumlah += 1
+    return jumlah, total
+
+
+def hapus_semua():
+    if not siap():
+        return
+    for e in list(_semua_file()) if os.path.isdir(DIR) else []:
+        try:
+            os.remove(e.path)
+        except FileNotFoundError:
+            pass
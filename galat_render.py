@@ -0,0 +1,8 @@
+# Exception render yang ditangkap di luar render_pool (prefetch, pemanasan,
+# api_server). Sengaja tanpa dependensi: render_pool memuat matplotlib dan
+# membuat pool thread, yang tidak boleh terjadi hanya karena sebuah modul
+# ingin menangkap exception ini (mis. di mode LINGKARAN_RENDERER=svg).
+
+
+class RenderPoolBusy(RuntimeError):
+    pass
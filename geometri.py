@@ -0,0 +1,242 @@
+import numpy as np
+
+# Rumus-rumus lingkaran sebagai kernel NumPy murni. Semua fungsi menerima
+# skalar maupun array (dengan broadcasting) dan mengembalikan float64; input
+# skalar menghasilkan skalar. Sudut selalu dalam derajat, seperti di slide.
+#
+# Penanganan kasus tepi:
+# - r = 0, θ = 0, atau a = r menghasilkan 0 (bukan NaN).
+# - Input di luar domain (r < 0, θ di luar [0, 360], a di luar [0, r],
+#   L/K < 0) menghasilkan NaN, bukan exception, agar satu baris data yang
+#   buruk tidak menggagalkan perhitungan satu array penuh.
+#
+# Modul ini hanya bergantung pada NumPy (dipakai juga oleh CLI dan API pada
+# array besar); durasi fase 'rumus' dicatat oleh pemanggil (lihat diagnostik).
+#
+# Fungsi kebalikan (sudut_dari_*, jari_jari_dari_*) mencari θ atau r dari
+# besaran yang diketahui. Semuanya bentuk tertutup kecuali θ dari luas
+# tembereng, yang diselesaikan dengan iterasi Halley tervektorisasi (lihat
+# _balik_theta_kurang_sin). Nilai yang sedikit melewati batas domain karena
+# pembulatan (mis. L = πr² pada θ = 360°) dianggap tepat di batas.
+
+ITERASI_MAKS = 8
+# Langkah relatif terkecil sebelum iterasi dianggap konvergen. Dengan
+# konvergensi kubik, galat setelah langkah sekecil ini jauh di bawah presisi
+# float64; batas yang lebih ketat tidak tercapai karena t - sin t sendiri
+# hanya presisi ~1e-13 (relatif) di sekitar t = 0.1.
+TOLERANSI = 1e-12
+
+
+def _hasil(x):
+    # Array 0-dimensi dikembalikan sebagai skalar numpy
+    return x[()] if isinstance(x, np.ndarray) and x.ndim == 0 else x
+
+
+def _nonneg(x):
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(x >= 0, x, np.nan)
+
+
+def _sudut(theta_deg):
+    theta = np.asarray(theta_deg, dtype=np.float64)
+    return np.where((theta >= 0) & (theta <= 360), theta, np.nan)
+
+
+def _theta_kurang_sin(t):
+    # t - sin(t) untuk t dalam radian. Untuk t kecil kedua suku hampir sama
+    # sehingga pengurangan langsung kehilangan presisi; pakai deret Taylor.
+    t = np.asarray(t, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        return np.where(np.abs(t) < 0.1, _deret_theta_kurang_sin(t), t - np.sin(t))
+
+
+def _deret_theta_kurang_sin(t):
+    # t³/6 - t⁵/120 + t⁷/5040 - t⁹/362880, cukup presisi untuk |t| < 0.1
+    t2 = t * t
+    return t * t2 / 6 * (1 - t2 / 20 * (1 - t2 / 42 * (1 - t2 / 72)))
+
+
+def _batas_atas(x, batas):
+    # x <= batas; sedikit di atas batas (galat pembulatan) dipotong ke batas
+    with np.errstate(invalid='ignore'):
+        return np.where(x <= batas * (1 + 1e-12), np.minimum(x, batas), np.nan)
+
+
+def _balik_theta_kurang_sin(c, toleransi=TOLERANSI, iterasi_maks=ITERASI_MAKS):
+    # Selesaikan t - sin(t) = c untuk c di [0, 2π] (t di [0, 2π]). Tidak ada
+    # bentuk tertutup; dipakai iterasi Halley pada semua elemen sekaligus.
+    # - Simetri g(2π - t) = 2π - g(t), jadi cukup diselesaikan untuk c <= π.
+    # - Tebakan awal dari deret c = t³/6 - t⁵/120 + ... yang dibalik:
+    #   t ≈ x (1 + x²/60 + x⁴/1400 + x⁶/25200) dengan x = ∛(6c). Galat awal
+    #   < 1.1% di seluruh [0, π], jadi dua iterasi (konvergensi kubik) sudah
+    #   mencapai presisi float64 dan iterasi ketiga memastikannya.
+    # - Satu sin per iterasi: f'' = sin t, |cos t| = √((1 - sin t)(1 + sin t)),
+    #   dan f' = 1 - cos t = sin²t / (1 + |cos t|) untuk t < π/2 (tanpa
+    #   pengurangan dua bilangan yang hampir sama), 1 + |cos t| untuk t >= π/2.
+    #   Galat |cos t| di sekitar π/2 hanya mengenai turunan, bukan f, jadi
+    #   titik akhirnya tetap tepat. Untuk t < 0.1 f memakai deret (hanya
+    #   pada elemen itu) agar presisi.
+    # Hasil: (t, info) dengan info = {'iterasi', 'residu_maks', 'konvergen'};
+    # residu_maks adalah |t - sin t - c| terbesar sebelum langkah terakhir,
+    # batas atas residu hasil akhir.
+    c = np.asarray(c, dtype=np.float64)
+    bentuk = c.shape
+    c = c.ravel()
+    cermin = c > np.pi
+    c = np.where(cermin, 2 * np.pi - c, c)
+    x = np.cbrt(6 * c)
+    x2 = x * x
+    t = x * (1 + x2 / 60 * (1 + x2 * (3 / 70 + x2 / 420)))
+    konvergen = False
+    iterasi = 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        while iterasi < iterasi_maks:
+            iterasi += 1
+            d2 = np.sin(t)
+            k = np.sqrt((1 - d2) * (1 + d2))
+            d1 = np.where(t < np.pi / 2, d2 * d2 / (1 + k), 1 + k)
+            f = t - d2
+            f -= c
+            kecil = t < 0.1
+            if kecil.any():
+                f[kecil] = _deret_theta_kurang_sin(t[kecil]) - c[kecil]
+            langkah = 2 * f * d1 / (2 * d1 * d1 - f * d2)
+            # c = 0 memberi 0/0 di t = 0, yang sudah merupakan jawabannya
+            langkah = np.where(np.isfinite(langkah), langkah, 0.0)
+            t = np.clip(t - langkah, 0.0, np.pi)
+            if not np.any(np.abs(langkah) > toleransi * t):
+                konvergen = True
+                break
+        residu = np.abs(f)
+    info = {'iterasi': iterasi, 'residu_maks': float(np.max(residu, where=~np.isnan(residu), initial=0.0)),
+            'konvergen': konvergen}
+    return np.where(cermin, 2 * np.pi - t, t).reshape(bentuk), info
+
+
+def luas_lingkaran(r):
+    r = _nonneg(r)
+    return _hasil(np.pi * r * r)
+
+
+def keliling_lingkaran(r):
+    return _hasil(2 * np.pi * _nonneg(r))
+
+
+def luas_juring(r, theta_deg):
+    r = _nonneg(r)
+    return _hasil(_sudut(theta_deg) / 360 * np.pi * r * r)
+
+
+def panjang_busur(r, theta_deg):
+    return _hasil(_sudut(theta_deg) / 360 * 2 * np.pi * _nonneg(r))
+
+
+def luas_segitiga_juring(r, theta_deg):
+    # Luas segitiga yang dibentuk dua jari-jari dan tali busur: ½ × r² × sin(θ)
+    r = _nonneg(r)
+    return _hasil(0.5 * r * r * np.sin(np.radians(_sudut(theta_deg))))
+
+
+def luas_tembereng(r, theta_deg):
+    # Luas Juring - Luas Segitiga = ½ × r² × (θ - sin θ), θ dalam radian
+    r = _nonneg(r)
+    return _hasil(0.5 * r * r * _theta_kurang_sin(np.radians(_sudut(theta_deg))))
+
+
+def panjang_tali_busur(r, theta_deg):
+    return _hasil(2 * _nonneg(r) * np.sin(np.radians(_sudut(theta_deg)) / 2))
+
+
+def tali_busur_dari_jarak(r, a):
+    # t = 2 × √(r² - a²), dengan a = jarak dari pusat ke tali busur
+    r = _nonneg(r)
+    a = _nonneg(a)
+    with np.errstate(invalid='ignore'):
+        selisih = np.where(a <= r, r * r - a * a, np.nan)
+        return _hasil(2 * np.sqrt(selisih))
+
+
+def sudut_dari_jarak(r, a):
+    # Sudut pusat (derajat) dari tali busur yang berjarak a dari pusat.
+    # r = 0 tidak punya sudut yang terdefinisi -> NaN.
+    r = _nonneg(r)
+    a = _nonneg(a)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rasio = np.where((a <= r) & (r > 0), a / r, np.nan)
+        return _hasil(2 * np.degrees(np.arccos(np.clip(rasio, 0, 1))))
+
+
+def jari_jari_dari_luas(luas):
+    return _hasil(np.sqrt(_nonneg(luas) / np.pi))
+
+
+def jari_jari_dari_keliling(keliling):
+    return _hasil(_nonneg(keliling) / (2 * np.pi))
+
+
+def sudut_dari_busur(r, panjang):
+    # θ = s / r (radian); s maksimal keliling 2πr
+    r = _nonneg(r)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        theta = np.where(r > 0, np.degrees(_nonneg(panjang) / r), np.nan)
+    return _hasil(_batas_atas(theta, 360.0))
+
+
+def jari_jari_dari_busur(panjang, theta_deg):
+    # r = s / θ (radian); θ = 0 tidak menentukan r -> NaN
+    theta = _sudut(theta_deg)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _hasil(np.where(theta > 0, _nonneg(panjang) / np.radians(theta), np.nan))
+
+
+def sudut_dari_luas_juring(r, luas):
+    # θ = 360° × L / (πr²); L maksimal luas lingkaran
+    r = _nonneg(r)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        theta = np.where(r > 0, 360 * _nonneg(luas) / (np.pi * r * r), np.nan)
+    return _hasil(_batas_atas(theta, 360.0))
+
+
+def jari_jari_dari_luas_juring(luas, theta_deg):
+    # r = √(360° × L / (πθ))
+    theta = _sudut(theta_deg)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _hasil(np.where(theta > 0, np.sqrt(360 * _nonneg(luas) / (np.pi * theta)), np.nan))
+
+
+def sudut_dari_tali_busur(r, panjang):
+    # θ = 2 × arcsin(t / 2r). Tali busur yang sama juga membatasi busur besar
+    # 360° - θ; yang dikembalikan sudut busur kecil (0° - 180°), seperti
+    # kalkulator tali busur.
+    r = _nonneg(r)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rasio = np.where(r > 0, _nonneg(panjang) / (2 * r), np.nan)
+    return _hasil(2 * np.degrees(np.arcsin(_batas_atas(rasio, 1.0))))
+
+
+def jari_jari_dari_tali_busur(panjang, theta_deg):
+    # r = t / (2 sin(θ/2)); θ = 0° atau 360° tidak menentukan r -> NaN
+    theta = _sudut(theta_deg)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _hasil(np.where((theta > 0) & (theta < 360),
+                               _nonneg(panjang) / (2 * np.sin(np.radians(theta) / 2)), np.nan))
+
+
+def sudut_dari_luas_tembereng(r, luas, laporan=False):
+    # θ dari L = ½ × r² × (θ - sin θ), yaitu θ - sin θ = 2L / r² (lihat
+    # _balik_theta_kurang_sin). Dengan laporan=True hasilnya (θ, info
+    # konvergensi).
+    r = _nonneg(r)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        c = np.where(r > 0, 2 * _nonneg(luas) / (r * r), np.nan)
+    t, info = _balik_theta_kurang_sin(_batas_atas(c, 2 * np.pi))
+    theta = _hasil(np.degrees(t))
+    return (theta, info) if laporan else theta
+
+
+def jari_jari_dari_luas_tembereng(luas, theta_deg):
+    # r = √(2L / (θ - sin θ)), θ dalam radian
+    theta = _sudut(theta_deg)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _hasil(np.where(theta > 0, np.sqrt(2 * _nonneg(luas) / _theta_kurang_sin(np.radians(theta))),
+                               np.nan))
@@ -0,0 +1,32 @@
+import os
+from functools import partial
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+# Diagram interaktif yang digambar di browser (komponen/lingkaran_interaktif,
+# HTML + JS tanpa build step). Selama pegangan r/θ diseret, gambar dan
+# besaran dihitung ulang di browser tanpa rerun; nilai akhir baru dikirim ke
+# Python saat pegangan dilepas. Protokol pesan komponen Streamlit (postMessage):
+#   iframe -> Streamlit: streamlit:componentReady, streamlit:setFrameHeight,
+#                        streamlit:setComponentValue {r, theta}
+#   Streamlit -> iframe: streamlit:render {args: jenis, r, theta, theta_maks}
+
+DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'komponen', 'lingkaran_interaktif')
+
+_komponen = components.declare_component('lingkaran_interaktif', path=DIR)
+
+
+def _terapkan(key, key_r, key_theta):
+    # Callback sebelum rerun: salin nilai dari komponen ke number_input r/θ,
+    # sehingga kalkulator, rumus, dan mode massal memakai nilai yang sama
+    nilai = st.session_state.get(key)
+    if nilai:
+        st.session_state[key_r] = float(nilai['r'])
+        st.session_state[key_theta] = float(nilai['theta'])
+
+
+def lingkaran_interaktif(jenis, r, theta, key_r, key_theta, theta_maks=360.0):
+    key = f'{key_r}_interaktif'
+    return _komponen(jenis=jenis, r=float(r), theta=float(theta), theta_maks=float(theta_maks),
+                     key=key, default=None, on_change=partial(_terapkan, key, key_r, key_theta))
@@ -0,0 +1,186 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# Deteksi kebocoran memori pada rerun berulang. Setiap slide dijalankan ribuan
+# kali lewat streamlit.testing (AppTest) dengan input yang berganti-ganti, atau
+# setiap draw_* dirender ribuan kali langsung lewat render_pool. Setelah
+# pemanasan, snapshot tracemalloc diambil berkala; pertumbuhan per rerun
+# dihitung dengan regresi linear memori yang dilacak terhadap nomor rerun, dan
+# lokasi alokasi yang paling bertambah dilaporkan. Keluar dengan kode 1 jika
+# pertumbuhan steady-state melebihi batas.
+#
+# Struktur yang memang dibatasi (jendela histogram diagnostik, LRU cache
+# render, tabel titik lingkaran) dikecualikan karena bisa terus terisi sampai
+# penuh selama run pendek; pakai --semua untuk ikut melacaknya.
+#
+# tracemalloc memperlambat setiap alokasi (±3× untuk rerun slide, ±6× untuk
+# draw_* dengan 1 frame; jauh lebih lambat dengan traceback dalam), jadi
+# default hanya 1 frame per alokasi. Pakai --frame 10 untuk menelusuri
+# pemanggil lokasi yang dilaporkan.
+#
+# Contoh:
+#   python leakcheck.py --rerun 2000
+#   python leakcheck.py --mode draw --rerun 1000 --batas 512
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lingkaran_app.py')
+BATAS_DEFAULT = 1024  # bytes per rerun
+RERUN_DEFAULT = {'slide': 1000, 'draw': 200}
+
+DIBATASI = ('diagnostik.py', 'render_cache.py', 'vertex_cache.py')
+
+# Slide -> (key widget, nilai yang dipakai bergantian)
+INPUT_SLIDE = {
+    'luas': (None, (7.0, 7.1, 7.2, 14.0, 0.5)),
+    'keliling': ('keliling_r', (7.0, 7.1, 7.2, 14.0, 0.5)),
+    'juring': ('juring_theta', (60.0, 61.0, 90.0, 359.0, 1.0)),
+    'tembereng': ('tembereng_theta', (60.0, 61.0, 90.0, 359.0, 1.0)),
+    'jari_jari': ('jari_d', (14.0, 14.1, 20.0, 0.5, 100.0)),
+    'diameter': ('diameter_r', (7.0, 7.1, 7.2, 14.0, 0.5)),
+    'busur': ('busur_theta', (60.0, 61.0, 90.0, 359.0, 1.0)),
+    'tali_busur': ('tali_theta', (60.0, 61.0, 90.0, 179.0, 1.0)),
+}
+
+
+def langkah_slide(slide, tanpa_cache):
+    from streamlit.testing.v1 import AppTest
+
+    import disk_cache
+    import pemanasan
+    import prefetch
+    import render_cache
+
+    # Render pemanasan dan prefetch di latar belakang akan ikut terukur sebagai
+    # alokasi
+    pemanasan.AKTIF = False
+    prefetch.AKTIF = False
+    if tanpa_cache:
+        disk_cache.AKTIF = False
+    widget, nilai = INPUT_SLIDE[slide]
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.session_state.current_slide = slide
+    at.run()
+
+    def langkah(i):
+        if tanpa_cache:
+            render_cache.cache.clear()
+        ni = at.number_input[0] if widget is None else at.number_input(key=widget)
+        ni.set_value(nilai[i % len(nilai)]).run()
+        if at.exception:
+            raise RuntimeError(f'Slide {slide} gagal: {at.exception[0].value}')
+    return langkah
+
+
+def langkah_draw(nama, dpi):
+    from diagram import DIAGRAMS
+    from lembar_kerja import argumen_diagram
+    from render_pool import buat_canvas, render_ke_bytes
+
+    fig, ax = buat_canvas()
+    r_nilai = (7.0, 7.1, 10.0, 0.5, 100.0)
+    theta_nilai = (60.0, 61.0, 90.0, 359.0, 1.0)
+
+    def langkah(i):
+        args = argumen_diagram(nama, r_nilai[i % 5], theta_nilai[(i // 5) % 5])
+        render_ke_bytes(fig, ax, DIAGRAMS[nama], args, dpi)
+    return langkah
+
+
+def kemiringan(xs, ys):
+    # Regresi linear sederhana: bytes per rerun
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    sxx = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx if sxx else 0.0
+
+
+def periksa(langkah, rerun, pemanasan, interval, filter_, frame):
+    for i in range(pemanasan):
+        langkah(i)
+    gc.collect()
+    tracemalloc.start(frame)
+    try:
+        titik = []
+        awal = None
+        for i in range(rerun):
+            langkah(pemanasan + i)
+            if i % interval == 0 or i == rerun - 1:
+                gc.collect()
+                snapshot = tracemalloc.take_snapshot().filter_traces(filter_)
+                ukuran = sum(s.size for s in snapshot.statistics('filename'))
+                titik.append((i, ukuran))
+                if awal is None:
+                    awal = snapshot
+        akhir = snapshot
+    finally:
+        tracemalloc.stop()
+    xs, ys = zip(*titik)
+    # Paruh pertama setelah pemanasan masih bisa berisi pengisian cache
+    # internal; kemiringan diambil dari paruh kedua (steady state)
+    tengah = len(xs) // 2
+    return {
+        'per_rerun': kemiringan(xs[tengah:], ys[tengah:]),
+        'total': ys[-1] - ys[0],
+        'lokasi': akhir.compare_to(awal, 'traceback')[:10],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Deteksi kebocoran memori pada rerun berulang.')
+    parser.add_argument('--mode', choices=['slide', 'draw'], default='slide')
+    parser.add_argument('--target', nargs='+', help='Slide atau draw_* yang diperiksa (default: semua)')
+    parser.add_argument('--rerun', type=int, default=None,
+                        help='Jumlah rerun yang diukur per target (default 1000 slide, 200 draw)')
+    parser.add_argument('--pemanasan', type=int, default=100, help='Rerun sebelum pengukuran dimulai')
+    parser.add_argument('--interval', type=int, default=50, help='Ambil snapshot setiap N rerun')
+    parser.add_argument('--batas', type=float, default=BATAS_DEFAULT,
+                        help=f'Pertumbuhan maksimum per rerun dalam bytes (default {BATAS_DEFAULT})')
+    parser.add_argument('--tanpa-cache', action='store_true',
+                        help='Kosongkan cache render (dan lewati cache disk) agar draw_* selalu dijalankan')
+    parser.add_argument('--dpi', type=int, default=50, help='DPI untuk mode draw')
+    parser.add_argument('--semua', action='store_true', help='Ikut lacak struktur yang dibatasi')
+    parser.add_argument('--frame', type=int, default=1, help='Kedalaman traceback tracemalloc')
+    parser.add_argument('--top', type=int, default=5, help='Jumlah lokasi alokasi yang ditampilkan')
+    args = parser.parse_args(argv)
+    rerun = args.rerun or RERUN_DEFAULT[args.mode]
+
+    filter_ = [tracemalloc.Filter(False, tracemalloc.__file__),
+               tracemalloc.Filter(False, '<frozen importlib._bootstrap*>')]
+    if not args.semua:
+        filter_ += [tracemalloc.Filter(False, f'*{os.sep}{nama}') for nama in DIBATASI]
+
+    if args.mode == 'slide':
+        target = args.target or list(INPUT_SLIDE)
+        buat = lambda t: langkah_slide(t, args.tanpa_cache)  # noqa: E731
+    else:
+        import diagram
+
+        target = args.target or list(diagram.DIAGRAMS)
+        buat = lambda t: langkah_draw(t, args.dpi)  # noqa: E731
+
+    gagal = []
+    for t in target:
+        mulai = time.perf_counter()
+        hasil = periksa(buat(t), rerun, args.pemanasan, args.interval, filter_, args.frame)
+        status = 'GAGAL' if hasil['per_rerun'] > args.batas else 'ok'
+        print(f"{status:5s} {t:28s} {hasil['per_rerun']:10.1f} B/rerun   "
+              f"total {hasil['total'] / 1024:+9.1f} KB   ({time.perf_counter() - mulai:.0f} s)")
+        if status == 'GAGAL':
+            gagal.append(t)
+            for stat in hasil['lokasi'][:args.top]:
+                print(f"        {stat.size_diff / 1024:+9.1f} KB  {stat.count_diff:+7d} blok")
+                for frame in stat.traceback:
+                    print(f"            {frame.filename}:{frame.lineno}")
+    print()
+    if gagal:
+        print(f"GAGAL: pertumbuhan > {args.batas:.0f} B/rerun pada {', '.join(gagal)}")
+        return 1
+    print(f"OK: semua target di bawah {args.batas:.0f} B/rerun")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Render massal diagram untuk lembar kerja yang dicetak, tanpa Streamlit.
+# Untuk setiap pasangan (r, θ) semua jenis diagram dirender ke PNG/SVG memakai
+# process pool; setiap proses worker memakai satu Figure/Agg canvas (lihat
+# render_pool.render_ke_bytes). Nama file berbasis hash isi (jenis diagram,
+# argumen, format, dpi, kode gambar, dan versi matplotlib), sehingga diagram
+# yang tidak berubah dilewati saat dijalankan ulang. Output dibuat
+# deterministik (tanpa tanggal/versi di metadata) agar hash dan isi file stabil.
+#
+# Contoh:
+#   python lembar_kerja.py --r 7 14 --theta 30 60 90 --format png pdf
+#   python lembar_kerja.py --param soal.csv --diagram juring tembereng --workers 4
+
+DIR_DEFAULT = 'lembar_kerja'
+
+# Metadata yang dikosongkan agar output byte-per-byte sama antar run
+METADATA = {
+    'png': {'Software': None},
+    'svg': {'Date': None, 'Creator': None},
+    'pdf': {'CreationDate': None, 'ModDate': None, 'Producer': None, 'Creator': None},
+}
+
+
+# Argumen setiap jenis diagram diturunkan dari (r, θ)
+def argumen_diagram(nama, r, theta):
+    if nama == 'draw_circle_with_diameter':
+        return (2 * r,)
+    if nama in ('draw_juring', 'draw_tembereng', 'draw_busur', 'draw_tali_busur'):
+        return (r, theta)
+    return (r,)
+
+
+def versi_kode():
+    # Sama dengan kunci cache render: perubahan kode gambar (semua file di
+    # render_cache.FILE_KODE) atau versi matplotlib menghasilkan nama file baru
+    import render_cache
+
+    return list(render_cache.versi_kode())
+
+
+def nama_file(nama, isi, fmt):
+    # isi: semua hal yang menentukan hasil render (argumen, dpi, versi kode)
+    digest = hashlib.sha256(json.dumps([nama, isi, fmt]).encode()).hexdigest()[:16]
+    return f'{nama.removeprefix("draw_")}-{digest}.{fmt}'
+
+
+def _bulat(args):
+    return [round(float(a), 6) for a in args]
+
+
+_CANVAS = None
+
+
+def _init_worker():
+    import matplotlib
+
+    global _CANVAS
+    matplotlib.rcParams['svg.hashsalt'] = 'lingkaran'
+    from render_pool import buat_canvas
+
+    _CANVAS = buat_canvas()
+
+
+def _render_ke_file(nama, args, fmt, dpi, path):
+    import diagram
+    from render_pool import render_ke_bytes
+
+    fig, ax = _CANVAS
+    data = render_ke_bytes(fig, ax, diagram.DIAGRAMS[nama], args, dpi, fmt, METADATA[fmt])
+    # Tulis atomik: file setengah jadi tidak pernah terlihat dengan nama final
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+def _render_pdf(item, path, dpi):
+    # PDF multi-halaman ditulis dari satu proses karena PdfPages tidak bisa
+    # menggabungkan halaman dari proses lain; satu canvas dipakai ulang.
+    import diagram
+    from matplotlib.backends.backend_pdf import PdfPages
+    from render_pool import buat_canvas
+
+    fig, ax = buat_canvas()
+    # Seperti render_ke_bytes: dpi figure = dpi output, agar jumlah titik
+    # lingkaran (vertex_cache.jari_jari_px) sesuai resolusi cetak
+    fig.set_dpi(dpi)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with PdfPages(tmp, metadata=METADATA['pdf']) as pdf:
+        for nama, args in item:
+            ax.cla()
+            fig.set_size_inches(diagram.DIAGRAMS[nama].figsize)
+            diagram.DIAGRAMS[nama](ax, *args)
+            pdf.savefig(fig, dpi=dpi, bbox_inches='tight')
+    os.replace(tmp, path)
+
+
+def baca_parameter(path):
+    import pandas as pd
+
+    import batch
+    import geometri
+
+    df = batch.normalisasi_kolom(pd.read_csv(path))
+    r = df['r'].to_numpy(float) if 'r' in df else df['d'].to_numpy(float) / 2
+    if 'theta' in df:
+        theta = df['theta'].to_numpy(float)
+    else:
+        theta = geometri.sudut_dari_jarak(r, df['a'].to_numpy(float))
+    return [(float(a), float(b)) for a, b in zip(r, theta)]
+
+
+def render_lembar_kerja(parameter, out_dir=DIR_DEFAULT, diagram_dipilih=None,
+                        formats=('png',), dpi=150, workers=None):
+    import diagram
+
+    os.makedirs(out_dir, exist_ok=True)
+    versi = versi_kode()
+    nama_diagram = diagram_dipilih or list(diagram.DIAGRAMS)
+
+    # Kumpulkan pekerjaan unik (diagram 1 parameter tidak bergantung θ)
+    pekerjaan = {}
+    indeks = []
+    for r, theta in parameter:
+        for nama in nama_diagram:
+            args = argumen_diagram(nama, r, theta)
+            for fmt in formats:
+                if fmt == 'pdf':
+                    continue
+                fname = nama_file(nama, [_bulat(args), dpi, versi], fmt)
+                pekerjaan.setdefault(fname, (nama, args, fmt))
+                indeks.append({'r': r, 'theta': theta, 'diagram': nama, 'format': fmt, 'file': fname})
+
+    laporan = {'dirender': 0, 'dilewati': 0, 'bytes': 0}
+    belum = {f: job for f, job in pekerjaan.items()
+             if not os.path.exists(os.path.join(out_dir, f))}
+    laporan['dilewati'] = len(pekerjaan) - len(belum)
+    if belum:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+            futures = [ex.submit(_render_ke_file, nama, args, fmt, dpi, os.path.join(out_dir, f))
+                       for f, (nama, args, fmt) in sorted(belum.items())]
+            for fut in futures:
+                laporan['bytes'] += fut.result()
+                laporan['dirender'] += 1
+
+    if 'pdf' in formats:
+        halaman = [(nama, argumen_diagram(nama, r, theta))
+                   for r, theta in parameter for nama in nama_diagram]
+        fname = nama_file('lembar_kerja', [[[n, _bulat(a)] for n, a in halaman], dpi, versi], 'pdf')
+        path = os.path.join(out_dir, fname)
+        if os.path.exists(path):
+            laporan['dilewati'] += 1
+        else:
+            _render_pdf(halaman, path, dpi)
+            laporan['dirender'] += 1
+            laporan['bytes'] += os.path.getsize(path)
+        indeks.append({'r': None, 'theta': None, 'diagram': 'semua', 'format': 'pdf', 'file': fname})
+
+    with open(os.path.join(out_dir, 'indeks.json'), 'w') as f:
+        json.dump(indeks, f, indent=1)
+    return laporan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Render diagram lingkaran untuk lembar kerja (PNG/SVG/PDF).')
+    sumber = parser.add_mutually_exclusive_group(required=True)
+    sumber.add_argument('--param', help='CSV berisi kolom r (atau d) dan theta (atau a)')
+    sumber.add_argument('--r', type=float, nargs='+', help='Daftar jari-jari')
+    parser.add_argument('--theta', type=float, nargs='+', default=[60.0],
+                        help='Daftar sudut (derajat) untuk --r; semua kombinasi dirender')
+    parser.add_argument('--diagram', nargs='+',
+                        help='Jenis diagram, mis. juring tembereng (default: semua)')
+    parser.add_argument('--format', nargs='+', default=['png'], choices=['png', 'svg', 'pdf'])
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--out', default=DIR_DEFAULT, help=f'Folder output (default: {DIR_DEFAULT})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Jumlah proses worker (default: jumlah CPU)')
+    args = parser.parse_args(argv)
+
+    import diagram
+
+    if args.param:
+        parameter = baca_parameter(args.param)
+    else:
+        parameter = [(r, t) for r in args.r for t in args.theta]
+    dipilih = None
+    if args.diagram:
+        dipilih = []
+        for nama in args.diagram:
+            nama = nama if nama.startswith('draw_') else f'draw_{nama}'
+            if nama not in diagram.DIAGRAMS:
+                parser.error(f'Diagram tidak dikenal: {nama}. Pilihan: {", ".join(diagram.DIAGRAMS)}')
+            dipilih.append(nama)
+
+    mulai = time.perf_counter()
+    laporan = render_lembar_kerja(parameter, args.out, dipilih, tuple(args.format),
+                                  args.dpi, args.workers)
+    print(f"{laporan['dirender']} file dirender, {laporan['dilewati']} dilewati (sudah ada), "
+          f"{laporan['bytes'] / 1024:.0f} KB dalam {time.perf_counter() - mulai:.1f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import batch
+
+# Antarmuka baris perintah untuk menghitung komponen lingkaran dari data yang
+# sangat besar (puluhan juta baris). Input CSV atau .npy dibaca per potongan
+# (chunk) berukuran tetap, dihitung lewat geometri, lalu langsung ditulis ke
+# output sehingga pemakaian memori tetap terbatas berapa pun ukuran datanya.
+#
+# Contoh:
+#   python lingkaran_cli.py data.csv hasil.csv
+#   python lingkaran_cli.py data.npy hasil.npy --kolom r,theta --workers 4
+
+
+def baca_csv(path, chunk):
+    # Pemisah (koma, titik koma, atau tab) dideteksi dari baris header
+    # seperti mode massal di slide (batch.baca_csv)
+    import pandas as pd
+
+    with open(path, encoding='utf-8-sig') as f:
+        sep = batch.deteksi_pemisah(f.readline())
+    for df in pd.read_csv(path, chunksize=chunk, sep=sep, encoding='utf-8-sig'):
+        df = batch.normalisasi_kolom(df)
+        kolom = {nama: pd.to_numeric(df[nama], errors='coerce').to_numpy(np.float64)
+                 for nama in ('r', 'd', 'theta', 'a') if nama in df}
+        if 'theta' in kolom:
+            kolom.pop('a', None)
+        yield kolom
+
+
+def baca_npy(path, chunk, nama_kolom):
+    # Array 2-D (n, k) dengan urutan kolom dari --kolom, atau structured array
+    # dengan nama field yang dikenali. Dibaca via mmap, jadi hanya potongan
+    # yang sedang diproses yang berada di memori.
+    arr = np.load(path, mmap_mode='r')
+    if arr.dtype.names:
+        nama_kolom = [batch.ALIAS_KOLOM.get(n.lower(), n) for n in arr.dtype.names]
+        sumber = {std: arr[asli] for std, asli in zip(nama_kolom, arr.dtype.names)
+                  if std in ('r', 'd', 'theta', 'a')}
+    else:
+        if arr.ndim != 2 or arr.shape[1] != len(nama_kolom):
+            raise batch.BatchError(
+                f'Array {arr.shape} tidak cocok dengan kolom {",".join(nama_kolom)}')
+        sumber = {nama: arr[:, i] for i, nama in enumerate(nama_kolom)}
+    batch.periksa_kolom(sumber)
+    if 'theta' in sumber:
+        sumber.pop('a', None)
+    n = len(next(iter(sumber.values())))
+    for mulai in range(0, n, chunk):
+        yield {nama: np.array(kol[mulai:mulai + chunk], dtype=np.float64)
+               for nama, kol in sumber.items()}
+
+
+def hitung_potongan(kolom):
+    return batch.hitung_kolom(**kolom)
+
+
+class PenulisCsv:
+    def __init__(self, path):
+        import pyarrow.csv as pa_csv
+
+        self._pa_csv = pa_csv
+        self._path = path
+        self._writer = None
+
+    def tulis(self, hasil):
+        import pyarrow as pa
+
+        tabel = pa.table({nama: np.round(kol, 6) for nama, kol in hasil.items()})
+        if self._writer is None:
+            self._writer = self._pa_csv.CSVWriter(self._path, tabel.schema)
+        self._writer.write_table(tabel)
+
+    def tutup(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class PenulisNpy:
+    # Jumlah baris total belum diketahui saat menulis (input CSV), jadi data
+    # ditulis mentah ke file sementara lalu diberi header .npy di akhir.
+    # Hasilnya structured array dengan satu field per kolom.
+    def __init__(self, path):
+        self._path = path
+        self._tmp = open(path + '.tmp', 'wb')
+        self._dtype = None
+        self._baris = 0
+
+    def tulis(self, hasil):
+        if self._dtype is None:
+            self._dtype = np.dtype([(nama, '<f8') for nama in hasil])
+        rec = np.empty(len(hasil['r']), dtype=self._dtype)
+        for nama, kol in hasil.items():
+            rec[nama] = kol
+        rec.tofile(self._tmp)
+        self._baris += len(rec)
+
+    def tutup(self):
+        self._tmp.close()
+        dtype = self._dtype or np.dtype([('r', '<f8')])
+        with open(self._path, 'wb') as out, open(self._path + '.tmp', 'rb') as src:
+            np.lib.format.write_array_header_1_0(
+                out, {'descr': np.lib.format.dtype_to_descr(dtype),
+                      'fortran_order': False, 'shape': (self._baris,)})
+            while True:
+                blok = src.read(16 * 1024 * 1024)
+                if not blok:
+                    break
+                out.write(blok)
+        os.remove(self._path + '.tmp')
+
+
+def proses(potongan, penulis, workers=0, laporan=None):
+    # Hasil ditulis berurutan. Dengan process pool, jumlah potongan yang sedang
+    # dikerjakan dibatasi 2 × workers agar memori tidak membengkak saat
+    # pembacaan lebih cepat daripada perhitungan.
+    total = 0
+    if workers <= 0:
+        for kolom in potongan:
+            hasil = hitung_potongan(kolom)
+            penulis.tulis(hasil)
+            total += len(hasil['r'])
+            if laporan:
+                laporan(total)
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        antrean = deque()
+        for kolom in potongan:
+            antrean.append(ex.submit(hitung_potongan, kolom))
+            if len(antrean) >= 2 * workers:
+                hasil = antrean.popleft().result()
+                penulis.tulis(hasil)
+                total += len(hasil['r'])
+                if laporan:
+                    laporan(total)
+        while antrean:
+            hasil = antrean.popleft().result()
+            penulis.tulis(hasil)
+            total += len(hasil['r'])
+            if laporan:
+                laporan(total)
+    return total
+
+
+class Progres:
+    def __init__(self, stream=sys.stderr, interval=1.0):
+        self.stream = stream
+        self.interval = interval
+        self.mulai = time.perf_counter()
+        self._terakhir = 0.0
+
+    def __call__(self, baris, paksa=False):
+        sekarang = time.perf_counter()
+        if not paksa and sekarang - self._terakhir < self.interval:
+            return
+        self._terakhir = sekarang
+        durasi = max(sekarang - self.mulai, 1e-9)
+        self.stream.write(f'\r{baris:,} baris  {durasi:7.1f} s  {baris / durasi:,.0f} baris/s')
+        self.stream.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Hitung komponen lingkaran (luas, keliling, juring, busur, '
+                    'tembereng, tali busur) untuk data CSV/.npy berukuran besar.')
+    parser.add_argument('input', help='File input .csv atau .npy')
+    parser.add_argument('output', help='File output .csv atau .npy')
+    parser.add_argument('--chunk', type=int, default=1_000_000,
+                        help='Jumlah baris per potongan (default: 1.000.000)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Jumlah proses paralel (default: 0 = tanpa process pool)')
+    parser.add_argument('--kolom', default='r,theta',
+                        help='Urutan kolom untuk input .npy 2-D (default: r,theta; '
+                             'contoh lain: r,a atau d,theta)')
+    parser.add_argument('--quiet', action='store_true', help='Jangan tampilkan progres')
+    args = parser.parse_args(argv)
+
+    nama_kolom = [batch.ALIAS_KOLOM.get(k.strip().lower(), k.strip()) for k in args.kolom.split(',')]
+    if args.input.endswith('.npy'):
+        potongan = baca_npy(args.input, args.chunk, nama_kolom)
+    else:
+        potongan = baca_csv(args.input, args.chunk)
+    penulis = PenulisNpy(args.output) if args.output.endswith('.npy') else PenulisCsv(args.output)
+
+    progres = Progres(stream=open(os.devnull, 'w') if args.quiet else sys.stderr)
+    try:
+        total = proses(potongan, penulis, workers=args.workers, laporan=progres)
+    except batch.BatchError as e:
+        parser.exit(2, f'Error: {e}\n')
+    finally:
+        penulis.tutup()
+    progres(total, paksa=True)
+    if not args.quiet:
+        sys.stderr.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,479 @@
+import argparse
+import csv
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+# Load test: N sesi siswa bersamaan yang berpindah slide dan mengubah input
+# dengan jeda berpikir acak (distribusi eksponensial). Tiga target:
+# - inproses: setiap sesi adalah streamlit.testing AppTest di proses ini
+#   (cache render, pool render, dan GIL dipakai bersama seperti di server).
+#   AppTest memakai satu Runtime global per proses, jadi run dari beberapa
+#   sesi diantrekan satu per satu; latensi termasuk waktu antre.
+# - server:   setiap sesi adalah klien websocket ke server Streamlit lokal
+#   (protokol BackMsg/ForwardMsg yang sama dengan browser). Tanpa --url,
+#   server dijalankan otomatis di port bebas.
+# - api:      setiap sesi adalah klien HTTP keep-alive ke api_server yang
+#   mengirim campuran permintaan (AKSI_API). Dengan --jeda 0 setiap klien
+#   langsung mengirim permintaan berikutnya (beban tertutup).
+# Dilaporkan: persentil latensi rerun, throughput, CPU dan RSS proses yang
+# melayani sesi dari waktu ke waktu. Timeline per detik ditulis ke CSV.
+#
+# Contoh:
+#   python loadtest.py --sesi 20 --durasi 60
+#   python loadtest.py --target server --sesi 50 --durasi 120 --csv beban.csv
+#   python loadtest.py --target server --url ws://localhost:8501 --pid 12345
+#   python loadtest.py --target api --sesi 50 --jeda 0 --durasi 30
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lingkaran_app.py')
+
+# Peluang aksi setelah jeda berpikir
+AKSI = (('ubah_angka', 0.6), ('lanjut', 0.25), ('kembali', 0.1), ('menu', 0.05))
+
+# Peluang permintaan klien API: satu nilai (digabung di server), array,
+# campuran, semua komponen, diagram, dan respons besar yang di-stream
+AKSI_API = (('hitung', 0.6), ('array', 0.15), ('campuran', 0.1), ('komponen', 0.08), ('diagram', 0.05),
+            ('stream', 0.02))
+RUMUS_API = (('luas_lingkaran', 'r'), ('keliling_lingkaran', 'r'), ('luas_juring', 'r', 'theta'),
+             ('panjang_busur', 'r', 'theta'), ('luas_tembereng', 'r', 'theta'),
+             ('panjang_tali_busur', 'r', 'theta'), ('tali_busur_dari_jarak', 'r', 'a'),
+             ('jari_jari_dari_luas', 'L'), ('jari_jari_dari_keliling', 'K'),
+             ('sudut_dari_luas_tembereng', 'r', 'L'))
+
+
+class SesiAppTest:
+    # Run AppTest yang bersamaan saling menimpa singleton Runtime
+    # ("Runtime hasn't been created!"), jadi semua sesi berbagi satu kunci
+    _kunci_run = threading.Lock()
+
+    def __init__(self, timeout=60):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP, default_timeout=timeout)
+
+    def _run(self, aksi):
+        with self._kunci_run:
+            aksi.run()
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].value)
+
+    def buka(self):
+        self._run(self.at)
+
+    def tombol(self):
+        return [b.label for b in self.at.button]
+
+    def angka(self):
+        return [(i, ni.value, ni.step, ni.min, ni.max)
+                for i, ni in enumerate(self.at.number_input) if ni.value is not None]
+
+    def klik(self, label):
+        self._run(next(b for b in self.at.button if b.label == label).click())
+
+    def ubah_angka(self, indeks, nilai):
+        self._run(self.at.number_input[indeks].set_value(nilai))
+
+    def tutup(self):
+        pass
+
+
+class SesiServer:
+    def __init__(self, url, timeout=60):
+        from websockets.sync.client import connect
+
+        self._koneksi = connect(f'{url.rstrip("/")}/_stcore/stream', subprotocols=['streamlit'],
+                                max_size=None, open_timeout=timeout)
+        self.ws = self._koneksi.__enter__()
+        self.timeout = timeout
+        self.page_hash = ''
+        self.state = {}      # id widget -> WidgetState bernilai (bukan trigger)
+        self.elemen = {}     # id widget -> (jenis, proto, fragment_id) dari run terakhir
+
+    def _rerun(self, pemicu=None, fragment_id=''):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        rerun = msg.rerun_script
+        rerun.page_script_hash = self.page_hash
+        rerun.fragment_id = fragment_id
+        rerun.widget_states.widgets.extend(self.state.values())
+        if pemicu is not None:
+            rerun.widget_states.widgets.append(pemicu)
+        self.ws.send(msg.SerializeToString())
+
+        while True:
+            fm = ForwardMsg.FromString(self.ws.recv(timeout=self.timeout))
+            jenis = fm.WhichOneof('type')
+            if jenis == 'new_session':
+                # Awal setiap run (termasuk run lanjutan setelah st.rerun()):
+                # buang widget dari run sebelumnya, atau hanya milik fragment
+                # yang dijalankan ulang
+                self.page_hash = fm.new_session.page_script_hash
+                fragment = set(fm.new_session.fragment_ids_this_run)
+                self.elemen = {k: v for k, v in self.elemen.items()
+                               if fragment and v[2] not in fragment}
+            elif jenis == 'delta' and fm.delta.WhichOneof('type') == 'new_element':
+                el = fm.delta.new_element
+                tipe = el.WhichOneof('type')
+                if tipe == 'exception':
+                    raise RuntimeError(el.exception.message)
+                if tipe in ('button', 'number_input'):
+                    proto = getattr(el, tipe)
+                    self.elemen[proto.id] = (tipe, proto, fm.delta.fragment_id)
+            elif jenis == 'script_finished':
+                # st.rerun() di skrip: server langsung menjalankan ulang skrip
+                if fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return
+
+    def buka(self):
+        self._rerun()
+
+    def tombol(self):
+        return [p.label for tipe, p, _ in self.elemen.values() if tipe == 'button']
+
+    def angka(self):
+        return [(id_, p.value if p.HasField('value') else p.default, p.step,
+                 p.min if p.has_min else None, p.max if p.has_max else None)
+                for id_, (tipe, p, _) in self.elemen.items() if tipe == 'number_input']
+
+    def klik(self, label):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        id_, (_, _, fragment_id) = next((k, v) for k, v in self.elemen.items()
+                                        if v[0] == 'button' and v[1].label == label)
+        self._rerun(WidgetState(id=id_, trigger_value=True), fragment_id)
+
+    def ubah_angka(self, id_, nilai):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        self.state[id_] = WidgetState(id=id_, double_value=nilai)
+        self._rerun(fragment_id=self.elemen[id_][2])
+
+    def tutup(self):
+        self._koneksi.__exit__(None, None, None)
+
+
+class SesiApi:
+    def __init__(self, url, timeout=60):
+        import http.client
+        from urllib.parse import urlsplit
+
+        url = urlsplit(url)
+        self.koneksi = http.client.HTTPConnection(url.hostname, url.port, timeout=timeout)
+
+    def minta(self, metode, path, body=None, header=None):
+        import json
+
+        header = dict(header or {})
+        if body is not None:
+            body = json.dumps(body)
+            header['Content-Type'] = 'application/json'
+        self.koneksi.request(metode, path, body=body, headers=header)
+        respons = self.koneksi.getresponse()
+        data = respons.read()
+        if respons.status != 200:
+            raise RuntimeError(f'{metode} {path}: HTTP {respons.status} {data[:200]!r}')
+        return data
+
+    def buka(self):
+        self.minta('GET', '/sehat')
+
+    def tutup(self):
+        self.koneksi.close()
+
+
+def _nilai_api(param, rng):
+    return {'r': round(rng.uniform(0.5, 50), 1), 'theta': float(rng.randint(1, 360)),
+            'a': round(rng.uniform(0, 50), 1), 'L': round(rng.uniform(1, 5000), 1),
+            'K': round(rng.uniform(1, 300), 1)}[param]
+
+
+def pilih_aksi_api(sesi, rng):
+    r = rng.random()
+    for nama, p in AKSI_API:
+        r -= p
+        if r <= 0:
+            break
+    rumus, *param = rng.choice(RUMUS_API)
+    if nama == 'hitung':
+        query = '&'.join(f'{p}={_nilai_api(p, rng)}' for p in param)
+        return nama, lambda: sesi.minta('GET', f'/hitung/{rumus}?{query}')
+    if nama == 'array':
+        body = {p: [_nilai_api(p, rng) for _ in range(1000)] for p in param}
+        return nama, lambda: sesi.minta('POST', f'/hitung/{rumus}', body)
+    if nama == 'campuran':
+        permintaan = []
+        for _ in range(100):
+            nama_rumus, *p = rng.choice(RUMUS_API)
+            permintaan.append(dict({x: _nilai_api(x, rng) for x in p}, rumus=nama_rumus))
+        body = {'permintaan': permintaan}
+        return nama, lambda: sesi.minta('POST', '/hitung', body)
+    if nama == 'komponen':
+        body = {'r': [_nilai_api('r', rng) for _ in range(1000)],
+                'theta': [_nilai_api('theta', rng) for _ in range(1000)]}
+        return nama, lambda: sesi.minta('POST', '/komponen', body)
+    if nama == 'diagram':
+        # Nilai bulat seperti soal buku, jadi sebagian besar diambil dari cache
+        slide = rng.choice(('luas', 'juring', 'tembereng', 'busur', 'tali_busur'))
+        query = f'r={rng.choice((7, 10, 14, 21))}&theta={rng.choice((30, 45, 60, 90, 120, 180))}&profil=hemat'
+        return nama, lambda: sesi.minta('GET', f'/diagram/{slide}?{query}')
+    body = {'r': [_nilai_api('r', rng) for _ in range(20000)], 'theta': 60}
+    return nama, lambda: sesi.minta('POST', '/komponen', body)
+
+
+def pilih_aksi(sesi, rng):
+    # Kembalikan (nama aksi, callable) sesuai isi halaman saat ini
+    tombol = sesi.tombol()
+    angka = sesi.angka()
+    r = rng.random()
+    for nama, p in AKSI:
+        r -= p
+        if r <= 0:
+            break
+    if tombol and not angka and nama != 'menu':
+        # Menu utama: pilih salah satu slide
+        label = rng.choice(tombol)
+        return 'pilih_slide', lambda: sesi.klik(label)
+    if nama == 'ubah_angka' and angka:
+        indeks, nilai, step, lo, hi = rng.choice(angka)
+        baru = nilai + rng.choice((-3, -2, -1, 1, 2, 3)) * (step or 1)
+        baru = min(hi, baru) if hi is not None else baru
+        baru = max(lo if lo is not None else 0, baru, step or 0.1)
+        return nama, lambda: sesi.ubah_angka(indeks, round(baru, 6))
+    cocok = {'lanjut': ('➡️', 'Selesai'), 'kembali': ('⬅️',), 'menu': ('Menu',)}.get(nama, ('➡️',))
+    kandidat = [t for t in tombol if any(c in t for c in cocok)]
+    if not kandidat:
+        kandidat = tombol
+    if not kandidat:
+        raise RuntimeError('halaman tidak punya tombol maupun input')
+    label = rng.choice(kandidat)
+    return nama, lambda: sesi.klik(label)
+
+
+class Hasil:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rerun = []    # (waktu selesai, latensi detik, aksi)
+        self.galat = []    # (waktu, pesan)
+
+    def catat(self, latensi, aksi):
+        with self.lock:
+            self.rerun.append((time.time(), latensi, aksi))
+
+    def gagal(self, pesan):
+        with self.lock:
+            self.galat.append((time.time(), pesan))
+
+
+def pengguna(buat_sesi, akhir, jeda, seed, hasil, pilih=pilih_aksi):
+    rng = random.Random(seed)
+    try:
+        sesi = buat_sesi()
+        mulai = time.perf_counter()
+        sesi.buka()
+        hasil.catat(time.perf_counter() - mulai, 'buka')
+    except Exception as e:
+        hasil.gagal(f'buka: {e}')
+        return
+    try:
+        while time.time() < akhir:
+            if jeda > 0:
+                time.sleep(min(rng.expovariate(1 / jeda), max(0.0, akhir - time.time())))
+            if time.time() >= akhir:
+                break
+            nama = 'pilih'
+            try:
+                nama, aksi = pilih(sesi, rng)
+                mulai = time.perf_counter()
+                aksi()
+            except Exception as e:
+                hasil.gagal(f'{nama}: {e}')
+                continue
+            hasil.catat(time.perf_counter() - mulai, nama)
+    finally:
+        sesi.tutup()
+
+
+# Sampel CPU dan RSS dari /proc (Linux)
+def baca_proc(pid):
+    with open(f'/proc/{pid}/stat') as f:
+        field = f.read().rsplit(')', 1)[1].split()
+    cpu = (int(field[11]) + int(field[12])) / os.sysconf('SC_CLK_TCK')
+    with open(f'/proc/{pid}/status') as f:
+        rss = next(int(b.split()[1]) for b in f if b.startswith('VmRSS:')) * 1024
+    return cpu, rss
+
+
+class Pemantau(threading.Thread):
+    def __init__(self, pid, interval=1.0):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.sampel = []   # (waktu, cpu %, rss bytes)
+        self._berhenti = threading.Event()
+
+    def run(self):
+        waktu_lalu, cpu_lalu = time.time(), baca_proc(self.pid)[0]
+        while not self._berhenti.wait(self.interval):
+            sekarang = time.time()
+            cpu, rss = baca_proc(self.pid)
+            self.sampel.append((sekarang, 100 * (cpu - cpu_lalu) / (sekarang - waktu_lalu), rss))
+            waktu_lalu, cpu_lalu = sekarang, cpu
+
+    def berhenti(self):
+        self._berhenti.set()
+        self.join()
+
+
+def persentil(data, q):
+    data = sorted(data)
+    return data[min(len(data) - 1, int(q * len(data)))] if data else float('nan')
+
+
+def jalankan_server():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    proses = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP, '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        cwd=os.path.dirname(APP), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    batas = time.time() + 60
+    while time.time() < batas:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return proses, f'ws://127.0.0.1:{port}'
+        except OSError:
+            time.sleep(0.2)
+    proses.kill()
+    raise RuntimeError('Server Streamlit tidak bisa dijalankan')
+
+
+def jalankan_api():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    proses = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(APP), 'api_server.py'),
+                               '--port', str(port)],
+                              cwd=os.path.dirname(APP), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    batas = time.time() + 60
+    while time.time() < batas:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return proses, f'http://127.0.0.1:{port}'
+        except OSError:
+            time.sleep(0.2)
+    proses.kill()
+    raise RuntimeError('api_server tidak bisa dijalankan')
+
+
+def tulis_csv(path, hasil, pemantau, t0):
+    # Satu baris per detik: jumlah rerun, latensi p50/p95, CPU, RSS
+    per_detik = {}
+    for t, latensi, _ in hasil.rerun:
+        per_detik.setdefault(int(t - t0), []).append(latensi)
+    sumber = {int(t - t0): (cpu, rss) for t, cpu, rss in pemantau.sampel}
+    detik = sorted(set(per_detik) | set(sumber))
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['detik', 'rerun', 'p50_ms', 'p95_ms', 'cpu_persen', 'rss_mb'])
+        for d in detik:
+            lat = per_detik.get(d, [])
+            cpu, rss = sumber.get(d, (None, None))
+            w.writerow([d, len(lat),
+                        f'{persentil(lat, 0.5) * 1000:.1f}' if lat else '',
+                        f'{persentil(lat, 0.95) * 1000:.1f}' if lat else '',
+                        f'{cpu:.1f}' if cpu is not None else '',
+                        f'{rss / 2 ** 20:.1f}' if rss is not None else ''])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test sesi bersamaan untuk lingkaran_app.')
+    parser.add_argument('--target', choices=['inproses', 'server', 'api'], default='inproses')
+    parser.add_argument('--url', help='URL server (ws://host:port, atau http://host:port untuk api); '
+                                      'tanpa ini server dijalankan otomatis')
+    parser.add_argument('--pid', type=int, help='PID server untuk sampel CPU/RSS (dengan --url)')
+    parser.add_argument('--sesi', type=int, default=10, help='Jumlah sesi bersamaan')
+    parser.add_argument('--durasi', type=float, default=30, help='Lama pengujian (detik)')
+    parser.add_argument('--ramp', type=float, default=5, help='Waktu untuk memulai semua sesi (detik)')
+    parser.add_argument('--jeda', type=float, default=3.0, help='Rata-rata jeda berpikir (detik)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--csv', help='Tulis timeline per detik ke file CSV')
+    args = parser.parse_args(argv)
+
+    server = None
+    pid = os.getpid()
+    pilih = pilih_aksi
+    if args.target in ('server', 'api'):
+        url = args.url
+        if url is None:
+            server, url = jalankan_server() if args.target == 'server' else jalankan_api()
+            pid = server.pid
+        elif args.pid:
+            pid = args.pid
+        else:
+            pid = None
+
+        def buat_sesi():
+            return SesiServer(url) if args.target == 'server' else SesiApi(url)
+        if args.target == 'api':
+            pilih = pilih_aksi_api
+    else:
+        buat_sesi = SesiAppTest
+
+    hasil = Hasil()
+    pemantau = Pemantau(pid) if pid else None
+    t0 = time.time()
+    akhir = t0 + args.ramp + args.durasi
+    thread = [threading.Thread(target=pengguna, args=(buat_sesi, akhir, args.jeda, args.seed + i, hasil, pilih),
+                               daemon=True) for i in range(args.sesi)]
+    try:
+        if pemantau:
+            pemantau.start()
+        for i, t in enumerate(thread):
+            t.start()
+            time.sleep(args.ramp / max(1, args.sesi))
+        for t in thread:
+            t.join()
+    finally:
+        if pemantau:
+            pemantau.berhenti()
+        if server is not None:
+            server.terminate()
+            server.wait()
+    durasi = time.time() - t0
+
+    latensi = [lat for _, lat, _ in hasil.rerun]
+    print(f'Target: {args.target}, {args.sesi} sesi, {durasi:.0f} s, jeda rata-rata {args.jeda} s')
+    satuan = 'Permintaan' if args.target == 'api' else 'Rerun'
+    print(f'{satuan}: {len(latensi)} ({len(latensi) / durasi:.1f}/s), galat: {len(hasil.galat)}')
+    print(f"\n{'aksi':>12} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'maks ms':>9}")
+    for aksi in sorted({a for _, _, a in hasil.rerun}) + ['semua']:
+        data = [lat for _, lat, a in hasil.rerun if aksi in ('semua', a)]
+        if not data:
+            continue
+        print(f'{aksi:>12} {len(data):6d} ' + ' '.join(
+            f'{v * 1000:9.1f}' for v in (persentil(data, 0.5), persentil(data, 0.95),
+                                         persentil(data, 0.99), max(data))))
+    if pemantau and pemantau.sampel:
+        cpu = [c for _, c, _ in pemantau.sampel]
+        rss = [r for _, _, r in pemantau.sampel]
+        print(f'\nCPU: rata-rata {statistics.mean(cpu):.0f}%, maks {max(cpu):.0f}%')
+        print(f'RSS: awal {rss[0] / 2 ** 20:.0f} MB, akhir {rss[-1] / 2 ** 20:.0f} MB, '
+              f'maks {max(rss) / 2 ** 20:.0f} MB')
+    for t, pesan in hasil.galat[:5]:
+        print(f'GALAT +{t - t0:.1f}s: {pesan}')
+    if args.csv:
+        tulis_csv(args.csv, hasil, pemantau or Pemantau(os.getpid()), t0)
+        print(f'\nTimeline ditulis ke {args.csv}')
+    return 1 if not latensi else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+import diagnostik
+from galat_render import RenderPoolBusy
+import profil_render
+import render_cache
+
+# Pemanasan cache saat server mulai. Di thread latar belakang, diagram untuk
+# nilai default setiap slide dan nilai yang sering muncul di soal buku
+# pelajaran (kelipatan 7, sudut 30/45/60/90/120/180°) dirender ke
+# render_cache dan cache disk bersama, modul slide dan diagram (matplotlib)
+# diimport, dan template HTML diurai. Siswa pertama hari itu langsung
+# mendapat cache hit alih-alih menunggu render dingin.
+#
+# Urutan pekerjaan: nilai default slide dulu, lalu kombinasi buku pelajaran.
+# Pemanasan tidak menunggu pool render: jika pool sedang melayani sesi lain,
+# dicoba lagi sebentar kemudian, dan setelah beberapa kali dilewati.
+#
+# Daftar input bisa diganti lewat file JSON (LINGKARAN_PEMANASAN=<file>)
+# dengan kunci yang sama seperti INPUT_DEFAULT; kunci yang tidak ada memakai
+# nilai default. LINGKARAN_PEMANASAN=0 mematikan pemanasan. Dari baris
+# perintah (mis. sebelum worker dijalankan, mengisi cache disk bersama):
+#   python pemanasan.py --input soal.json
+#
+# Modul ini diimport di run pertama skrip aplikasi, jadi di tingkat modul
+# hanya boleh ada import ringan; geometri (NumPy) dan pool render
+# (matplotlib) baru diimport di thread pemanasan.
+
+INPUT_DEFAULT = {
+    'r': [7.0, 10.0, 14.0, 21.0, 28.0, 35.0],
+    'theta': [30.0, 45.0, 60.0, 90.0, 120.0, 180.0],
+    'L': [154.0, 616.0],
+    'K': [44.0, 88.0],
+    'a': [5.0],
+    'profil': [profil_render.PROFIL_DEFAULT],
+}
+
+def default_slide():
+    # Input default tiap slide: list (nama slide, nama diagram, args)
+    import geometri
+
+    return [
+        ('luas', 'draw_circle_area', (7.0,)),
+        ('keliling', 'draw_circle_circumference', (7.0,)),
+        ('juring', 'draw_juring', (10.0, 60.0)),
+        ('tembereng', 'draw_tembereng', (10.0, 60.0)),
+        ('jari_jari', 'draw_circle_with_radius', (7.0,)),
+        ('jari_jari', 'draw_circle_with_radius', (geometri.jari_jari_dari_luas(154.0),)),
+        ('jari_jari', 'draw_circle_with_radius', (geometri.jari_jari_dari_keliling(44.0),)),
+        ('diameter', 'draw_circle_with_diameter', (14.0,)),
+        ('diameter', 'draw_circle_with_diameter', (2 * geometri.jari_jari_dari_luas(154.0),)),
+        ('diameter', 'draw_circle_with_diameter', (2 * geometri.jari_jari_dari_keliling(44.0),)),
+        ('busur', 'draw_busur', (10.0, 60.0)),
+        ('tali_busur', 'draw_tali_busur', (10.0, 60.0)),
+        ('tali_busur', 'draw_tali_busur', (10.0, geometri.sudut_dari_jarak(10.0, 5.0))),
+    ]
+
+SUDUT_MAKS = {'draw_tali_busur': 180.0}
+SIAP = ('dirender', 'dari_disk', 'sudah_ada')
+COBA_LAGI = 20
+JEDA_SIBUK = 0.25
+
+_env = os.environ.get('LINGKARAN_PEMANASAN', '')
+AKTIF = _env != '0'
+FILE_INPUT = _env if _env not in ('', '0') else None
+
+# dirender: render baru; dari_disk: dimuat dari cache disk bersama;
+# sudah_ada: sudah di render_cache proses ini
+statistik = {'status': 'belum', 'target': 0, 'dirender': 0, 'dari_disk': 0, 'sudah_ada': 0, 'dilewati': 0,
+             'gagal': 0, 'detik': 0.0, 'per_slide': {}}
+_lock = threading.Lock()
+_thread = None
+
+
+def muat_input(path=None):
+    masukan = {k: list(v) for k, v in INPUT_DEFAULT.items()}
+    if path:
+        with open(path, encoding='utf-8') as f:
+            masukan.update(json.load(f))
+    return masukan
+
+
+def daftar_pekerjaan(masukan=None):
+    # List (slide, nama diagram, args, profil) tanpa duplikat kunci cache
+    import geometri
+
+    masukan = masukan or muat_input()
+    pekerjaan = default_slide()
+    for r in masukan['r']:
+        pekerjaan += [('luas', 'draw_circle_area', (r,)),
+                      ('keliling', 'draw_circle_circumference', (r,)),
+                      ('jari_jari', 'draw_circle_with_radius', (r,)),
+                      ('diameter', 'draw_circle_with_diameter', (2 * r,))]
+    for nama_input, ke_r in (('L', geometri.jari_jari_dari_luas), ('K', geometri.jari_jari_dari_keliling)):
+        for v in masukan[nama_input]:
+            r = ke_r(v)
+            pekerjaan += [('jari_jari', 'draw_circle_with_radius', (r,)),
+                          ('diameter', 'draw_circle_with_diameter', (2 * r,))]
+    for slide, nama in (('juring', 'draw_juring'), ('tembereng', 'draw_tembereng'),
+                        ('busur', 'draw_busur'), ('tali_busur', 'draw_tali_busur')):
+        for r in masukan['r']:
+            for theta in masukan['theta']:
+                if 0 < theta <= SUDUT_MAKS.get(nama, 360.0):
+                    pekerjaan.append((slide, nama, (r, theta)))
+    for r in masukan['r']:
+        for a in masukan['a']:
+            if a < r:
+                pekerjaan.append(('tali_busur', 'draw_tali_busur', (r, geometri.sudut_dari_jarak(r, a))))
+
+    from slides.umum import LEBAR_KOLOM
+
+    hasil, kunci_terlihat = [], set()
+    for nama_profil in masukan['profil']:
+        profil = profil_render.ambil(nama_profil)
+        for slide, nama, args in pekerjaan:
+            kunci = render_cache.kunci_diagram(nama, args, profil, LEBAR_KOLOM)
+            if kunci not in kunci_terlihat:
+                kunci_terlihat.add(kunci)
+                hasil.append((slide, nama, args, profil))
+    return hasil
+
+
+def _impor_modul():
+    # Import modul slide dan diagram, serta urai semua template, sekali per proses
+    import slides
+    import templat
+
+    for slide in slides.SLIDES.values():
+        importlib.import_module(f'slides.{slide.modul}')
+        templat.muat(slide.modul)
+    templat.muat('app')
+    if render_cache.RENDERER != 'svg':
+        importlib.import_module('diagram')
+
+
+def _isi(nama, args, profil):
+    from slides.umum import LEBAR_KOLOM
+
+    kunci = render_cache.kunci_diagram(nama, args, profil, LEBAR_KOLOM)
+    if kunci in render_cache.cache:
+        return 'sudah_ada'
+    hasil = 'dari_disk' if render_cache.ada_di_disk(kunci) else 'dirender'
+    for _ in range(COBA_LAGI):
+        try:
+            render_cache.isi_cache(nama, *args, profil=profil, lebar=LEBAR_KOLOM)
+            return hasil
+        except RenderPoolBusy:
+            time.sleep(JEDA_SIBUK)
+    return 'dilewati'
+
+
+def jalankan(masukan=None):
+    mulai = time.perf_counter()
+    with _lock:
+        statistik.update(status='berjalan', dirender=0, dari_disk=0, sudah_ada=0, dilewati=0, gagal=0,
+                         per_slide={})
+    _impor_modul()
+    pekerjaan = daftar_pekerjaan(masukan)
+    statistik['target'] = len(pekerjaan)
+    for slide, nama, args, profil in pekerjaan:
+        try:
+            hasil = _isi(nama, args, profil)
+        except Exception:
+            hasil = 'gagal'
+        with _lock:
+            statistik[hasil] += 1
+            siap, total = statistik['per_slide'].get(slide, (0, 0))
+            statistik['per_slide'][slide] = (siap + (hasil in SIAP), total + 1)
+            statistik['detik'] = time.perf_counter() - mulai
+    statistik['status'] = 'selesai'
+    diagnostik.catat('pemanasan', '', statistik['detik'])
+    return laporan()
+
+
+def mulai():
+    # Jalankan pemanasan sekali per proses di thread latar belakang
+    global _thread
+    if not AKTIF:
+        return
+    with _lock:
+        if _thread is not None:
+            return
+        _thread = threading.Thread(target=jalankan, args=(muat_input(FILE_INPUT),), daemon=True,
+                                   name='lingkaran-pemanasan')
+        _thread.start()
+
+
+def cakupan():
+    # Bagian target yang siap di cache (dirender, dimuat dari disk, atau sudah ada)
+    siap = sum(statistik[k] for k in SIAP)
+    return siap / statistik['target'] if statistik['target'] else 0.0
+
+
+def laporan():
+    with _lock:
+        return dict(statistik, per_slide=dict(statistik['per_slide']), cakupan=cakupan())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Panaskan cache diagram untuk input default dan soal umum.')
+    parser.add_argument('--input', default=FILE_INPUT,
+                        help='File JSON daftar input (kunci: r, theta, L, K, a, profil)')
+    parser.add_argument('--tampilkan', action='store_true', help='Tampilkan daftar pekerjaan tanpa merender')
+    args = parser.parse_args(argv)
+
+    masukan = muat_input(args.input)
+    if args.tampilkan:
+        for slide, nama, argumen, profil in daftar_pekerjaan(masukan):
+            print(f"{slide:12s} {nama:28s} {', '.join(f'{a:g}' for a in argumen):18s} {profil.nama}")
+        return 0
+    hasil = jalankan(masukan)
+    for slide, (siap, total) in hasil['per_slide'].items():
+        print(f'{slide:12s} {siap:4d}/{total:<4d}', file=sys.stderr)
+    print(f"Pemanasan selesai dalam {hasil['detik']:.1f} s: {hasil['dirender']} dirender, "
+          f"{hasil['dari_disk']} dari cache disk, {hasil['sudah_ada']} sudah di cache, "
+          f"{hasil['dilewati']} dilewati, {hasil['gagal']} gagal; "
+          f"cakupan {hasil['cakupan']:.0%} dari {hasil['target']} diagram")
+    return 0 if hasil['gagal'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
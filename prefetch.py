@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import diagnostik
+import render_cache
+from galat_render import RenderPoolBusy
+
+# Prefetch diagram di latar belakang selama pengguna masih membaca slide:
+# - diagram default slide berikutnya di jalur pelajaran, dan
+# - diagram untuk langkah input berikutnya di slide saat ini (r ± 0.1, θ ± 1),
+#   sesuai langkah st.number_input.
+# Hasilnya masuk ke render_cache yang dipakai bersama semua sesi, jadi klik
+# "lanjut" atau tombol +/- berikutnya langsung menjadi cache hit. Pekerjaan
+# prefetch tidak pernah menunggu pool render: jika pool sedang sibuk melayani
+# render sesi lain, pekerjaan itu dilewati saja. LINGKARAN_PREFETCH=0
+# mematikannya (mis. untuk benchmark dan leakcheck). Pekerjaan yang gagal
+# dihitung di statistik['gagal'] dan dicatat sebagai fase 'prefetch' di
+# diagnostik (?diag=1), karena Future-nya tidak pernah dibaca siapa pun.
+
+AKTIF = os.environ.get('LINGKARAN_PREFETCH', '') != '0'
+MAKS_ANTREAN = 16
+
+# Langkah number_input untuk (r,) dan (r, θ)
+LANGKAH = {1: (0.1,), 2: (0.1, 1.0)}
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='lingkaran-prefetch')
+_antrean = set()
+_lock = threading.Lock()
+statistik = {'dijadwalkan': 0, 'dirender': 0, 'dilewati': 0, 'gagal': 0}
+
+
+def _hitung(nama):
+    # statistik diubah dari thread sesi dan thread prefetch
+    with _lock:
+        statistik[nama] += 1
+
+
+def _kerjakan(kunci, nama, args, opsi):
+    mulai = time.perf_counter()
+    try:
+        if render_cache.isi_cache(nama, *args, **opsi):
+            _hitung('dirender')
+    except RenderPoolBusy:
+        _hitung('dilewati')
+    except Exception as e:
+        _hitung('gagal')
+        diagnostik.catat('prefetch', f'gagal/{nama}/{type(e).__name__}', time.perf_counter() - mulai)
+        warnings.warn(f'Prefetch {nama}{args} gagal: {type(e).__name__}: {e}')
+    finally:
+        with _lock:
+            _antrean.discard(kunci)
+
+
+def jadwalkan(nama, *args, **opsi):
+    # opsi: profil dan lebar seperti pada render_cache.render_diagram
+    if not AKTIF:
+        return
+    kunci = render_cache.kunci_diagram(nama, args, **opsi)
+    with _lock:
+        if kunci in _antrean or len(_antrean) >= MAKS_ANTREAN:
+            return
+        _antrean.add(kunci)
+        statistik['dijadwalkan'] += 1
+    _executor.submit(_kerjakan, kunci, nama, args, opsi)
+
+
+def langkah_berikutnya(nama, *args, theta_maks=360.0, **opsi):
+    # Tetangga terdekat dari input saat ini: setiap argumen ± satu langkah,
+    # di dalam batas number_input slide (θ maksimal theta_maks, mis. 180° di
+    # slide tali busur). Langkah naik dijadwalkan lebih dulu karena lebih
+    # sering dipakai.
+    langkah = LANGKAH.get(len(args), ())
+    for i, d in enumerate(langkah):
+        for arah in (1, -1):
+            baru = list(args)
+            baru[i] = args[i] + arah * d
+            if baru[i] > 0 and (i == 0 or baru[i] <= theta_maks):
+                jadwalkan(nama, *baru, **opsi)
+
+
+def slide_berikutnya(slide, **opsi):
+    if slide is not None and slide.diagram is not None:
+        nama, args = slide.diagram
+        jadwalkan(nama, *args, **opsi)
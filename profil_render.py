@@ -0,0 +1,57 @@
+import base64
+import os
+from collections import namedtuple
+
+# Profil render diagram raster. Setiap profil menentukan lebar area konten
+# (piksel fisik, sudah termasuk kerapatan layar) pada perangkat sasaran,
+# batas DPI, dan cara encode. DPI sebenarnya dihitung dari lebar kolom tempat
+# diagram ditampilkan, jadi kolom sempit dan thumbnail mendapat gambar kecil.
+# Profil aktif dipilih lewat LINGKARAN_PROFIL (default 'proyektor', sama
+# dengan output sebelumnya: PNG 200 dpi di kolom setengah lebar) dan bisa
+# diganti per sesi dengan query param ?profil=<nama>.
+#
+#   lebar_px  lebar area konten dalam piksel fisik
+#   dpi_min/dpi_maks  batas DPI hasil perhitungan
+#   fmt       'png', 'webp', atau 'jpeg' (webp/jpeg lewat Pillow)
+#   opsi      pil_kwargs untuk savefig: compress_level PNG atau quality
+#   tumpuk    kolom ditumpuk (layar sempit), jadi setiap kolom selebar layar
+
+Profil = namedtuple('Profil', 'nama lebar_px dpi_min dpi_maks fmt opsi tumpuk')
+
+PROFIL = {p.nama: p for p in (
+    Profil('proyektor', 2400, 100, 200, 'png', (('compress_level', 6),), False),
+    Profil('standar', 1600, 72, 150, 'png', (('compress_level', 9),), False),
+    Profil('hemat', 1000, 50, 100, 'webp', (('quality', 70),), False),
+    Profil('ponsel', 720, 50, 120, 'webp', (('quality', 75),), True),
+)}
+
+PROFIL_DEFAULT = os.environ.get('LINGKARAN_PROFIL', 'proyektor')
+
+# Lebar figure acuan (inci); diagram 7 inci keluar sedikit lebih besar
+LEBAR_INCI = 6
+# DPI dibulatkan agar lebar kolom yang mirip memakai entri cache yang sama
+KELIPATAN_DPI = 10
+
+MIME = {'png': 'image/png', 'webp': 'image/webp', 'jpeg': 'image/jpeg'}
+
+
+def ambil(nama=None):
+    return PROFIL.get(nama) or PROFIL[PROFIL_DEFAULT]
+
+
+def dpi(profil, lebar=1.0):
+    # lebar: bagian dari area konten yang ditempati diagram (0.5 untuk salah
+    # satu dari dua kolom, lebih kecil untuk thumbnail)
+    if profil.tumpuk:
+        # Dua kolom ditumpuk menjadi satu: setiap kolom dua kali lebih lebar
+        lebar = min(1.0, lebar * 2)
+    nilai = round(profil.lebar_px * lebar / LEBAR_INCI / KELIPATAN_DPI) * KELIPATAN_DPI
+    return min(profil.dpi_maks, max(profil.dpi_min, nilai))
+
+
+def sumber_gambar(data, fmt):
+    # st.image meneruskan PNG/JPEG apa adanya, tetapi format lain (WebP)
+    # di-encode ulang ke PNG; WebP karena itu dikirim sebagai data URI
+    if fmt in ('png', 'jpeg') or not isinstance(data, bytes):
+        return data
+    return f"data:{MIME[fmt]};base64,{base64.b64encode(data).decode('ascii')}"
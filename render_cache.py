@@ -0,0 +1,217 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+import diagnostik
+import disk_cache
+import profil_render
+
+# Cache hasil render diagram (bytes PNG/WebP/JPEG atau teks SVG) yang dipakai
+# bersama oleh semua sesi dalam satu proses Streamlit. Kunci cache: (nama
+# fungsi, argumen yang sudah dikuantisasi, format, dpi, tema, profil). Entri
+# terlama dibuang (LRU) jika jumlah entri atau total ukuran bytes melewati
+# batas. Di bawahnya ada cache disk yang dipakai bersama semua proses pada
+# host yang sama (lihat disk_cache), jadi diagram yang sudah dirender satu
+# worker tidak dirender ulang oleh worker lain.
+
+TEMA_DEFAULT = 'default'
+DIGIT_KUANTISASI = 3
+
+# Renderer diagram untuk deployment ini: 'png' (matplotlib/Agg, format dan
+# resolusi menurut profil_render) atau 'svg' (svg_diagram, tanpa matplotlib)
+RENDERER = os.environ.get('LINGKARAN_RENDERER', 'png').lower()
+
+
+def quantize(value, ndigits=DIGIT_KUANTISASI):
+    # Input number_input berlangkah 0.1 / 1.0, jadi 3 digit desimal sudah cukup
+    # untuk membedakan nilai yang berbeda tanpa membuat kunci baru untuk noise
+    # floating point (mis. r = √(L/π)).
+    return round(float(value), ndigits)
+
+
+class RenderCache:
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def __contains__(self, key):
+        # Cek keberadaan tanpa mengubah urutan LRU maupun statistik hit/miss
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, data):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= len(old)
+            if len(data) > self.max_bytes:
+                return
+            self._entries[key] = data
+            self._total_bytes += len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._total_bytes > self.max_bytes):
+            _, data = self._entries.popitem(last=False)
+            self._total_bytes -= len(data)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+
+cache = RenderCache(
+    max_entries=int(os.environ.get('LINGKARAN_CACHE_ENTRIES', 256)),
+    max_bytes=int(float(os.environ.get('LINGKARAN_CACHE_MB', 64)) * 1024 * 1024),
+)
+
+
+def nama_diagram(draw_fn):
+    # Diagram bisa dirujuk lewat fungsinya atau lewat namanya ('draw_juring').
+    # Dengan nama, diagram.py (dan matplotlib) baru diimport saat cache miss.
+    return draw_fn if isinstance(draw_fn, str) else draw_fn.__name__
+
+
+def cache_key(draw_fn, args, fmt='png', dpi=None, tema=TEMA_DEFAULT, profil=None):
+    nama_profil = profil.nama if profil is not None else None
+    return (nama_diagram(draw_fn), tuple(quantize(a) for a in args), fmt, dpi, tema, nama_profil)
+
+
+def varian(profil=None, lebar=1.0):
+    # (fmt, dpi, profil) yang dipakai renderer aktif untuk diagram selebar
+    # `lebar` bagian area konten; SVG tidak bergantung pada profil
+    if RENDERER == 'svg':
+        return 'svg', None, None
+    profil = profil or profil_render.ambil()
+    return profil.fmt, profil_render.dpi(profil, lebar), profil
+
+
+# File kode yang menentukan hasil render diagram (juga dipakai lembar_kerja)
+FILE_KODE = ('diagram.py', 'svg_diagram.py', 'vertex_cache.py', 'render_pool.py', 'animasi.py')
+
+
+@lru_cache(maxsize=None)
+def versi_kode():
+    # Bagian kunci disk: berubah jika kode gambar atau matplotlib berubah
+    from importlib.metadata import version
+
+    return version('matplotlib'), disk_cache.versi_file(*FILE_KODE)
+
+
+def ambil(key, buat, teks=False):
+    # Memori proses ini -> disk bersama -> buat(). teks=True untuk SVG (str),
+    # yang di disk disimpan sebagai UTF-8
+    data = cache.get(key)
+    if data is None:
+        data = _dari_disk(key, buat, teks)
+        cache.put(key, data)
+    return data
+
+
+def _dari_disk(key, buat, teks=False):
+    if teks:
+        return disk_cache.ambil_atau_buat(key + (versi_kode(),), lambda: buat().encode()).decode()
+    return disk_cache.ambil_atau_buat(key + (versi_kode(),), buat)
+
+
+def ada_di_disk(key):
+    # Apakah entri sudah dirender proses lain dan tersimpan di cache disk
+    return disk_cache.siap() and os.path.exists(disk_cache.path(key + (versi_kode(),)))
+
+
+def _render_baru(nama, args, fmt, dpi, profil=None, block=True):
+    if fmt == 'svg':
+        from svg_diagram import SVG_DIAGRAMS
+
+        # SVG dibangun langsung sebagai teks: gambar dan encode satu langkah
+        mulai = time.perf_counter()
+        data = SVG_DIAGRAMS[nama](*args)
+        diagnostik.catat('draw', nama, time.perf_counter() - mulai)
+        diagnostik.catat('encode', 'svg', 0.0, len(data))
+        return data
+
+    from diagram import DIAGRAMS
+    from render_pool import pool
+
+    # Waktu encode dan ukuran bytes dicatat per profil
+    return pool.submit(DIAGRAMS[nama], *args, dpi=dpi, fmt=fmt, pil_kwargs=dict(profil.opsi),
+                       label=profil.nama, block=block).result()
+
+
+def render_raster(draw_fn, *args, profil=None, dpi=None, tema=TEMA_DEFAULT):
+    # Kembalikan bytes PNG/WebP/JPEG dari draw_fn(*args) sesuai profil, dari
+    # cache jika tersedia. Tanpa dpi, dipakai dpi profil untuk lebar penuh.
+    profil = profil or profil_render.ambil()
+    dpi = dpi or profil_render.dpi(profil)
+    args = tuple(quantize(a) for a in args)
+    key = cache_key(draw_fn, args, profil.fmt, dpi, tema, profil)
+    return ambil(key, lambda: _render_baru(nama_diagram(draw_fn), args, profil.fmt, dpi, profil))
+
+
+def render_svg(draw_fn, *args, tema=TEMA_DEFAULT):
+    # Kembalikan string SVG yang dibangun langsung dari geometri (svg_diagram)
+    args = tuple(quantize(a) for a in args)
+    key = cache_key(draw_fn, args, 'svg', None, tema)
+    return ambil(key, lambda: _render_baru(nama_diagram(draw_fn), args, 'svg', None), teks=True)
+
+
+def render_diagram(draw_fn, *args, profil=None, lebar=1.0):
+    # Raster (bytes) atau SVG (str) sesuai RENDERER; keduanya bisa langsung
+    # diberikan ke st.image
+    if RENDERER == 'svg':
+        return render_svg(draw_fn, *args)
+    fmt, dpi, profil = varian(profil, lebar)
+    return render_raster(draw_fn, *args, profil=profil, dpi=dpi)
+
+
+def kunci_diagram(draw_fn, args, profil=None, lebar=1.0):
+    # Kunci cache yang akan dipakai render_diagram dengan argumen yang sama
+    fmt, dpi, profil = varian(profil, lebar)
+    return cache_key(draw_fn, args, fmt, dpi, TEMA_DEFAULT, profil)
+
+
+def isi_cache(draw_fn, *args, profil=None, lebar=1.0):
+    # Render ke cache di latar belakang (lihat prefetch) tanpa mengubah
+    # statistik hit/miss. Tidak menunggu jika pool render sedang penuh:
+    # RenderPoolBusy diteruskan ke pemanggil agar pekerjaan ini dilewati.
+    args = tuple(quantize(a) for a in args)
+    fmt, dpi, profil = varian(profil, lebar)
+    key = cache_key(draw_fn, args, fmt, dpi, TEMA_DEFAULT, profil)
+    if key in cache:
+        return False
+    cache.put(key, _dari_disk(key, lambda: _render_baru(nama_diagram(draw_fn), args, fmt, dpi, profil,
+                                                       block=False), teks=fmt == 'svg'))
+    return True
@@ -0,0 +1,96 @@
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import diagnostik
+from galat_render import RenderPoolBusy
+
+# Pool render tanpa pyplot. Setiap worker memiliki satu Figure/Axes + canvas Agg
+# sendiri yang dipakai ulang: sebelum menggambar, semua artist di Axes dihapus
+# dengan ax.cla(). Karena tidak melewati pyplot, figure tidak pernah masuk ke
+# figure manager global dan sesi yang berbeda tidak saling berebut state pyplot.
+
+
+def buat_canvas():
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def render_ke_bytes(fig, ax, draw_fn, args, dpi=100, fmt='png', metadata=None, pil_kwargs=None,
+                    label=None):
+    # Gambar draw_fn(ax, *args) pada figure yang dipakai ulang, lalu encode.
+    # pil_kwargs diteruskan ke Pillow (compress_level PNG, quality WebP/JPEG);
+    # label menggantikan fmt sebagai nama metrik encode (mis. nama profil).
+    ax.cla()
+    fig.set_size_inches(draw_fn.figsize)
+    # Samakan dpi figure dengan dpi output agar fungsi gambar bisa
+    # memperkirakan ukuran piksel (lihat vertex_cache.jari_jari_px)
+    fig.set_dpi(dpi)
+    try:
+        with diagnostik.fase('draw', draw_fn.__name__):
+            draw_fn(ax, *args)
+        mulai = time.perf_counter()
+        buf = io.BytesIO()
+        # Backend vektor (SVG/PDF) tidak menerima pil_kwargs
+        opsi = {'pil_kwargs': pil_kwargs} if pil_kwargs else {}
+        fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight', metadata=metadata, **opsi)
+        data = buf.getvalue()
+        diagnostik.catat('encode', label or fmt, time.perf_counter() - mulai, len(data))
+    finally:
+        ax.cla()
+    return data
+
+
+class RenderPool:
+    def __init__(self, workers=2, max_pending=8, timeout=10.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix='lingkaran-render')
+        # Slot = pekerjaan yang sedang dikerjakan + yang mengantre. Jika semua
+        # slot terpakai, pemanggil menunggu (atau ditolak) -> backpressure.
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._local = threading.local()
+
+    def _canvas(self):
+        if getattr(self._local, 'fig', None) is None:
+            self._local.fig, self._local.ax = buat_canvas()
+        return self._local.fig, self._local.ax
+
+    def _render(self, draw_fn, args, dpi, fmt, pil_kwargs, label):
+        fig, ax = self._canvas()
+        return render_ke_bytes(fig, ax, draw_fn, args, dpi, fmt, pil_kwargs=pil_kwargs, label=label)
+
+    def submit(self, draw_fn, *args, dpi=100, fmt='png', pil_kwargs=None, label=None, block=True):
+        if block:
+            acquired = self._slots.acquire(timeout=self.timeout)
+        else:
+            acquired = self._slots.acquire(blocking=False)
+        if not acquired:
+            raise RenderPoolBusy('Pool render penuh, coba lagi nanti')
+        try:
+            future = self._executor.submit(self._render, draw_fn, args, dpi, fmt, pil_kwargs, label)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def render(self, draw_fn, *args, dpi=100, fmt='png'):
+        return self.submit(draw_fn, *args, dpi=dpi, fmt=fmt).result()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+pool = RenderPool(
+    workers=int(os.environ.get('LINGKARAN_RENDER_WORKERS', 2)),
+    max_pending=int(os.environ.get('LINGKARAN_RENDER_QUEUE', 8)),
+)
@@ -0,0 +1,112 @@
+import os
+import sys
+from collections import OrderedDict, deque
+
+import streamlit as st
+
+# State per sesi untuk kios kelas yang dibiarkan terbuka berhari-hari:
+# - riwayat navigasi berupa ring buffer (deque) dengan kedalaman tetap,
+#   sehingga klik "Selesai"/menu berulang kali tidak menumpuk tanpa batas;
+# - artefak yang disimpan sesi (mis. CSV mode massal) dalam urutan LRU;
+# - hitungan media (gambar/unduhan) yang dikirim pada run saat ini.
+# Ukuran semuanya dilaporkan di sidebar; jika total melebihi anggaran sesi,
+# artefak paling lama dibuang lebih dulu.
+
+KEDALAMAN_RIWAYAT = int(os.environ.get('LINGKARAN_HISTORY_DEPTH', 20))
+ANGGARAN_BYTES = int(float(os.environ.get('LINGKARAN_SESSION_MB', 8)) * 1024 * 1024)
+
+
+def inisialisasi():
+    state = st.session_state
+    if 'current_slide' not in state:
+        state.current_slide = 'menu'
+    if not isinstance(state.get('history'), deque):
+        state.history = deque(state.get('history', ()), maxlen=KEDALAMAN_RIWAYAT)
+    if 'artefak' not in state:
+        state.artefak = OrderedDict()
+        state.artefak_dibuang = 0
+    # Media hanya hidup selama satu run (Streamlit membuang file lama saat rerun)
+    state.media = {}
+
+
+def riwayat_baru():
+    return deque(maxlen=KEDALAMAN_RIWAYAT)
+
+
+def ukuran(obj, _dilihat=None):
+    # Perkiraan ukuran memori (bytes) secara rekursif, termasuk isi buffer
+    # file unggahan, array NumPy dan DataFrame
+    if _dilihat is None:
+        _dilihat = set()
+    if id(obj) in _dilihat:
+        return 0
+    _dilihat.add(id(obj))
+    if isinstance(obj, (bytes, bytearray, str, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+    if hasattr(obj, 'getbuffer'):
+        with obj.getbuffer() as buf:
+            return sys.getsizeof(obj) + buf.nbytes
+    if hasattr(obj, 'memory_usage'):
+        return int(obj.memory_usage(deep=True).sum())
+    if hasattr(obj, 'nbytes'):
+        return sys.getsizeof(obj) + int(obj.nbytes)
+    total = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        total += sum(ukuran(k, _dilihat) + ukuran(v, _dilihat) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        total += sum(ukuran(x, _dilihat) for x in obj)
+    return total
+
+
+def catat_media(kunci, data):
+    st.session_state.media[kunci] = len(data)
+
+
+def simpan_artefak(kunci, nilai):
+    artefak = st.session_state.artefak
+    artefak[kunci] = nilai
+    artefak.move_to_end(kunci)
+    tegakkan_anggaran()
+
+
+def ambil_artefak(kunci):
+    artefak = st.session_state.artefak
+    if kunci not in artefak:
+        return None
+    artefak.move_to_end(kunci)
+    return artefak[kunci]
+
+
+def hapus_artefak(kunci):
+    st.session_state.artefak.pop(kunci, None)
+
+
+def laporan():
+    state = st.session_state
+    lewati = ('artefak', 'media')
+    rincian = {k: ukuran(v) for k, v in state.items() if k not in lewati}
+    artefak = {k: ukuran(v) for k, v in state.artefak.items()}
+    media = sum(state.media.values())
+    return {
+        'state': sum(rincian.values()),
+        'rincian': rincian,
+        'artefak': sum(artefak.values()),
+        'jumlah_artefak': len(artefak),
+        'artefak_dibuang': state.artefak_dibuang,
+        'media': media,
+        'total': sum(rincian.values()) + sum(artefak.values()) + media,
+        'anggaran': ANGGARAN_BYTES,
+        'riwayat': len(state.history),
+    }
+
+
+def tegakkan_anggaran():
+    # Buang artefak paling lama sampai total sesi kembali di bawah anggaran.
+    # Artefak terbaru selalu dipertahankan agar slide yang sedang dibuka
+    # tetap berfungsi.
+    state = st.session_state
+    total = laporan()['total']
+    while len(state.artefak) > 1 and total > ANGGARAN_BYTES:
+        _, nilai = state.artefak.popitem(last=False)
+        total -= ukuran(nilai)
+        state.artefak_dibuang += 1
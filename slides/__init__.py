@@ -0,0 +1,134 @@
+import importlib
+from collections import namedtuple
+
+import streamlit as st
+
+import diagnostik
+import sesi
+
+# Registry slide: nama -> modul renderer + metadata navigasi. Setiap slide
+# berada di modulnya sendiri (slides/<modul>.py) yang berisi fungsi render()
+# dan baru diimport saat slide itu pertama kali dikunjungi. Tombol
+# sebelumnya/berikutnya dan tombol di menu dibuat dari registry ini, jadi
+# slide baru cukup didaftarkan di sini.
+#
+# Kolom kalkulator setiap slide adalah fungsi kalkulator() yang dibungkus
+# @st.fragment: perubahan input hanya menjalankan ulang kolom itu, tanpa
+# menjalankan ulang CSS, kolom rumus, navigasi, dan footer.
+
+Slide = namedtuple('Slide', 'nama modul tombol bantuan label diagram')
+
+SLIDES = {}
+
+# Urutan pelajaran (jalur tombol "lanjut"). `diagram` adalah diagram yang
+# tampil dengan nilai input default slide, dipakai untuk prefetch.
+PELAJARAN = []
+
+
+def daftar(nama, tombol=None, bantuan=None, label=None, diagram=None, modul=None, pelajaran=True):
+    SLIDES[nama] = Slide(nama, modul or nama, tombol, bantuan, label, diagram)
+    if pelajaran:
+        PELAJARAN.append(nama)
+
+
+daftar('menu', pelajaran=False)
+daftar('luas', "📐 Luas Lingkaran", "Klik untuk melihat rumus dan kalkulator luas lingkaran", "Luas",
+       ('draw_circle_area', (7.0,)))
+daftar('keliling', "🔄 Keliling Lingkaran", "Klik untuk melihat rumus dan kalkulator keliling lingkaran", "Keliling",
+       ('draw_circle_circumference', (7.0,)))
+daftar('juring', "🍕 Juring Lingkaran", "Klik untuk melihat rumus dan kalkulator juring lingkaran", "Juring",
+       ('draw_juring', (10.0, 60.0)))
+daftar('tembereng', "🎯 Tembereng Lingkaran", "Klik untuk melihat rumus dan kalkulator tembereng lingkaran", "Tembereng",
+       ('draw_tembereng', (10.0, 60.0)))
+daftar('jari_jari', "📏 Jari-Jari", "Klik untuk melihat penjelasan jari-jari lingkaran", "Jari-Jari",
+       ('draw_circle_with_radius', (7.0,)))
+daftar('diameter', "➖ Diameter", "Klik untuk melihat penjelasan diameter lingkaran", "Diameter",
+       ('draw_circle_with_diameter', (14.0,)))
+daftar('busur', "〰️ Busur Lingkaran", "Klik untuk melihat rumus dan kalkulator busur lingkaran", "Busur",
+       ('draw_busur', (10.0, 60.0)))
+daftar('tali_busur', "➖ Tali Busur", "Klik untuk melihat rumus dan kalkulator tali busur", "Tali Busur",
+       ('draw_tali_busur', (10.0, 60.0)))
+
+
+def slides_pelajaran():
+    return [SLIDES[nama] for nama in PELAJARAN]
+
+
+def sebelumnya(nama):
+    i = PELAJARAN.index(nama)
+    return SLIDES[PELAJARAN[i - 1]] if i > 0 else None
+
+
+def berikutnya(nama):
+    i = PELAJARAN.index(nama)
+    return SLIDES[PELAJARAN[i + 1]] if i + 1 < len(PELAJARAN) else None
+
+
+# Navigasi. Riwayat berupa deque berkapasitas tetap (lihat sesi.py): entri
+# paling lama terbuang otomatis saat riwayat penuh.
+def go_to_slide(slide_name):
+    st.session_state.history.append(st.session_state.current_slide)
+    st.session_state.current_slide = slide_name
+
+
+def go_back():
+    if st.session_state.history:
+        st.session_state.current_slide = st.session_state.history.pop()
+    else:
+        st.session_state.current_slide = 'menu'
+
+
+def reset_app():
+    st.session_state.current_slide = 'menu'
+    st.session_state.history = sesi.riwayat_baru()
+
+
+def render(nama):
+    slide = SLIDES.get(nama, SLIDES['menu'])
+    with diagnostik.fase('slide', slide.nama):
+        importlib.import_module(f'{__name__}.{slide.modul}').render()
+        if slide.nama in PELAJARAN:
+            render_navigasi(slide.nama)
+    if slide.nama in PELAJARAN:
+        # Selagi pengguna membaca, siapkan diagram slide berikutnya
+        import prefetch
+        from slides.umum import LEBAR_KOLOM, profil_sesi
+        prefetch.slide_berikutnya(berikutnya(slide.nama), profil=profil_sesi(), lebar=LEBAR_KOLOM)
+
+
+def render_navigasi(nama):
+    prev, next_ = sebelumnya(nama), berikutnya(nama)
+    st.markdown("---")
+    if prev is None:
+        # Slide pertama: tidak ada tombol "sebelumnya"
+        col_nav1, col_nav2, col_nav3 = st.columns([1, 1, 1])
+        label_kembali, label_menu = "⬅️ Kembali ke Menu", "🏠 Menu Utama"
+        col_next = col_nav3
+    else:
+        col_nav1, col_nav2, col_prev, col_next = st.columns([1, 1, 1, 1])
+        label_kembali, label_menu = "⬅️ Kembali", "🏠 Menu"
+    with col_nav1:
+        if st.button(label_kembali, key=f"back_{nama}"):
+            go_back()
+            st.rerun()
+    with col_nav2:
+        if st.button(label_menu, key=f"menu_{nama}"):
+            reset_app()
+            st.rerun()
+    if prev is not None:
+        with col_prev:
+            if st.button(f"⬅️ {prev.label}", key=f"prev_{nama}"):
+                go_to_slide(prev.nama)
+                st.rerun()
+    with col_next:
+        if next_ is None:
+            if st.button("🎉 Selesai!", key="finish"):
+                go_to_slide('menu')
+                st.rerun()
+        elif prev is None:
+            if st.button(f"Lanjut ke {next_.label} ➡️", key=f"next_{nama}"):
+                go_to_slide(next_.nama)
+                st.rerun()
+        elif st.button(f"{next_.label} ➡️", key=f"next_{nama}"):
+            go_to_slide(next_.nama)
+            st.rerun()
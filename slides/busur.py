@@ -0,0 +1,44 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_animasi, tampilkan_cari_sudut, tampilkan_diagram_interaktif, tampilkan_mode_massal
+
+
+# 7. BUSUR LINGKARAN
+def render():
+    templat.tampilkan('busur', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('busur', 'rumus')
+        templat.tampilkan('busur', 'penjelasan')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Busur Lingkaran")
+    
+    r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=10.0, step=0.1, key="busur_r")
+    theta = st.number_input("Masukkan sudut (θ) dalam derajat:", min_value=0.0, max_value=360.0, value=60.0, step=1.0, key="busur_theta")
+    
+    if r > 0 and theta > 0:
+        with diagnostik.fase('rumus', 'busur'):
+            panjang_busur = geometri.panjang_busur(r, theta)
+            keliling_penuh = geometri.keliling_lingkaran(r)
+        templat.tampilkan('busur', 'hasil', pi=math.pi, r=r, theta=theta, rasio=theta/360,
+                          persen=theta/360*100, keliling_penuh=keliling_penuh, panjang_busur=panjang_busur)
+        tampilkan_diagram_interaktif('busur', 'draw_busur', r, theta, "busur_r", "busur_theta")
+        tampilkan_animasi('busur', r)
+
+    tampilkan_cari_sudut('busur', "panjang busur (s)", "satuan panjang", r, 10.0, "busur_theta",
+                         lambda s: {'theta': geometri.sudut_dari_busur(r, s),
+                                    'pi': math.pi, 'keliling_penuh': geometri.keliling_lingkaran(r)})
+    tampilkan_mode_massal("busur")
@@ -0,0 +1,53 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_diagram
+
+
+# 6. DIAMETER LINGKARAN
+def render():
+    templat.tampilkan('diameter', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('diameter', 'rumus')
+        templat.tampilkan('diameter', 'penjelasan')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Diameter")
+    
+    input_type = st.radio("Hitung diameter dari:", ["Jari-Jari (r)", "Luas (L)", "Keliling (K)"], key="diameter_input")
+    
+    if input_type == "Jari-Jari (r)":
+        r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=7.0, step=0.1, key="diameter_r")
+        if r > 0:
+            d = 2 * r
+            templat.tampilkan('diameter', 'hasil_r', r=r, d=d)
+            tampilkan_diagram('draw_circle_with_diameter', d)
+            
+    elif input_type == "Luas (L)":
+        L = st.number_input("Masukkan luas (L):", min_value=0.0, value=154.0, step=0.1, key="diameter_L")
+        if L > 0:
+            with diagnostik.fase('rumus', 'diameter'):
+                d = 2 * geometri.jari_jari_dari_luas(L)
+            templat.tampilkan('diameter', 'hasil_luas', pi=math.pi, L=L, L_pi=L/math.pi,
+                              akar_L_pi=math.sqrt(L/math.pi), d=d)
+            tampilkan_diagram('draw_circle_with_diameter', d)
+            
+    else:  # Keliling
+        K = st.number_input("Masukkan keliling (K):", min_value=0.0, value=44.0, step=0.1, key="diameter_K")
+        if K > 0:
+            with diagnostik.fase('rumus', 'diameter'):
+                d = 2 * geometri.jari_jari_dari_keliling(K)
+            templat.tampilkan('diameter', 'hasil_keliling', pi=math.pi, K=K, d=d)
+            tampilkan_diagram('draw_circle_with_diameter', d)
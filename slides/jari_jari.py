@@ -0,0 +1,81 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_diagram
+
+
+# Jari-jari dari besaran lain dan sudut θ: label -> (kunci widget, besaran,
+# nilai awal, fungsi geometri, rumus)
+KEBALIKAN = {
+    "Panjang Busur (s) dan θ": ("jari_s", "panjang busur (s)", 10.0, geometri.jari_jari_dari_busur,
+                                "r = s / θ (θ dalam radian)"),
+    "Luas Juring dan θ": ("jari_Lj", "luas juring (L)", 50.0, geometri.jari_jari_dari_luas_juring,
+                          "r = √(360° × L / (π × θ))"),
+    "Tali Busur (t) dan θ": ("jari_t", "panjang tali busur (t)", 10.0, geometri.jari_jari_dari_tali_busur,
+                             "r = t / (2 × sin(θ/2))"),
+    "Luas Tembereng dan θ": ("jari_Lt", "luas tembereng (L)", 9.0, geometri.jari_jari_dari_luas_tembereng,
+                             "r = √(2L / (θ - sin θ)) (θ dalam radian)"),
+}
+
+
+# 5. JARI-JARI LINGKARAN
+def render():
+    templat.tampilkan('jari_jari', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('jari_jari', 'rumus')
+        templat.tampilkan('jari_jari', 'penjelasan')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Jari-Jari")
+    
+    input_type = st.radio("Hitung jari-jari dari:", ["Diameter (d)", "Luas (L)", "Keliling (K)", *KEBALIKAN])
+    
+    if input_type == "Diameter (d)":
+        d = st.number_input("Masukkan diameter (d):", min_value=0.0, value=14.0, step=0.1, key="jari_d")
+        if d > 0:
+            r = d / 2
+            templat.tampilkan('jari_jari', 'hasil_d', d=d, r=r)
+            tampilkan_diagram('draw_circle_with_radius', r)
+            
+    elif input_type == "Luas (L)":
+        L = st.number_input("Masukkan luas (L):", min_value=0.0, value=154.0, step=0.1, key="jari_L")
+        if L > 0:
+            with diagnostik.fase('rumus', 'jari_jari'):
+                r = geometri.jari_jari_dari_luas(L)
+            templat.tampilkan('jari_jari', 'hasil_luas', pi=math.pi, L=L, L_pi=L/math.pi, r=r)
+            tampilkan_diagram('draw_circle_with_radius', r)
+            
+    elif input_type == "Keliling (K)":
+        K = st.number_input("Masukkan keliling (K):", min_value=0.0, value=44.0, step=0.1, key="jari_K")
+        if K > 0:
+            with diagnostik.fase('rumus', 'jari_jari'):
+                r = geometri.jari_jari_dari_keliling(K)
+            templat.tampilkan('jari_jari', 'hasil_keliling', pi=math.pi, dua_pi=2*math.pi, K=K, r=r)
+            tampilkan_diagram('draw_circle_with_radius', r)
+
+    else:  # Besaran lain dan sudut θ
+        key, besaran, nilai_awal, fungsi, rumus = KEBALIKAN[input_type]
+        nilai = st.number_input(f"Masukkan {besaran}:", min_value=0.0, value=nilai_awal, step=0.1, key=key)
+        theta = st.number_input("Masukkan sudut (θ) dalam derajat:", min_value=0.0, max_value=360.0, value=60.0,
+                                step=1.0, key=f"{key}_theta")
+        if nilai > 0 and theta > 0:
+            with diagnostik.fase('rumus', 'jari_jari_kebalikan'):
+                r = fungsi(nilai, theta)
+            if math.isnan(r):
+                st.error("⚠️ Jari-jari tidak dapat ditentukan untuk sudut ini!")
+            else:
+                templat.tampilkan('jari_jari', 'hasil_kebalikan', rumus=rumus, besaran=besaran, nilai=nilai,
+                                  theta=theta, theta_rad=math.radians(theta), r=r)
+                tampilkan_diagram('draw_circle_with_radius', r)
@@ -0,0 +1,44 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_animasi, tampilkan_cari_sudut, tampilkan_diagram_interaktif, tampilkan_mode_massal
+
+
+# 3. JURING LINGKARAN
+def render():
+    templat.tampilkan('juring', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('juring', 'rumus')
+        templat.tampilkan('juring', 'penjelasan')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Juring Lingkaran")
+    
+    r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=10.0, step=0.1, key="juring_r")
+    theta = st.number_input("Masukkan sudut (θ) dalam derajat:", min_value=0.0, max_value=360.0, value=60.0, step=1.0, key="juring_theta")
+    
+    if r > 0 and theta > 0:
+        with diagnostik.fase('rumus', 'juring'):
+            luas_juring = geometri.luas_juring(r, theta)
+            luas_lingkaran = geometri.luas_lingkaran(r)
+        templat.tampilkan('juring', 'hasil', pi=math.pi, r=r, theta=theta, rasio=theta/360,
+                          persen=theta/360*100, luas_lingkaran=luas_lingkaran, luas_juring=luas_juring)
+        tampilkan_diagram_interaktif('juring', 'draw_juring', r, theta, "juring_r", "juring_theta")
+        tampilkan_animasi('juring', r)
+
+    tampilkan_cari_sudut('juring', "luas juring (L)", "satuan luas", r, 50.0, "juring_theta",
+                         lambda L: {'theta': geometri.sudut_dari_luas_juring(r, L),
+                                    'pi': math.pi, 'luas_lingkaran': geometri.luas_lingkaran(r)})
+    tampilkan_mode_massal("juring")
@@ -0,0 +1,45 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_diagram, tampilkan_mode_massal
+
+
+# 2. KELILING LINGKARAN
+def render():
+    templat.tampilkan('keliling', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('keliling', 'rumus')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Keliling Lingkaran")
+    
+    input_type = st.radio("Pilih input:", ["Jari-Jari (r)", "Diameter (d)"], key="keliling_input")
+    
+    if input_type == "Jari-Jari (r)":
+        r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=7.0, step=0.1, key="keliling_r")
+        if r > 0:
+            with diagnostik.fase('rumus', 'keliling'):
+                keliling = geometri.keliling_lingkaran(r)
+            templat.tampilkan('keliling', 'hasil_r', pi=math.pi, r=r, keliling=keliling)
+            tampilkan_diagram('draw_circle_circumference', r)
+    else:
+        d = st.number_input("Masukkan diameter (d):", min_value=0.0, value=14.0, step=0.1, key="keliling_d")
+        if d > 0:
+            with diagnostik.fase('rumus', 'keliling'):
+                keliling = geometri.keliling_lingkaran(d / 2)
+            templat.tampilkan('keliling', 'hasil_d', pi=math.pi, d=d, keliling=keliling)
+            tampilkan_diagram('draw_circle_circumference', d/2)
+
+    tampilkan_mode_massal("keliling")
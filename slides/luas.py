@@ -0,0 +1,46 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_diagram, tampilkan_mode_massal
+
+
+# 1. LUAS LINGKARAN
+def render():
+    templat.tampilkan('luas', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('luas', 'rumus')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Luas Lingkaran")
+    
+    input_type = st.radio("Pilih input:", ["Jari-Jari (r)", "Diameter (d)"])
+    
+    if input_type == "Jari-Jari (r)":
+        r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=7.0, step=0.1)
+        if r > 0:
+            with diagnostik.fase('rumus', 'luas'):
+                luas = geometri.luas_lingkaran(r)
+            templat.tampilkan('luas', 'hasil_r', pi=math.pi, r=r, r2=r**2, luas=luas)
+            tampilkan_diagram('draw_circle_area', r)
+    else:
+        d = st.number_input("Masukkan diameter (d):", min_value=0.0, value=14.0, step=0.1)
+        if d > 0:
+            r = d / 2
+            with diagnostik.fase('rumus', 'luas'):
+                luas = geometri.luas_lingkaran(r)
+            templat.tampilkan('luas', 'hasil_d', pi=math.pi, d=d, r=r, luas=luas)
+            tampilkan_diagram('draw_circle_area', r)
+
+    tampilkan_mode_massal("luas")
@@ -0,0 +1,43 @@
+import streamlit as st
+
+import templat
+from slides import go_to_slide, slides_pelajaran
+
+
+# HALAMAN MENU UTAMA
+def render():
+    templat.tampilkan('menu', 'judul')
+    templat.tampilkan('menu', 'subjudul')
+    
+    st.markdown("---")
+    
+    # Layout 4x2 untuk tombol komponen, diambil dari registry slide
+    kolom = st.columns(4)
+    for i, slide in enumerate(slides_pelajaran()):
+        with kolom[i % 4]:
+            if st.button(slide.tombol, key=f"btn_{slide.nama}", help=slide.bantuan):
+                go_to_slide(slide.nama)
+                st.rerun()
+    
+    st.markdown("---")
+    
+    # Informasi umum tentang lingkaran
+    templat.tampilkan('menu', 'tentang')
+    
+    # Tabel komponen
+    st.markdown("### 📋 Daftar Komponen yang Akan Dipelajari:")
+    
+    data = {
+        "No": [1, 2, 3, 4, 5, 6, 7, 8],
+        "Komponen": ["Luas Lingkaran", "Keliling Lingkaran", "Juring Lingkaran", "Tembereng Lingkaran",
+                     "Jari-Jari Lingkaran", "Diameter Lingkaran", "Busur Lingkaran", "Tali Busur Lingkaran"],
+        "Simbol": ["L", "K", "-", "-", "r", "d", "-", "-"],
+        "Satuan": ["cm², m²", "cm, m", "cm², m²", "cm², m²", "cm, m", "cm, m", "cm, m", "cm, m"]
+    }
+    
+    # Tabel ditulis sebagai Markdown: st.table akan memuat pandas (~0,4 s saat
+    # cold start) hanya untuk delapan baris statis
+    baris = ["| " + " | ".join(data) + " |", "|" + "---|" * len(data)]
+    baris += ["| " + " | ".join(str(kolom[i]) for kolom in data.values()) + " |"
+              for i in range(len(data["No"]))]
+    st.markdown("\n".join(baris))
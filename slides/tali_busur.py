@@ -0,0 +1,69 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import (tampilkan_animasi, tampilkan_cari_sudut, tampilkan_diagram, tampilkan_diagram_interaktif,
+                         tampilkan_mode_massal)
+
+
+# 8. TALI BUSUR LINGKARAN
+def render():
+    templat.tampilkan('tali_busur', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('tali_busur', 'rumus')
+        templat.tampilkan('tali_busur', 'penjelasan')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Tali Busur")
+    
+    input_method = st.radio("Metode input:", ["Menggunakan Sudut (θ)", "Menggunakan Jarak dari Pusat (a)"])
+    
+    if input_method == "Menggunakan Sudut (θ)":
+        r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=10.0, step=0.1, key="tali_r")
+        theta = st.number_input("Masukkan sudut (θ) dalam derajat:", min_value=0.0, max_value=180.0, value=60.0, step=1.0, key="tali_theta")
+        
+        if r > 0 and theta > 0:
+            theta_rad = math.radians(theta)
+            with diagnostik.fase('rumus', 'tali_busur'):
+                panjang_tali = geometri.panjang_tali_busur(r, theta)
+            
+            templat.tampilkan('tali_busur', 'hasil_sudut', r=r, theta=theta, setengah_theta=theta/2,
+                              sin_setengah=math.sin(theta_rad/2), panjang_tali=panjang_tali)
+            tampilkan_diagram_interaktif('tali_busur', 'draw_tali_busur', r, theta, "tali_r", "tali_theta", theta_maks=180.0)
+            tampilkan_animasi('tali_busur', r)
+
+        tampilkan_cari_sudut('tali_busur', "panjang tali busur (t)", "satuan panjang", r, 10.0, "tali_theta",
+                             lambda t: {'theta': geometri.sudut_dari_tali_busur(r, t), 'rasio': t / (2 * r)},
+                             theta_maks=180.0)
+            
+    else:  # Menggunakan jarak dari pusat
+        r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=10.0, step=0.1, key="tali_r2")
+        a = st.number_input("Masukkan jarak dari pusat ke tali busur (a):", min_value=0.0, value=5.0, step=0.1, key="tali_a")
+        
+        if r > 0 and a >= 0 and a <= r:
+            with diagnostik.fase('rumus', 'tali_busur'):
+                panjang_tali = geometri.tali_busur_dari_jarak(r, a)
+            
+            templat.tampilkan('tali_busur', 'hasil_jarak', r=r, a=a, r2=r**2, a2=a**2, selisih=r**2 - a**2,
+                              akar_selisih=math.sqrt(r**2 - a**2), panjang_tali=panjang_tali)
+            
+            # Hitung sudut untuk visualisasi
+            if a < r:
+                with diagnostik.fase('rumus', 'tali_busur'):
+                    theta = geometri.sudut_dari_jarak(r, a)
+                tampilkan_diagram('draw_tali_busur', r, theta, theta_maks=180.0)
+        elif a > r:
+            st.error("⚠️ Jarak dari pusat (a) tidak boleh lebih besar dari jari-jari (r)!")
+
+    tampilkan_mode_massal("tali_busur")
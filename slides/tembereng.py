@@ -0,0 +1,55 @@
+import math
+
+import streamlit as st
+
+import diagnostik
+import geometri
+import templat
+from slides.umum import tampilkan_animasi, tampilkan_cari_sudut, tampilkan_diagram_interaktif, tampilkan_mode_massal
+
+
+# 4. TEMBERENG LINGKARAN
+def render():
+    templat.tampilkan('tembereng', 'judul')
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        templat.tampilkan('tembereng', 'rumus')
+        templat.tampilkan('tembereng', 'penjelasan')
+    
+    with col2:
+        kalkulator()
+
+
+@st.fragment
+def kalkulator():
+    st.markdown("### 🧮 Kalkulator Tembereng Lingkaran")
+    
+    r = st.number_input("Masukkan jari-jari (r):", min_value=0.0, value=10.0, step=0.1, key="tembereng_r")
+    theta = st.number_input("Masukkan sudut (θ) dalam derajat:", min_value=0.0, max_value=360.0, value=60.0, step=1.0, key="tembereng_theta")
+    
+    if r > 0 and theta > 0:
+        theta_rad = math.radians(theta)
+        with diagnostik.fase('rumus', 'tembereng'):
+            luas_juring = geometri.luas_juring(r, theta)
+            luas_segitiga = geometri.luas_segitiga_juring(r, theta)
+            luas_tembereng = geometri.luas_tembereng(r, theta)
+        
+        templat.tampilkan('tembereng', 'hasil', r=r, r2=r**2, theta=theta, sin_theta=math.sin(theta_rad),
+                          luas_juring=luas_juring, luas_segitiga=luas_segitiga, luas_tembereng=luas_tembereng)
+        tampilkan_diagram_interaktif('tembereng', 'draw_tembereng', r, theta, "tembereng_r", "tembereng_theta")
+        tampilkan_animasi('tembereng', r)
+
+    tampilkan_cari_sudut('tembereng', "luas tembereng (L)", "satuan luas", r, 10.0, "tembereng_theta",
+                         lambda L: cari_sudut(r, L))
+    tampilkan_mode_massal("tembereng")
+
+
+# θ - sin θ = 2L / r² tidak punya bentuk tertutup; langkah iterasi dan residu
+# ditampilkan agar siswa melihat hasilnya memang memenuhi persamaan
+def cari_sudut(r, L):
+    theta, info = geometri.sudut_dari_luas_tembereng(r, L, laporan=True)
+    return {'theta': theta, 'r2': r**2, 'c': 2 * L / r**2, 'theta_rad': math.radians(theta),
+            'iterasi': info['iterasi'], 'residu': info['residu_maks'],
+            'cek': geometri.luas_tembereng(r, theta)}
@@ -0,0 +1,144 @@
+import math
+import time
+
+import streamlit as st
+
+import diagnostik
+import profil_render
+import sesi
+import templat
+from render_cache import render_diagram
+
+# Komponen UI yang dipakai bersama oleh beberapa slide
+
+# Diagram kalkulator tampil di kolom kanan dari dua kolom (lihat profil_render)
+LEBAR_KOLOM = 0.5
+
+
+def profil_sesi():
+    # Profil render dari query param ?profil=..., atau default deployment
+    return profil_render.ambil(st.query_params.get("profil"))
+
+
+# Tampilkan diagram lewat cache render (raster sesuai profil, atau SVG; lihat
+# LINGKARAN_RENDERER) agar tidak digambar ulang setiap rerun jika r/θ tidak
+# berubah. `lebar` adalah bagian area konten yang ditempati diagram: kolom
+# sempit dan thumbnail mendapat gambar dengan dpi lebih kecil. `theta_maks`
+# adalah batas input θ slide, agar prefetch tidak menyiapkan sudut yang tidak
+# bisa diminta.
+def tampilkan_diagram(nama, *args, lebar=LEBAR_KOLOM, theta_maks=360.0):
+    profil = profil_sesi()
+    gambar = render_diagram(nama, *args, profil=profil, lebar=lebar)
+    sesi.catat_media(f"diagram_{nama}", gambar)
+    mulai = time.perf_counter()
+    st.image(profil_render.sumber_gambar(gambar, profil.fmt), width="stretch")
+    diagnostik.catat('kirim', nama, time.perf_counter() - mulai, len(gambar))
+    # Siapkan juga diagram untuk langkah input berikutnya (r ± 0.1, θ ± 1)
+    import prefetch
+    prefetch.langkah_berikutnya(nama, *args, theta_maks=theta_maks, profil=profil, lebar=lebar)
+
+
+# Diagram r/θ yang bisa diseret di browser (lihat komponen_interaktif). Selama
+# diseret tidak ada rerun maupun render diagram di server; saat dilepas nilai
+# baru masuk ke number_input key_r/key_theta. Tanpa toggle, diagram biasa.
+def tampilkan_diagram_interaktif(jenis, nama, r, theta, key_r, key_theta, theta_maks=360.0):
+    if st.toggle("🖐️ Seret langsung di diagram", key=f"{jenis}_interaktif_aktif"):
+        from komponen_interaktif import lingkaran_interaktif
+        lingkaran_interaktif(jenis, r, theta, key_r, key_theta, theta_maks)
+    else:
+        tampilkan_diagram(nama, r, theta, theta_maks=theta_maks)
+
+
+# Animasi sapuan θ 0° → 360° untuk r saat ini (lihat animasi), dibuat sekali
+# per r lalu diambil dari cache render
+def tampilkan_animasi(jenis, r):
+    if st.toggle("🎞️ Animasi θ 0° → 360°", key=f"{jenis}_animasi"):
+        import animasi
+        with st.spinner("Menyiapkan animasi..."):
+            gambar = animasi.render_animasi(jenis, r, profil_sesi(), LEBAR_KOLOM)
+        sesi.catat_media(f"animasi_{jenis}", gambar)
+        st.image(gambar, width="stretch")
+
+
+# Kalkulator kebalikan: cari θ dari besaran yang diketahui (panjang busur,
+# luas juring, ...) untuk r slide saat ini. hitung(nilai) mengembalikan dict
+# isian blok templat 'hasil_kebalikan' dengan kunci 'theta' (NaN jika besaran
+# melebihi batas untuk r ini). Tombol memindahkan θ ke number_input key_theta.
+def tampilkan_cari_sudut(jenis, label, satuan, r, nilai_awal, key_theta, hitung, theta_maks=360.0):
+    with st.expander(f"🔄 Cari θ dari {label}"):
+        nilai = st.number_input(f"Masukkan {label}:", min_value=0.0, value=nilai_awal, step=0.1,
+                                key=f"{jenis}_kebalikan")
+        if r <= 0 or nilai <= 0:
+            return
+        with diagnostik.fase('rumus', f'{jenis}_kebalikan'):
+            isian = hitung(nilai)
+        theta = float(isian['theta'])
+        if math.isnan(theta):
+            st.error(f"⚠️ {label[0].upper()}{label[1:]} {nilai} {satuan} terlalu besar untuk r = {r}!")
+            return
+        templat.tampilkan(jenis, 'hasil_kebalikan', r=r, nilai=nilai, **isian)
+        st.button("↩️ Pakai θ ini di kalkulator", key=f"{jenis}_kebalikan_pakai", on_click=_pakai_sudut,
+                  args=(key_theta, min(round(theta, 4), theta_maks)))
+
+
+def _pakai_sudut(key_theta, theta):
+    st.session_state[key_theta] = theta
+
+
+def hitung_terukur(df):
+    # Hanya perhitungan kolom yang dicatat sebagai 'rumus'; baca/tulis CSV tidak
+    import batch
+
+    with diagnostik.fase('rumus', 'massal'):
+        return batch.hitung_batch(df)
+
+
+# Mode massal: hitung semua komponen untuk banyak baris (r, θ) / (r, a) dari CSV.
+# CSV hasil juga disimpan di cache disk bersama (lihat disk_cache) dengan kunci
+# hash data masukan, jadi worker lain tidak menghitung ulang lembar yang sama.
+@st.cache_data(max_entries=8, show_spinner=False)
+def hitung_massal(data):
+    import hashlib
+    import io
+
+    import pandas as pd
+
+    import batch
+    import disk_cache
+    kunci = ('massal', hashlib.sha256(data).hexdigest(), disk_cache.versi_file('batch.py', 'geometri.py'))
+    csv_hasil = disk_cache.ambil_atau_buat(
+        kunci, lambda: batch.ke_csv(hitung_terukur(batch.baca_csv(data))))
+    # Pratinjau dibaca dari CSV agar sama persis untuk hasil baru maupun dari disk
+    return pd.read_csv(io.BytesIO(csv_hasil), nrows=20), csv_hasil, csv_hasil.count(b'\n') - 1
+
+
+def tampilkan_mode_massal(key):
+    with st.expander("📂 Mode Massal (unggah / tempel CSV)"):
+        st.caption("Kolom yang dikenali: r (atau d) dan theta (atau a). Contoh header: r,theta")
+        upload = st.file_uploader("Unggah lembar kerja CSV:", type=["csv", "txt"], key=f"{key}_csv")
+        teks = st.text_area("Atau tempel isi CSV di sini:", height=120, key=f"{key}_csv_teks")
+        data = upload.getvalue() if upload is not None else teks.strip().encode()
+        # Data massal disimpan sebagai artefak sesi agar tetap ada saat kembali
+        # ke slide ini; artefak lama dibuang jika anggaran memori sesi terlampaui
+        kunci = f"massal_{key}"
+        if data:
+            sesi.simpan_artefak(kunci, data)
+        else:
+            data = sesi.ambil_artefak(kunci)
+            if data is None:
+                return
+            st.caption(f"Memakai data massal sebelumnya di sesi ini ({len(data) / 1024:.0f} KB).")
+            if st.button("🗑️ Hapus data massal", key=f"{key}_csv_hapus"):
+                sesi.hapus_artefak(kunci)
+                st.rerun()
+        import batch
+        try:
+            preview, csv_hasil, jumlah = hitung_massal(data)
+        except batch.BatchError as e:
+            st.error(f"⚠️ {e}")
+            return
+        st.success(f"✅ {jumlah} baris berhasil dihitung. Pratinjau {len(preview)} baris pertama:")
+        st.dataframe(preview, width="stretch")
+        sesi.catat_media(f"unduhan_{key}", csv_hasil)
+        st.download_button("⬇️ Unduh Hasil Lengkap (CSV)", csv_hasil, file_name="hasil_lingkaran.csv",
+                           mime="text/csv", key=f"{key}_csv_unduh")
@@ -0,0 +1,142 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# Pemeriksaan cold start aplikasi. Slide menu dijalankan di proses Python baru
+# dengan `-X importtime`, lalu dilaporkan: waktu, rincian waktu import per
+# modul, dan modul berat yang tidak seharusnya dimuat oleh slide menu. Dua
+# jalur diperiksa:
+# - bare:   skrip dijalankan langsung (mode bare Streamlit, tanpa runtime);
+#           waktu = total waktu proses.
+# - server: run pertama skrip lewat streamlit.testing (AppTest), dengan
+#           runtime aktif seperti di bawah `streamlit run`, jadi bagian yang
+#           hanya jalan di server (mis. import pemanasan) ikut terukur;
+#           waktu = durasi run pertama, modul = yang diimport selama run itu.
+#           Thread pemanasan sendiri dimatikan agar import di latar belakang
+#           tidak tercampur dengan import run pertama.
+# Keluar dengan kode 1 jika waktu melebihi anggaran atau ada modul terlarang
+# yang ikut diimport, sehingga bisa dipakai sebagai gate di CI/deploy.
+#
+# Contoh:
+#   python startup_check.py --budget-ms 2000 --runs 5
+#   python startup_check.py --jalur server --budget-run-ms 800
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lingkaran_app.py')
+BUDGET_DEFAULT_MS = float(os.environ.get('LINGKARAN_COLD_START_BUDGET_MS', 3000))
+BUDGET_RUN_DEFAULT_MS = float(os.environ.get('LINGKARAN_FIRST_RUN_BUDGET_MS', 1500))
+TERLARANG_DEFAULT = ('matplotlib', 'numpy', 'pandas', 'pyarrow')
+
+_BARIS = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+PENANDA = '--- run pertama ---'
+
+# Dijalankan di proses baru untuk jalur server; argv[1] = path aplikasi
+DRIVER_SERVER = f'''
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+sebelum = set(sys.modules)
+print({PENANDA!r}, file=sys.stderr, flush=True)
+mulai = time.perf_counter()
+at.run()
+durasi = (time.perf_counter() - mulai) * 1000
+if at.exception:
+    sys.exit(at.exception[0].value)
+print('RUN_MS', durasi)
+print('BARU', *sorted(set(sys.modules) - sebelum))
+'''
+
+
+def parse_importtime(stderr):
+    # Hasil: list (nama, self_us, kumulatif_us, kedalaman)
+    modul = []
+    for baris in stderr.splitlines():
+        m = _BARIS.match(baris)
+        if m:
+            modul.append((m.group(4), int(m.group(1)), int(m.group(2)), (len(m.group(3)) - 1) // 2))
+    return modul
+
+
+def jalankan_sekali(app=APP, jalur='bare'):
+    # Hasil: (waktu ms, list modul dari parse_importtime, set nama modul dimuat)
+    env = dict(os.environ, PYTHONWARNINGS='ignore')
+    perintah = [sys.executable, '-X', 'importtime', app]
+    if jalur == 'server':
+        env['LINGKARAN_PEMANASAN'] = '0'
+        perintah = [sys.executable, '-X', 'importtime', '-c', DRIVER_SERVER, app]
+    mulai = time.perf_counter()
+    proses = subprocess.run(perintah, cwd=os.path.dirname(app), env=env,
+                            capture_output=True, text=True)
+    durasi_ms = (time.perf_counter() - mulai) * 1000
+    if proses.returncode != 0:
+        raise RuntimeError(f'Aplikasi gagal dijalankan:\n{proses.stderr[-2000:]}')
+    if jalur == 'bare':
+        modul = parse_importtime(proses.stderr)
+        return durasi_ms, modul, {nama for nama, _, _, _ in modul}
+    keluaran = dict(baris.split(' ', 1) for baris in proses.stdout.splitlines() if ' ' in baris)
+    modul = parse_importtime(proses.stderr.split(PENANDA, 1)[-1])
+    return float(keluaran['RUN_MS']), modul, set(keluaran.get('BARU', '').split())
+
+
+def laporan(runs=3, top=15, app=APP, jalur='bare'):
+    hasil = [jalankan_sekali(app, jalur) for _ in range(runs)]
+    durasi = [d for d, _, _ in hasil]
+    # Rincian import diambil dari run dengan waktu median
+    _, modul, dimuat = sorted(hasil, key=lambda h: h[0])[len(hasil) // 2]
+    return {
+        'wall_ms': statistics.median(durasi),
+        'wall_ms_semua': durasi,
+        'import_ms': sum(s for _, s, _, _ in modul) / 1000,
+        'modul': modul,
+        'dimuat': dimuat,
+        'top': sorted((m for m in modul if m[3] == 0), key=lambda m: -m[2])[:top],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ukur cold start lingkaran_app (slide menu).')
+    parser.add_argument('--jalur', nargs='+', default=['bare', 'server'], choices=['bare', 'server'],
+                        help='Jalur yang diperiksa (default keduanya)')
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_DEFAULT_MS,
+                        help='Batas waktu cold start jalur bare (default: env LINGKARAN_COLD_START_BUDGET_MS '
+                             f'atau {BUDGET_DEFAULT_MS:.0f})')
+    parser.add_argument('--budget-run-ms', type=float, default=BUDGET_RUN_DEFAULT_MS,
+                        help='Batas waktu run pertama jalur server (default: env '
+                             f'LINGKARAN_FIRST_RUN_BUDGET_MS atau {BUDGET_RUN_DEFAULT_MS:.0f})')
+    parser.add_argument('--runs', type=int, default=3, help='Jumlah pengulangan (median dipakai)')
+    parser.add_argument('--top', type=int, default=15, help='Jumlah modul teratas yang ditampilkan')
+    parser.add_argument('--forbid', nargs='*', default=list(TERLARANG_DEFAULT),
+                        help='Modul yang tidak boleh diimport oleh slide menu')
+    args = parser.parse_args(argv)
+
+    gagal = []
+    for jalur in args.jalur:
+        hasil = laporan(args.runs, args.top, jalur=jalur)
+        judul, budget = (('Cold start', args.budget_ms) if jalur == 'bare'
+                         else ('Run pertama di server', args.budget_run_ms))
+        print(f"[{jalur}] {judul} (median {args.runs} run): {hasil['wall_ms']:.0f} ms "
+              f"[{', '.join(f'{d:.0f}' for d in hasil['wall_ms_semua'])}]")
+        print(f"Total waktu import: {hasil['import_ms']:.0f} ms\n")
+        print(f"{'kumulatif (ms)':>15} {'self (ms)':>10}  modul")
+        for nama, self_us, kum_us, _ in hasil['top']:
+            print(f'{kum_us / 1000:15.1f} {self_us / 1000:10.1f}  {nama}')
+        print()
+
+        terlarang = sorted(m for m in args.forbid if m in hasil['dimuat'])
+        if terlarang:
+            gagal.append(f"[{jalur}] modul berat dimuat di slide menu: {', '.join(terlarang)}")
+        if hasil['wall_ms'] > budget:
+            gagal.append(f"[{jalur}] {judul.lower()} {hasil['wall_ms']:.0f} ms > anggaran {budget:.0f} ms")
+    if gagal:
+        for g in gagal:
+            print(f'GAGAL: {g}')
+        return 1
+    print(f"OK: {', '.join(args.jalur)} dalam anggaran")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+import math
+from html import escape
+
+# Renderer alternatif yang membangun diagram langsung sebagai string SVG dari
+# geometrinya, tanpa matplotlib. Tata letak, warna, ketebalan garis, dan label
+# meniru fungsi draw_* di diagram.py (figure 100 dpi, satuan pt -> px).
+
+PX_PER_INCH = 100
+PT = PX_PER_INCH / 72
+
+# Warna singkatan matplotlib yang dipakai di diagram.py
+WARNA = {
+    'r': '#FF0000', 'g': '#008000', 'b': '#0000FF', 'k': '#000000',
+    'red': '#FF0000', 'green': '#008000', 'orange': '#FFA500',
+    'purple': '#800080', 'darkgreen': '#006400', 'darkorange': '#FF8C00',
+}
+
+# Diagram SVG yang tersedia, dengan nama yang sama seperti fungsi di diagram.py
+SVG_DIAGRAMS = {}
+
+
+def _svg(nama):
+    def daftar(fn):
+        SVG_DIAGRAMS[nama] = fn
+        return fn
+    return daftar
+
+
+def _warna(c):
+    return WARNA.get(c, c)
+
+
+def _angka(v):
+    # Koordinat dibulatkan agar string SVG tetap ringkas
+    return f'{v:.1f}'.rstrip('0').rstrip('.')
+
+
+def _ticks(lo, hi):
+    # Versi sederhana AutoLocator matplotlib: langkah 1/2/2.5/5 × 10^k
+    span = hi - lo
+    if span <= 0:
+        return [], 1
+    raw = span / 10
+    base = 10 ** math.floor(math.log10(raw))
+    step = next(m * base for m in (1, 2, 2.5, 5, 10) if m * base >= raw)
+    first = math.ceil(lo / step - 1e-9)
+    ticks = []
+    i = first
+    while i * step <= hi + 1e-9:
+        ticks.append(i * step)
+        i += 1
+    return ticks, step
+
+
+def _label_tick(v, step):
+    if abs(v) < 1e-12:
+        v = 0.0
+    if float(step).is_integer():
+        s = str(int(round(v)))
+    else:
+        desimal = max(0, -math.floor(math.log10(step)))
+        if not round(step * 10 ** desimal, 9).is_integer():
+            desimal += 1
+        s = f'{v:.{desimal}f}'
+    return s.replace('-', '−')
+
+
+class _Kanvas:
+    def __init__(self, figsize, lim):
+        # Area plot persegi (aspect='equal') seperti hasil subplots matplotlib
+        self.sisi = min(figsize[0] * 0.775, figsize[1] * 0.77) * PX_PER_INCH
+        self.kiri, self.atas = 45, 40
+        self.lim = lim
+        self.isi = []
+        self.legenda = []
+        self.judul = ''
+
+    def x(self, v):
+        lo, hi = self.lim
+        return self.kiri + (v - lo) / (hi - lo) * self.sisi
+
+    def y(self, v):
+        lo, hi = self.lim
+        return self.atas + (hi - v) / (hi - lo) * self.sisi
+
+    def skala(self, v):
+        return v / (self.lim[1] - self.lim[0]) * self.sisi
+
+    def _titik(self, r, deg):
+        t = math.radians(deg)
+        return self.x(r * math.cos(t)), self.y(r * math.sin(t))
+
+    def _gaya(self, stroke=None, lw=None, fill='none', alpha=None, dash=False):
+        attrs = [f'fill="{_warna(fill)}"']
+        if stroke:
+            attrs.append(f'stroke="{_warna(stroke)}" stroke-width="{_angka(lw * PT)}"')
+            if dash:
+                attrs.append(f'stroke-dasharray="{_angka(3.7 * lw * PT)},{_angka(1.6 * lw * PT)}"')
+        if alpha is not None:
+            attrs.append(f'opacity="{alpha}"')
+        return ' '.join(attrs)
+
+    def circle(self, r, **gaya):
+        self.isi.append(f'<circle cx="{_angka(self.x(0))}" cy="{_angka(self.y(0))}" '
+                        f'r="{_angka(self.skala(r))}" {self._gaya(**gaya)}/>')
+
+    def _busur_path(self, r, t1, t2):
+        rr = _angka(self.skala(r))
+        if t2 - t1 >= 360:
+            # Busur penuh dipecah dua karena SVG tidak bisa menggambar busur
+            # dengan titik awal = titik akhir
+            x1, y1 = self._titik(r, t1)
+            x2, y2 = self._titik(r, t1 + 180)
+            return (f'M{_angka(x1)},{_angka(y1)}A{rr},{rr} 0 1 0 {_angka(x2)},{_angka(y2)}'
+                    f'A{rr},{rr} 0 1 0 {_angka(x1)},{_angka(y1)}')
+        x1, y1 = self._titik(r, t1)
+        x2, y2 = self._titik(r, t2)
+        besar = 1 if t2 - t1 > 180 else 0
+        return f'M{_angka(x1)},{_angka(y1)}A{rr},{rr} 0 {besar} 0 {_angka(x2)},{_angka(y2)}'
+
+    def arc(self, r, t1, t2, color, lw):
+        self.isi.append(f'<path d="{self._busur_path(r, t1, t2)}" {self._gaya(color, lw)}/>')
+
+    def wedge(self, r, t1, t2, **gaya):
+        if t2 - t1 >= 360:
+            self.circle(r, **gaya)
+            return
+        cx, cy = _angka(self.x(0)), _angka(self.y(0))
+        busur = self._busur_path(r, t1, t2)[1:]
+        self.isi.append(f'<path d="M{cx},{cy}L{busur}Z" {self._gaya(**gaya)}/>')
+
+    def segment(self, r, t1, t2, **gaya):
+        # Tembereng: busur yang ditutup oleh tali busur (Z)
+        if t2 - t1 >= 360:
+            self.circle(r, **gaya)
+            return
+        self.isi.append(f'<path d="{self._busur_path(r, t1, t2)}Z" {self._gaya(**gaya)}/>')
+
+    def line(self, xs, ys, color, lw, label=None):
+        titik = ' '.join(f'{_angka(self.x(a))},{_angka(self.y(b))}' for a, b in zip(xs, ys))
+        self.isi.append(f'<polyline points="{titik}" {self._gaya(color, lw)}/>')
+        if label:
+            self.legenda.append((color, lw, label))
+
+    def marker(self, x, y, color, size):
+        self.isi.append(f'<circle cx="{_angka(self.x(x))}" cy="{_angka(self.y(y))}" '
+                        f'r="{_angka(size * PT / 2)}" fill="{_warna(color)}"/>')
+
+    def arrow(self, start, end, color, lw):
+        # Panah terbuka '->' seperti annotate(arrowprops=dict(arrowstyle='->'))
+        x0, y0 = self.x(start[0]), self.y(start[1])
+        x1, y1 = self.x(end[0]), self.y(end[1])
+        sudut = math.atan2(y1 - y0, x1 - x0)
+        panjang = 0.4 * 10 * PT
+        kepala = []
+        for d in (math.radians(150), -math.radians(150)):
+            kepala.append((x1 + panjang * math.cos(sudut + d), y1 + panjang * math.sin(sudut + d)))
+        gaya = self._gaya(color, lw)
+        self.isi.append(f'<path d="M{_angka(x0)},{_angka(y0)}L{_angka(x1)},{_angka(y1)}'
+                        f'M{_angka(kepala[0][0])},{_angka(kepala[0][1])}L{_angka(x1)},{_angka(y1)}'
+                        f'L{_angka(kepala[1][0])},{_angka(kepala[1][1])}" {gaya}/>')
+
+    def text(self, x, y, s, size, color, ha='left'):
+        anchor = {'left': 'start', 'center': 'middle', 'right': 'end'}[ha]
+        self.isi.append(f'<text x="{_angka(self.x(x))}" y="{_angka(self.y(y))}" '
+                        f'font-size="{_angka(size * PT)}" font-weight="bold" '
+                        f'fill="{_warna(color)}" text-anchor="{anchor}">{escape(s)}</text>')
+
+    def _sumbu(self):
+        kiri, atas, sisi = self.kiri, self.atas, self.sisi
+        ticks, step = _ticks(*self.lim)
+        grid, label = [], []
+        for t in ticks:
+            px, py = _angka(self.x(t)), _angka(self.y(t))
+            grid.append(f'M{px},{_angka(atas)}V{_angka(atas + sisi)}'
+                        f'M{_angka(kiri)},{py}H{_angka(kiri + sisi)}')
+            teks = _label_tick(t, step)
+            label.append(f'<text x="{px}" y="{_angka(atas + sisi + 17)}" text-anchor="middle">{teks}</text>')
+            label.append(f'<text x="{_angka(kiri - 6)}" y="{_angka(self.y(t) + 4)}" text-anchor="end">{teks}</text>')
+        return (f'<path d="{"".join(grid)}" stroke="#b0b0b0" stroke-width="{_angka(0.8 * PT)}" '
+                f'opacity="0.3" fill="none"/>',
+                f'<g font-size="{_angka(10 * PT)}" fill="#000000">{"".join(label)}</g>')
+
+    def _legenda(self):
+        if not self.legenda:
+            return ''
+        tinggi_baris = 10 * PT * 1.4
+        lebar = 24 + max(len(label) for _, _, label in self.legenda) * 10 * PT * 0.55 + 28
+        x = self.kiri + self.sisi - lebar - 6
+        y = self.atas + 6
+        bagian = [f'<rect x="{_angka(x)}" y="{_angka(y)}" width="{_angka(lebar)}" '
+                  f'height="{_angka(tinggi_baris * len(self.legenda) + 8)}" rx="3" '
+                  f'fill="#ffffff" fill-opacity="0.8" stroke="#cccccc"/>']
+        for i, (color, lw, label) in enumerate(self.legenda):
+            by = y + 4 + tinggi_baris * (i + 0.5)
+            bagian.append(f'<path d="M{_angka(x + 6)},{_angka(by)}h24" {self._gaya(color, lw)}/>')
+            bagian.append(f'<text x="{_angka(x + 36)}" y="{_angka(by + 4)}" '
+                          f'font-size="{_angka(10 * PT)}">{escape(label)}</text>')
+        return ''.join(bagian)
+
+    def to_svg(self):
+        lebar = self.kiri + self.sisi + 15
+        tinggi = self.atas + self.sisi + 30
+        grid, label = self._sumbu()
+        clip = (f'<clipPath id="area"><rect x="{_angka(self.kiri)}" y="{_angka(self.atas)}" '
+                f'width="{_angka(self.sisi)}" height="{_angka(self.sisi)}"/></clipPath>')
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {_angka(lebar)} {_angka(tinggi)}" '
+                f'font-family="DejaVu Sans, sans-serif">'
+                f'<defs>{clip}</defs>'
+                f'<rect width="100%" height="100%" fill="#ffffff"/>'
+                f'{grid}<g clip-path="url(#area)">{"".join(self.isi)}</g>'
+                f'<rect x="{_angka(self.kiri)}" y="{_angka(self.atas)}" width="{_angka(self.sisi)}" '
+                f'height="{_angka(self.sisi)}" fill="none" stroke="#000000" stroke-width="{_angka(0.8 * PT)}"/>'
+                f'{label}{self._legenda()}'
+                f'<text x="{_angka(self.kiri + self.sisi / 2)}" y="{_angka(self.atas - 12)}" '
+                f'font-size="{_angka(14 * PT)}" font-weight="bold" text-anchor="middle">{escape(self.judul)}</text>'
+                f'</svg>')
+
+
+@_svg('draw_circle_with_radius')
+def svg_circle_with_radius(r):
+    k = _Kanvas((6, 6), (-r - 1, r + 1))
+    k.circle(r, stroke='#1976D2', lw=3)
+    k.line([0, r], [0, 0], 'r', 3, label=f'Jari-jari (r) = {r}')
+    k.marker(0, 0, 'r', 8)
+    k.text(r / 2, 0.3, f'r = {r}', 12, 'red')
+    k.judul = 'Jari-Jari Lingkaran'
+    return k.to_svg()
+
+
+@_svg('draw_circle_with_diameter')
+def svg_circle_with_diameter(d):
+    r = d / 2
+    k = _Kanvas((6, 6), (-r - 1, r + 1))
+    k.circle(r, stroke='#1976D2', lw=3)
+    k.line([-r, r], [0, 0], 'g', 3, label=f'Diameter (d) = {d}')
+    k.marker(0, 0, 'r', 8)
+    k.text(0, 0.5, f'd = {d}', 12, 'green', ha='center')
+    k.judul = 'Diameter Lingkaran'
+    return k.to_svg()
+
+
+@_svg('draw_circle_area')
+def svg_circle_area(r):
+    k = _Kanvas((6, 6), (-r - 1, r + 1))
+    k.circle(r, fill='#4CAF50', alpha=0.3)
+    k.circle(r, stroke='#1976D2', lw=3)
+    k.line([0, r], [0, 0], 'r', 2, label=f'r = {r}')
+    k.marker(0, 0, 'r', 8)
+    k.text(0, 0, f'Luas = π × {r}²', 12, 'darkgreen', ha='center')
+    k.judul = 'Luas Lingkaran'
+    return k.to_svg()
+
+
+@_svg('draw_circle_circumference')
+def svg_circle_circumference(r):
+    k = _Kanvas((6, 6), (-r - 1.5, r + 1.5))
+    k.circle(r, stroke='#FF9800', lw=4)
+    k.marker(0, 0, 'r', 8)
+    k.circle(r, stroke='orange', lw=4)
+    k.legenda.append(('orange', 4, f'Keliling = 2π × {r}'))
+    k.text(0, -r - 0.5, f'Keliling = 2 × π × {r}', 11, 'darkorange', ha='center')
+    k.judul = 'Keliling Lingkaran'
+    return k.to_svg()
+
+
+@_svg('draw_juring')
+def svg_juring(r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    k = _Kanvas((7, 7), (-r - 1, r + 1))
+    k.wedge(r, 0, theta_deg, fill='#FF7043', stroke='#D84315', lw=3, alpha=0.4)
+    k.circle(r, stroke='#1976D2', lw=2, dash=True)
+    k.line([0, r], [0, 0], 'b', 2.5)
+    k.line([0, r * math.cos(theta_rad)], [0, r * math.sin(theta_rad)], 'b', 2.5)
+    k.arc(r, 0, theta_deg, 'red', 3)
+    k.text(r * 0.3 * math.cos(theta_rad / 2), r * 0.3 * math.sin(theta_rad / 2),
+           f'θ = {theta_deg}°', 11, 'purple', ha='center')
+    k.marker(0, 0, 'k', 8)
+    k.judul = f'Juring Lingkaran (θ = {theta_deg}°)'
+    return k.to_svg()
+
+
+@_svg('draw_tembereng')
+def svg_tembereng(r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    k = _Kanvas((7, 7), (-r - 1, r + 1))
+    k.circle(r, stroke='#1976D2', lw=2)
+    k.segment(r, 0, theta_deg, fill='#AB47BC', stroke='#7B1FA2', lw=2, alpha=0.4)
+    k.arc(r, 0, theta_deg, 'red', 3)
+    k.line([r, r * math.cos(theta_rad)], [0, r * math.sin(theta_rad)], 'g', 2.5, label='Tali Busur')
+    k.text(r * 0.5 * math.cos(theta_rad / 2), r * 0.5 * math.sin(theta_rad / 2),
+           f'θ = {theta_deg}°', 11, 'purple', ha='center')
+    k.marker(0, 0, 'k', 8)
+    k.judul = f'Tembereng Lingkaran (θ = {theta_deg}°)'
+    return k.to_svg()
+
+
+@_svg('draw_busur')
+def svg_busur(r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    k = _Kanvas((7, 7), (-r - 1, r + 1))
+    k.circle(r, stroke='#1976D2', lw=2)
+    k.arc(r, 0, theta_deg, '#FF5722', 5)
+    k.line([0, r], [0, 0], 'b', 2)
+    k.line([0, r * math.cos(theta_rad)], [0, r * math.sin(theta_rad)], 'b', 2)
+    mid_angle = theta_rad / 2
+    k.arrow((r * 0.8 * math.cos(mid_angle - 0.1), r * 0.8 * math.sin(mid_angle - 0.1)),
+            (r * 0.8 * math.cos(mid_angle + 0.1), r * 0.8 * math.sin(mid_angle + 0.1)), 'red', 2)
+    k.text(r * 0.5 * math.cos(mid_angle), r * 0.5 * math.sin(mid_angle) + 0.5, 'Busur', 12, 'red', ha='center')
+    k.text(r * 0.3 * math.cos(mid_angle), r * 0.3 * math.sin(mid_angle),
+           f'θ = {theta_deg}°', 11, 'purple', ha='center')
+    k.marker(0, 0, 'k', 8)
+    k.judul = f'Busur Lingkaran (θ = {theta_deg}°)'
+    return k.to_svg()
+
+
+@_svg('draw_tali_busur')
+def svg_tali_busur(r, theta_deg):
+    theta_rad = math.radians(theta_deg)
+    k = _Kanvas((7, 7), (-r - 1, r + 1))
+    k.circle(r, stroke='#1976D2', lw=2)
+    k.arc(r, 0, theta_deg, 'orange', 2)
+    x1, y1 = r, 0
+    x2, y2 = r * math.cos(theta_rad), r * math.sin(theta_rad)
+    k.line([x1, x2], [y1, y2], 'g', 4, label='Tali Busur')
+    k.marker(x1, y1, 'g', 10)
+    k.marker(x2, y2, 'g', 10)
+    k.text(r * 0.3 * math.cos(theta_rad / 2), r * 0.3 * math.sin(theta_rad / 2),
+           f'θ = {theta_deg}°', 11, 'purple', ha='center')
+    k.text((x1 + x2) / 2, (y1 + y2) / 2 + 0.5, 'Tali Busur', 11, 'green', ha='center')
+    k.marker(0, 0, 'k', 8)
+    k.judul = f'Tali Busur Lingkaran (θ = {theta_deg}°)'
+    return k.to_svg()
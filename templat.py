@@ -0,0 +1,59 @@
+import os
+import re
+import string
+from functools import lru_cache
+
+import streamlit as st
+
+# Template HTML untuk kotak rumus, penjelasan, dan hasil di setiap slide.
+# Satu file per halaman di templates/<halaman>.html, berisi beberapa blok yang
+# diawali baris `<!-- blok: nama -->`. Saat pertama dipakai, setiap blok
+# diminifikasi (indentasi dan baris kosong dibuang) lalu diurai sekali menjadi
+# potongan literal + field format, sehingga setiap rerun hanya mengisi angka
+# yang berubah. Field memakai sintaks str.format, mis. {luas:.2f}.
+
+DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+CSS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'lingkaran.css')
+
+_BLOK = re.compile(r'^<!-- blok: (\w+) -->\s*$', re.M)
+_FORMATTER = string.Formatter()
+
+
+def minifikasi(html):
+    return '\n'.join(baris.strip() for baris in html.splitlines() if baris.strip())
+
+
+def kompilasi(html):
+    # Hasil: tuple (literal, field, format_spec); field None untuk potongan
+    # terakhir. Blok tanpa field langsung disimpan sebagai string.
+    potongan = tuple((literal, field, spec or '')
+                     for literal, field, spec, _ in _FORMATTER.parse(html))
+    if all(field is None for _, field, _ in potongan):
+        return html
+    return potongan
+
+
+@lru_cache(maxsize=None)
+def muat(halaman):
+    with open(os.path.join(DIR, f'{halaman}.html'), encoding='utf-8') as f:
+        bagian = _BLOK.split(f.read())
+    # bagian = [sebelum blok pertama, nama1, isi1, nama2, isi2, ...]
+    return {nama: kompilasi(minifikasi(isi)) for nama, isi in zip(bagian[1::2], bagian[2::2])}
+
+
+def isi(halaman, blok, **nilai):
+    tmpl = muat(halaman)[blok]
+    if isinstance(tmpl, str):
+        return tmpl
+    return ''.join(literal if field is None else literal + format(nilai[field], spec)
+                   for literal, field, spec in tmpl)
+
+
+@lru_cache(maxsize=None)
+def css():
+    with open(CSS, encoding='utf-8') as f:
+        return f.read()
+
+
+def tampilkan(halaman, blok, **nilai):
+    st.markdown(isi(halaman, blok, **nilai), unsafe_allow_html=True)
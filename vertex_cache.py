@@ -0,0 +1,57 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Tabel titik lingkaran satuan yang dihitung sekali lalu dipakai ulang oleh
+# semua render. Lingkaran berjari-jari r cukup didapat dengan satu
+# perkalian vektor (tabel × r), tanpa cos/sin per render. Busur dan tembereng
+# memakai Path Bézier dari matplotlib (patch Arc, Path.arc) yang tepat
+# mengikuti lingkaran tanpa perlu banyak titik.
+
+# Resolusi yang tersedia (jumlah segmen untuk satu lingkaran penuh)
+RESOLUSI = (32, 64, 128, 256, 512)
+
+# Toleransi penyimpangan poligon terhadap lingkaran sebenarnya, dalam piksel
+TOLERANSI_PX = 0.25
+
+
+@lru_cache(maxsize=None)
+def unit_circle(n):
+    # Array (n + 1, 2) titik lingkaran satuan, titik terakhir = titik pertama
+    t = np.linspace(0, 2 * np.pi, n + 1)
+    tabel = np.column_stack([np.cos(t), np.sin(t)])
+    tabel[-1] = tabel[0]
+    tabel.setflags(write=False)
+    return tabel
+
+
+def jumlah_titik(r_px):
+    # Resolusi terkecil yang sagitanya (jarak tali busur ke lingkaran) di bawah
+    # toleransi: r × (1 - cos(π/n)) ≈ r × π² / (2n²)
+    for n in RESOLUSI:
+        if r_px * (1 - math.cos(math.pi / n)) <= TOLERANSI_PX:
+            return n
+    return RESOLUSI[-1]
+
+
+def jari_jari_px(ax, r, rentang):
+    # Perkiraan jari-jari dalam piksel saat dirender: lebar Axes (px) × r / rentang
+    # sumbu. fig.dpi sudah disamakan dengan dpi output oleh render_pool.
+    fig = ax.figure
+    lebar_px = ax.get_position().width * fig.get_figwidth() * fig.dpi
+    return lebar_px * r / rentang
+
+
+def lingkaran(r, n):
+    return unit_circle(n) * r
+
+
+def path_tembereng(r, theta_deg):
+    # Tembereng sebenarnya: busur dari 0 sampai θ lalu ditutup oleh tali busur
+    from matplotlib.path import Path
+
+    arc = Path.arc(0, theta_deg)
+    vertices = np.vstack([arc.vertices, arc.vertices[:1]])
+    codes = np.append(arc.codes, Path.CLOSEPOLY)
+    return Path(vertices * r, codes)